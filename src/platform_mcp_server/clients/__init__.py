@@ -5,6 +5,13 @@
 # circular-import issues at module load time.
 from __future__ import annotations
 
+import asyncio
+import copy
+import functools
+import time
+from collections.abc import Callable, Coroutine
+from typing import Any, Concatenate
+
 from kubernetes import client as k8s_client
 
 # Note 2: `new_client_from_config` constructs a fully isolated ApiClient bound to a
@@ -13,6 +20,8 @@ from kubernetes import client as k8s_client
 # multiple coroutines load different contexts concurrently.
 from kubernetes.config import new_client_from_config
 
+from platform_mcp_server.config import ClusterConfig
+
 
 # Note 3: Defining this as a package-level factory function (rather than a module
 # global client) means each caller receives its own ApiClient instance.  This is
@@ -29,3 +38,99 @@ def load_k8s_api_client(context: str) -> k8s_client.ApiClient:
     # is selected even if the library's positional argument order changes in a
     # future version, and makes the call site self-documenting.
     return new_client_from_config(context=context)
+
+
+# Note 5: Client instances are cached per (client class, cluster config) for the lifetime of
+# Note 6: the process. Each wrapper lazily builds its SDK client on first use, and that SDK
+# Note 7: client owns the HTTP connection pool (urllib3 for Kubernetes, azure-core for ARM)
+# Note 8: and the credential's token cache. Reusing the wrapper across tool calls and across
+# Note 9: fan-out means sockets, TLS sessions, and tokens are reused instead of rebuilt on
+# Note 10: every request. The class is part of the key so that each API surface gets its own
+# Note 11: instance, and ClusterConfig is a frozen dataclass, so it is hashable and a reloaded
+# Note 12: cluster map with changed settings naturally produces fresh clients.
+_SHARED_CLIENTS: dict[tuple[Any, ClusterConfig], Any] = {}
+
+
+def shared_client[ClientT](client_cls: Callable[[ClusterConfig], ClientT], config: ClusterConfig) -> ClientT:
+    """Return the process-wide client instance for the given class and cluster.
+
+    The first call for a (class, config) pair constructs the client; later calls return
+    the same instance so its underlying connection pool and credentials are reused.
+    """
+    key = (client_cls, config)
+    client = _SHARED_CLIENTS.get(key)
+    if client is None:
+        client = client_cls(config)
+        _SHARED_CLIENTS[key] = client
+    return client
+
+
+# Default ttl_cached lifetime for Kubernetes LIST responses: long enough to absorb back-to-back
+# tool calls against one cluster, short enough that results stay current.
+LIST_CACHE_TTL_SECONDS = 5.0
+
+
+type _AsyncMethod[SelfT, **P, ResultT] = Callable[Concatenate[SelfT, P], Coroutine[Any, Any, ResultT]]
+
+
+# Note 13: LIST results are memoised for a few seconds per client instance and argument set.
+# Note 14: An assistant often calls several tools against the same cluster back to back, and
+# Note 15: those calls list the same pods, nodes and PDBs; with shared_client above, the cache
+# Note 16: is effectively per cluster. The cache stores the in-flight Task rather than the
+# Note 17: result, so concurrent callers for the same key share one API request (single-flight),
+# Note 18: and asyncio.shield keeps that request alive if one of the waiters is cancelled.
+def ttl_cached[SelfT, **P, ResultT](
+    ttl_seconds: float,
+    copy_result: Callable[[Any], Any] | None = None,
+) -> Callable[[_AsyncMethod[SelfT, P, ResultT]], _AsyncMethod[SelfT, P, ResultT]]:
+    """Cache an async client method's result per instance and arguments for ttl_seconds.
+
+    Failures are never cached. Callers receive ``copy_result`` of the cached result, by
+    default a shallow copy, so appending to or re-sorting a returned list does not affect
+    other callers. Pass ``copy.deepcopy`` for results whose nested values callers may edit.
+    """
+
+    def decorator(method: _AsyncMethod[SelfT, P, ResultT]) -> _AsyncMethod[SelfT, P, ResultT]:
+        cache_attr = f"_ttl_cache_{method.__name__}"
+        copier: Callable[[ResultT], ResultT] = copy_result or copy.copy
+
+        @functools.wraps(method)
+        async def wrapper(self: SelfT, /, *args: P.args, **kwargs: P.kwargs) -> ResultT:
+            cache: dict[Any, tuple[float, asyncio.Future[ResultT]]] = vars(self).setdefault(cache_attr, {})
+            key = (args, tuple(sorted(kwargs.items())))
+            entry = cache.get(key)
+            now = time.monotonic()
+            if entry is None or entry[0] <= now:
+                # Expired entries are swept whenever a request is cached, so a key that is never
+                # looked up again (a one-off namespace or field selector) does not pin its result
+                # for the life of the shared client. In-flight entries expire at +inf and stay.
+                for stale in [k for k, (expires_at, _) in cache.items() if expires_at <= now]:
+                    del cache[stale]
+                task: asyncio.Future[ResultT] = asyncio.ensure_future(method(self, *args, **kwargs))
+                # Note 19: The expiry clock starts when the request completes, not when it is
+                # Note 20: issued; until then the entry never expires so waiters keep sharing it.
+                cache[key] = (float("inf"), task)
+                task.add_done_callback(functools.partial(_settle_cache_entry, cache, key, ttl_seconds))
+            else:
+                task = entry[1]
+            return copier(await asyncio.shield(task))
+
+        return wrapper
+
+    return decorator
+
+
+def _settle_cache_entry(
+    cache: dict[Any, tuple[float, asyncio.Future[Any]]],
+    key: Any,
+    ttl_seconds: float,
+    task: asyncio.Future[Any],
+) -> None:
+    """Start the TTL of a completed request, or drop it if the request failed."""
+    entry = cache.get(key)
+    if entry is None or entry[1] is not task:
+        return
+    if task.cancelled() or task.exception() is not None:
+        del cache[key]
+    else:
+        cache[key] = (time.monotonic() + ttl_seconds, task)
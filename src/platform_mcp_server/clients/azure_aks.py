@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import copy
 import threading
 from datetime import UTC, datetime, timedelta
 from typing import Any
@@ -26,10 +27,18 @@ from azure.mgmt.containerservice import ContainerServiceClient
 # Note 11: surface from the container service plane -- hence a second client is required.
 from azure.mgmt.monitor import MonitorManagementClient
 
+from platform_mcp_server.clients import ttl_cached
 from platform_mcp_server.config import ClusterConfig
 
 log = structlog.get_logger()
 
+# Available upgrades only change when AKS rolls out a new release to the region, which
+# happens on the order of hours, so a few minutes of staleness is acceptable.
+_UPGRADE_PROFILE_TTL_SECONDS = 300.0
+# Completed upgrades reach the Activity Log at most a few times a day, so the 90-day
+# history is reused across polls instead of re-querying Azure Monitor each time.
+_ACTIVITY_LOG_TTL_SECONDS = 300.0
+
 
 class AzureAksClient:
     """Wrapper around Azure AKS management APIs."""
@@ -171,18 +180,23 @@ class AzureAksClient:
             "power_state": pool.power_state.code if pool.power_state else None,
         }
 
+    @ttl_cached(_UPGRADE_PROFILE_TTL_SECONDS, copy_result=copy.deepcopy)
     async def get_upgrade_profile(self) -> dict[str, Any]:
         """Get available upgrade versions for the cluster.
 
-        Returns dict with control plane and per-pool available upgrades.
+        Returns dict with control plane and per-pool available upgrades. Results are cached
+        on the client for a few minutes; callers receive a copy they are free to mutate.
         """
+        # Note 37: Client instances are shared across tool calls (see clients.shared_client), so
+        # Note 38: an instance-level cache spans repeated get_kubernetes_upgrade_status requests.
+        # Note 39: The ARM upgradeProfiles endpoint does not support ETag revalidation through
+        # Note 40: the SDK, so a plain TTL is used; a deep copy keeps the nested upgrade lists immutable.
         client = self._get_container_client()
         try:
-            # Note 37: get_upgrade_profile() is a dedicated ARM endpoint separate from the main
-            # Note 38: cluster GET. Azure computes available upgrades dynamically -- they depend
-            # Note 39: on the current version, regional rollout status, and Microsoft's support
-            # Note 40: policy -- so caching them inside the cluster object would go stale quickly.
-            # Note 41: Making a separate call ensures the LLM always sees current upgrade options.
+            # Note 41: get_upgrade_profile() is a dedicated ARM endpoint separate from the main
+            # Note 42: cluster GET. Azure computes available upgrades dynamically -- they depend
+            # Note 43: on the current version, regional rollout status, and Microsoft's support
+            # Note 44: policy -- so they are fetched separately rather than read from the cluster.
             profile = await asyncio.to_thread(
                 client.managed_clusters.get_upgrade_profile,
                 self._config.resource_group,
@@ -207,21 +221,24 @@ class AzureAksClient:
             if pool_profile.name:
                 pool_upgrades[str(pool_profile.name)] = versions
 
-        return {
+        result: dict[str, Any] = {
             "control_plane_version": (
                 profile.control_plane_profile.kubernetes_version if profile.control_plane_profile else None
             ),
             "control_plane_upgrades": control_plane_upgrades,
             "pool_upgrades": pool_upgrades,
         }
+        return result
 
+    @ttl_cached(_ACTIVITY_LOG_TTL_SECONDS)
     async def get_activity_log_upgrades(
         self,
         count: int = 5,
     ) -> list[dict[str, Any]]:
         """Get historical upgrade records from Azure Activity Log.
 
-        Queries the last 90 days of activity log for AKS upgrade operations.
+        Queries the last 90 days of activity log for AKS upgrade operations. Results are
+        cached per requested count for a few minutes; failures are not cached.
 
         Args:
             count: Maximum number of historical records to return.
@@ -238,12 +255,12 @@ class AzureAksClient:
         )
         now = datetime.now(tz=UTC)
         ninety_days_ago = now - timedelta(days=90)
-        # Note 42: The filter string uses OData query syntax, which is the query language for
-        # Note 43: Azure Resource Manager list operations. eventTimestamp fields must be in
-        # Note 44: ISO 8601 format (e.g. "2025-01-01T00:00:00+00:00"). The operationName filter
-        # Note 45: restricts results to cluster write operations, which is the ARM operation
-        # Note 46: emitted when AKS starts or completes an upgrade. Without this filter the
-        # Note 47: 90-day window could return thousands of unrelated log entries.
+        # Note 45: The filter string uses OData query syntax, which is the query language for
+        # Note 46: Azure Resource Manager list operations. eventTimestamp fields must be in
+        # Note 47: ISO 8601 format (e.g. "2025-01-01T00:00:00+00:00"). The operationName filter
+        # Note 48: restricts results to cluster write operations, which is the ARM operation
+        # Note 49: emitted when AKS starts or completes an upgrade. Without this filter the
+        # Note 50: 90-day window could return thousands of unrelated log entries.
         filter_str = (
             f"eventTimestamp ge '{ninety_days_ago.isoformat()}' "
             f"and eventTimestamp le '{now.isoformat()}' "
@@ -273,20 +290,20 @@ class AzureAksClient:
 
         records: list[dict[str, Any]] = []
         for entry in logs:
-            # Note 48: The Activity Log API returns a lazy iterator backed by paginated HTTP
-            # Note 49: calls. Checking len(records) >= count before processing each entry and
-            # Note 50: breaking early stops further page fetches once enough records have been
-            # Note 51: collected, avoiding unnecessary network round-trips for data that will
-            # Note 52: not be used. The Azure SDK does not support server-side $top on this API.
+            # Note 51: The Activity Log API returns a lazy iterator backed by paginated HTTP
+            # Note 52: calls. Checking len(records) >= count before processing each entry and
+            # Note 53: breaking early stops further page fetches once enough records have been
+            # Note 54: collected, avoiding unnecessary network round-trips for data that will
+            # Note 55: not be used. The Azure SDK does not support server-side $top on this API.
             if len(records) >= count:
                 break
             if entry.status and entry.status.value == "Succeeded":
                 duration_seconds = None
                 if entry.event_timestamp and entry.submission_timestamp:
-                    # Note 53: submission_timestamp is when ARM accepted and began processing the
-                    # Note 54: operation (i.e. when the upgrade started). event_timestamp is when
-                    # Note 55: the operation reached its terminal state (succeeded or failed).
-                    # Note 56: Subtracting the two gives the wall-clock duration of the upgrade.
+                    # Note 56: submission_timestamp is when ARM accepted and began processing the
+                    # Note 57: operation (i.e. when the upgrade started). event_timestamp is when
+                    # Note 58: the operation reached its terminal state (succeeded or failed).
+                    # Note 59: Subtracting the two gives the wall-clock duration of the upgrade.
                     delta = entry.event_timestamp - entry.submission_timestamp
                     duration_seconds = delta.total_seconds()
 
@@ -9,7 +9,7 @@ from typing import Any
 import structlog
 from kubernetes import client as k8s_client
 
-from platform_mcp_server.clients import load_k8s_api_client
+from platform_mcp_server.clients import LIST_CACHE_TTL_SECONDS, load_k8s_api_client, ttl_cached
 from platform_mcp_server.config import ClusterConfig
 
 log = structlog.get_logger()
@@ -55,15 +55,32 @@ class K8sCoreClient:
                 self._api = k8s_client.CoreV1Api(api_client)
             return self._api
 
-    async def get_nodes(self) -> list[dict[str, Any]]:
-        """List all nodes with pool grouping metadata.
+    @ttl_cached(LIST_CACHE_TTL_SECONDS)
+    async def get_nodes(
+        self,
+        label_selector: str | None = None,
+        field_selector: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """List nodes with pool grouping metadata.
+
+        Args:
+            label_selector: Kubernetes label selector string. None for all nodes.
+            field_selector: Kubernetes field selector string, e.g. "spec.unschedulable=true".
 
         Returns a list of dicts with keys: name, pool, version, unschedulable,
         allocatable_cpu, allocatable_memory, conditions, labels.
         """
         api = self._get_api()
         try:
-            node_list = await asyncio.to_thread(api.list_node)
+            # Note 22: Like field_selector on pods, a label selector such as "agentpool=userpool"
+            # Note 23: is applied by the API server, so only the matching nodes are serialised,
+            # Note 24: transferred, and deserialised into SDK models.
+            kwargs: dict[str, Any] = {}
+            if label_selector:
+                kwargs["label_selector"] = label_selector
+            if field_selector:
+                kwargs["field_selector"] = field_selector
+            node_list = await asyncio.to_thread(api.list_node, **kwargs)
         except Exception:
             log.error("failed_to_list_nodes", cluster=self._cluster_config.cluster_id)
             raise
@@ -71,9 +88,9 @@ class K8sCoreClient:
         results: list[dict[str, Any]] = []
         for node in node_list.items:
             labels = node.metadata.labels or {}
-            # Note 22: The `or` short-circuit tries PRIMARY_POOL_LABEL first; if it returns None
-            # Note 23: (key absent), it falls through to FALLBACK_POOL_LABEL. This is more concise
-            # Note 24: than an explicit if/elif block and communicates the priority order clearly.
+            # Note 25: The `or` short-circuit tries PRIMARY_POOL_LABEL first; if it returns None
+            # Note 26: (key absent), it falls through to FALLBACK_POOL_LABEL. This is more concise
+            # Note 27: than an explicit if/elif block and communicates the priority order clearly.
             pool = labels.get(PRIMARY_POOL_LABEL) or labels.get(FALLBACK_POOL_LABEL)
             if pool is None:
                 log.warning(
@@ -83,10 +100,10 @@ class K8sCoreClient:
                 )
 
             allocatable = node.status.allocatable or {}
-            # Note 25: The dict comprehension `{c.type: c.status for c in ...}` flattens the SDK's
-            # Note 26: list of NodeCondition objects into a plain lookup map keyed by condition type
-            # Note 27: (e.g., {"Ready": "True", "MemoryPressure": "False"}). This is much faster to
-            # Note 28: query than scanning the list for a matching .type attribute on every access.
+            # Note 28: The dict comprehension `{c.type: c.status for c in ...}` flattens the SDK's
+            # Note 29: list of NodeCondition objects into a plain lookup map keyed by condition type
+            # Note 30: (e.g., {"Ready": "True", "MemoryPressure": "False"}). This is much faster to
+            # Note 31: query than scanning the list for a matching .type attribute on every access.
             conditions = {c.type: c.status for c in (node.status.conditions or [])}
 
             results.append(
@@ -94,10 +111,10 @@ class K8sCoreClient:
                     "name": node.metadata.name,
                     "pool": pool,
                     "version": (node.status.node_info.kubelet_version if node.status.node_info else None),
-                    # Note 29: `bool(node.spec.unschedulable)` converts None (field absent, meaning
-                    # Note 30: schedulable) and False to False, and True to True. Without the explicit
-                    # Note 31: bool() call, None would appear in the output dict, which could confuse
-                    # Note 32: downstream code that does a truthiness check vs an equality check.
+                    # Note 32: `bool(node.spec.unschedulable)` converts None (field absent, meaning
+                    # Note 33: schedulable) and False to False, and True to True. Without the explicit
+                    # Note 34: bool() call, None would appear in the output dict, which could confuse
+                    # Note 35: downstream code that does a truthiness check vs an equality check.
                     "unschedulable": bool(node.spec.unschedulable),
                     "allocatable_cpu": allocatable.get("cpu", "0"),
                     "allocatable_memory": allocatable.get("memory", "0"),
@@ -107,32 +124,78 @@ class K8sCoreClient:
             )
         return results
 
+    async def get_pool_nodes(self, pool_name: str, field_selector: str | None = None) -> list[dict[str, Any]]:
+        """List only the nodes belonging to one node pool.
+
+        Args:
+            pool_name: The name of the node pool.
+            field_selector: Optional Kubernetes field selector applied to both label queries.
+
+        Returns the same node dicts as get_nodes().
+        """
+        # Note 36: Label selectors cannot express "either label equals X", so both labels are queried
+        # Note 37: concurrently and merged (an empty primary result under a field selector cannot tell
+        # Note 38: "label absent" from "no match"). Nodes usually carry both labels, so each is kept once.
+        primary, fallback = await asyncio.gather(
+            self.get_nodes(label_selector=f"{PRIMARY_POOL_LABEL}={pool_name}", field_selector=field_selector),
+            self.get_nodes(label_selector=f"{FALLBACK_POOL_LABEL}={pool_name}", field_selector=field_selector),
+        )
+        seen = {n["name"] for n in primary}
+        # A node matched only by the fallback label belongs elsewhere if its primary label disagrees.
+        return primary + [n for n in fallback if n["name"] not in seen and n["pool"] == pool_name]
+
+    @ttl_cached(LIST_CACHE_TTL_SECONDS)
     async def get_pods(
         self,
         namespace: str | None = None,
         field_selector: str | None = None,
+        resource_version: str | None = None,
     ) -> list[dict[str, Any]]:
         """List pods with status details.
 
         Args:
             namespace: Filter to a specific namespace. None for all namespaces.
             field_selector: Kubernetes field selector string.
+            resource_version: List resourceVersion. "0" allows the API server to answer from
+                its watch cache instead of a quorum read from etcd. None for a consistent read.
 
         Returns a list of pod dicts with key status fields.
         """
+        return await self._list_pods(namespace, field_selector, resource_version)
+
+    async def get_pods_on_node(self, node_name: str) -> list[dict[str, Any]]:
+        """List the pods scheduled on one node, bypassing the LIST cache.
+
+        Per-node lists are rarely repeated within the TTL, and surge upgrades bring up nodes
+        with new names on every run, so caching them would only pin results never read again.
+        """
+        return await self._list_pods(field_selector=f"spec.nodeName={node_name}")
+
+    async def _list_pods(
+        self,
+        namespace: str | None = None,
+        field_selector: str | None = None,
+        resource_version: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """List pods with status details without caching; see get_pods for the arguments."""
         api = self._get_api()
         try:
-            # Note 33: The kwargs dict pattern accumulates optional parameters and unpacks them
-            # Note 34: with **kwargs. This avoids writing four separate call-site permutations
-            # Note 35: (field_selector yes/no crossed with namespace yes/no) and keeps the
-            # Note 36: parameter-building logic in one readable block close to where it is used.
+            # Note 39: The kwargs dict pattern accumulates optional parameters and unpacks them
+            # Note 40: with **kwargs. This avoids writing four separate call-site permutations
+            # Note 41: (field_selector yes/no crossed with namespace yes/no) and keeps the
+            # Note 42: parameter-building logic in one readable block close to where it is used.
             kwargs: dict[str, Any] = {}
             if field_selector:
-                # Note 37: field_selector is evaluated server-side by the Kubernetes API server
-                # Note 38: before any data is sent over the network. Filtering here (e.g.,
-                # Note 39: "status.phase=Pending") reduces the payload and avoids downloading
-                # Note 40: running pods that the caller will discard immediately.
+                # Note 43: field_selector is evaluated server-side by the Kubernetes API server
+                # Note 44: before any data is sent over the network. Filtering here (e.g.,
+                # Note 45: "status.phase=Pending") reduces the payload and avoids downloading
+                # Note 46: running pods that the caller will discard immediately.
                 kwargs["field_selector"] = field_selector
+            if resource_version is not None:
+                # Note 47: resource_version="0" lets the API server serve the list from its
+                # Note 48: in-memory watch cache. The result may trail etcd by a moment, but the
+                # Note 49: read skips the etcd round trip, which dominates on busy control planes.
+                kwargs["resource_version"] = resource_version
             if namespace:
                 pod_list = await asyncio.to_thread(api.list_namespaced_pod, namespace, **kwargs)
             else:
@@ -157,10 +220,10 @@ class K8sCoreClient:
                 }
                 if cs.state:
                     if cs.state.waiting:
-                        # Note 41: `cs.state.waiting` represents the CURRENT state: the container
-                        # Note 42: has not yet started. Common reasons are "ContainerCreating" and
-                        # Note 43: "ImagePullBackOff". Only one of waiting, running, or terminated
-                        # Note 44: is set at a time -- the elif chain reflects that mutual exclusion.
+                        # Note 50: `cs.state.waiting` represents the CURRENT state: the container
+                        # Note 51: has not yet started. Common reasons are "ContainerCreating" and
+                        # Note 52: "ImagePullBackOff". Only one of waiting, running, or terminated
+                        # Note 53: is set at a time -- the elif chain reflects that mutual exclusion.
                         cs_info["state"] = {"waiting": {"reason": cs.state.waiting.reason}}
                     elif cs.state.terminated:
                         cs_info["state"] = {
@@ -169,12 +232,12 @@ class K8sCoreClient:
                                 "exit_code": cs.state.terminated.exit_code,
                             }
                         }
-                # Note 45: `cs.last_state.terminated` captures the PREVIOUS container run, not the
-                # Note 46: current one. It is populated after a crash-restart cycle and provides the
-                # Note 47: exit code and reason from the container that just died. This is critical
-                # Note 48: for diagnosing OOMKilled or error-exit restart loops where the current
-                # Note 49: state is "running" (the replacement container) but the root cause lives
-                # Note 50: in last_state. Checking last_state separately preserves both signals.
+                # Note 54: `cs.last_state.terminated` captures the PREVIOUS container run, not the
+                # Note 55: current one. It is populated after a crash-restart cycle and provides the
+                # Note 56: exit code and reason from the container that just died. This is critical
+                # Note 57: for diagnosing OOMKilled or error-exit restart loops where the current
+                # Note 58: state is "running" (the replacement container) but the root cause lives
+                # Note 59: in last_state. Checking last_state separately preserves both signals.
                 if cs.last_state and cs.last_state.terminated:
                     cs_info["last_terminated"] = {
                         "reason": cs.last_state.terminated.reason,
@@ -191,11 +254,11 @@ class K8sCoreClient:
                     "reason": pod.status.reason,
                     "message": pod.status.message,
                     "container_statuses": container_statuses,
-                    # Note 51: The list comprehension over pod.status.conditions converts each
-                    # Note 52: PodCondition SDK object into a plain dict. Normalising to plain dicts
-                    # Note 53: here decouples the rest of the codebase from the kubernetes SDK's
-                    # Note 54: object model -- callers can serialise, log, or compare conditions
-                    # Note 55: without importing kubernetes types, making the data more portable.
+                    # Note 60: The list comprehension over pod.status.conditions converts each
+                    # Note 61: PodCondition SDK object into a plain dict. Normalising to plain dicts
+                    # Note 62: here decouples the rest of the codebase from the kubernetes SDK's
+                    # Note 63: object model -- callers can serialise, log, or compare conditions
+                    # Note 64: without importing kubernetes types, making the data more portable.
                     "conditions": [
                         {"type": c.type, "status": c.status, "reason": c.reason, "message": c.message}
                         for c in (pod.status.conditions or [])
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import threading
+from collections.abc import Sequence
 from datetime import datetime
 from typing import Any
 
@@ -15,6 +16,11 @@ from platform_mcp_server.config import ClusterConfig
 
 log = structlog.get_logger()
 
+# Note 1: The node event reasons the upgrade tools pair up. A shared immutable tuple is built
+# Note 2: once at import rather than as a fresh list on every handler call, and its fixed order
+# Note 3: keeps the per-reason list calls below deterministic.
+UPGRADE_EVENT_REASONS: tuple[str, ...] = ("NodeUpgrade", "NodeReady")
+
 
 class K8sEventsClient:
     """Wrapper around Kubernetes Events API for upgrade and pod event retrieval."""
@@ -33,10 +39,10 @@ class K8sEventsClient:
 
     async def get_node_events(
         self,
-        # Note 1: `list[str] | None` is the idiomatic Python 3.10+ union for an
-        # Note 2: optional parameter. `None` as the default means "no filter applied",
-        # Note 3: which is cheaper to express at the call site than passing an empty list.
-        reasons: list[str] | None = None,
+        # Note 4: `Sequence[str] | None` is the idiomatic Python 3.10+ union for an
+        # Note 5: optional parameter. `None` as the default means "no filter applied",
+        # Note 6: which is cheaper to express at the call site than passing an empty list.
+        reasons: Sequence[str] | None = None,
     ) -> list[dict[str, Any]]:
         """Get events related to nodes, optionally filtered by reason.
 
@@ -46,39 +52,49 @@ class K8sEventsClient:
         Returns a list of event dicts with timestamp, reason, node name, and message.
         """
         api = self._get_api()
+        # Note 7: `list_event_for_all_namespaces` queries the /events endpoint
+        # Note 8: across every namespace in a single API call. Node events are stored
+        # Note 9: in kube-system (or sometimes "default") -- whichever namespace the
+        # Note 10: control-plane component that generated the event lives in -- because
+        # Note 11: a Kubernetes Event is always namespaced to the object it describes.
+        # Note 12: The `field_selector` pushes the kind=Node filter to the API server
+        # Note 13: so we avoid transferring every event type over the network.
+        # Note 14: Events also support a `reason` field selector, but only as an exact match,
+        # Note 15: so each requested reason gets its own server-side filtered list call. The
+        # Note 16: calls run concurrently, and noisy node events (NodeHasSufficientMemory,
+        # Note 17: NodeNotReady, Rebooted, ...) never leave the API server.
+        selectors = (
+            [f"involvedObject.kind=Node,reason={reason}" for reason in dict.fromkeys(reasons)]
+            if reasons
+            else ["involvedObject.kind=Node"]
+        )
         try:
-            # Note 4: `list_event_for_all_namespaces` queries the /events endpoint
-            # Note 5: across every namespace in a single API call. Node events are stored
-            # Note 6: in kube-system (or sometimes "default") -- whichever namespace the
-            # Note 7: control-plane component that generated the event lives in -- because
-            # Note 8: a Kubernetes Event is always namespaced to the object it describes.
-            # Note 9: The `field_selector` pushes the kind=Node filter to the API server
-            # Note 10: so we avoid transferring every event type over the network.
-            events = await asyncio.to_thread(
-                api.list_event_for_all_namespaces,
-                field_selector="involvedObject.kind=Node",
+            event_lists = await asyncio.gather(
+                *(
+                    asyncio.to_thread(api.list_event_for_all_namespaces, field_selector=selector)
+                    for selector in selectors
+                )
             )
         except Exception:
             log.error("failed_to_list_node_events", cluster=self._cluster_config.cluster_id)
             raise
 
         results: list[dict[str, Any]] = []
-        for event in events.items:
-            # Note 11: `event.reason` is a short, machine-readable token like "NodeUpgrade"
-            # Note 12: or "NodeReady". `event.message` is the human-readable explanation.
-            # Note 13: Filtering on `reason` (not `message`) keeps the logic stable against
-            # Note 14: message wording changes across Kubernetes versions.
-            if reasons and event.reason not in reasons:
-                continue
-            results.append(
-                {
-                    "reason": event.reason,
-                    "node_name": event.involved_object.name,
-                    "message": event.message,
-                    "timestamp": _event_timestamp(event),
-                    "count": event.count,
-                }
-            )
+        for events in event_lists:
+            for event in events.items:
+                # Note 18: `event.reason` is a short, machine-readable token like "NodeUpgrade"
+                # Note 19: or "NodeReady". `event.message` is the human-readable explanation.
+                # Note 20: The reason filter is applied by the API server above rather than by
+                # Note 21: matching `message`, which keeps it stable against wording changes.
+                results.append(
+                    {
+                        "reason": event.reason,
+                        "node_name": event.involved_object.name,
+                        "message": event.message,
+                        "timestamp": _event_timestamp(event),
+                        "count": event.count,
+                    }
+                )
         return results
 
     async def get_pod_events(
@@ -95,10 +111,10 @@ class K8sEventsClient:
         api = self._get_api()
         try:
             if namespace:
-                # Note 15: When a namespace is known, prefer `list_namespaced_event` because
-                # Note 16: it targets a narrower API path (/namespaces/{ns}/events) and avoids
-                # Note 17: fetching events from unrelated namespaces. Pod events are always
-                # Note 18: stored in the same namespace as the pod itself -- never in kube-system.
+                # Note 22: When a namespace is known, prefer `list_namespaced_event` because
+                # Note 23: it targets a narrower API path (/namespaces/{ns}/events) and avoids
+                # Note 24: fetching events from unrelated namespaces. Pod events are always
+                # Note 25: stored in the same namespace as the pod itself -- never in kube-system.
                 events = await asyncio.to_thread(
                     api.list_namespaced_event,
                     namespace,
@@ -123,9 +139,9 @@ class K8sEventsClient:
                 {
                     "reason": event.reason,
                     "pod_name": event.involved_object.name,
-                    # Note 19: `involved_object.namespace` is included here even though we may
-                    # Note 20: have already filtered by namespace, because when querying all
-                    # Note 21: namespaces callers need provenance to correlate events with pods.
+                    # Note 26: `involved_object.namespace` is included here even though we may
+                    # Note 27: have already filtered by namespace, because when querying all
+                    # Note 28: namespaces callers need provenance to correlate events with pods.
                     "namespace": event.involved_object.namespace,
                     "message": event.message,
                     "timestamp": _event_timestamp(event),
@@ -137,16 +153,16 @@ class K8sEventsClient:
 
 def _event_timestamp(event: Any) -> str | None:
     """Extract the most relevant timestamp from a Kubernetes event."""
-    # Note 22: Kubernetes events carry three timestamp fields with different semantics:
-    # Note 23:   last_timestamp -- updated each time the event recurs (most informative).
-    # Note 24:   event_time    -- set by newer Event v1 objects; maps to EventSeries.
-    # Note 25:   first_timestamp -- when the event was first observed (least useful for
-    # Note 26:                      recurrence tracking, but better than nothing).
-    # Note 27: The `or` chain picks the first truthy value, implementing priority order.
+    # Note 29: Kubernetes events carry three timestamp fields with different semantics:
+    # Note 30:   last_timestamp -- updated each time the event recurs (most informative).
+    # Note 31:   event_time    -- set by newer Event v1 objects; maps to EventSeries.
+    # Note 32:   first_timestamp -- when the event was first observed (least useful for
+    # Note 33:                      recurrence tracking, but better than nothing).
+    # Note 34: The `or` chain picks the first truthy value, implementing priority order.
     ts = event.last_timestamp or event.event_time or event.first_timestamp
     if isinstance(ts, datetime):
-        # Note 28: `.isoformat()` produces RFC 3339 strings (e.g., "2024-06-01T12:00:00+00:00")
-        # Note 29: which LLMs and downstream JSON consumers parse unambiguously without
-        # Note 30: needing to know epoch offsets or locale-specific date formats.
+        # Note 35: `.isoformat()` produces RFC 3339 strings (e.g., "2024-06-01T12:00:00+00:00")
+        # Note 36: which LLMs and downstream JSON consumers parse unambiguously without
+        # Note 37: needing to know epoch offsets or locale-specific date formats.
         return ts.isoformat()
     return str(ts) if ts else None
@@ -9,7 +9,7 @@ from typing import Any
 import structlog
 from kubernetes import client as k8s_client
 
-from platform_mcp_server.clients import load_k8s_api_client
+from platform_mcp_server.clients import LIST_CACHE_TTL_SECONDS, load_k8s_api_client, ttl_cached
 from platform_mcp_server.config import ClusterConfig
 
 log = structlog.get_logger()
@@ -37,6 +37,7 @@ class K8sPolicyClient:
                 self._api = k8s_client.PolicyV1Api(api_client)
             return self._api
 
+    @ttl_cached(LIST_CACHE_TTL_SECONDS)
     async def get_pdbs(self, namespace: str | None = None) -> list[dict[str, Any]]:
         """List all PodDisruptionBudgets.
 
@@ -178,3 +178,22 @@ def validate_cluster_config() -> None:
 def get_thresholds() -> ThresholdConfig:
     """Return threshold configuration with environment variable overrides applied."""
     return ThresholdConfig()
+
+
+def get_fanout_concurrency() -> int:
+    """Return how many clusters a fleet-wide ("all") query may contact at once.
+
+    Reads ``PLATFORM_MCP_FANOUT_CONCURRENCY`` (default 8). Values below 1 are
+    treated as 1 so a misconfiguration degrades to sequential rather than hanging.
+    """
+    return max(1, int(os.environ.get("PLATFORM_MCP_FANOUT_CONCURRENCY", "8")))
+
+
+def get_fanout_timeout() -> float:
+    """Return the deadline, in seconds, for a fleet-wide ("all") query.
+
+    Reads ``PLATFORM_MCP_FANOUT_TIMEOUT_SECONDS`` (default 30). Clusters that have not
+    answered by the deadline are reported as failed so one hung API server cannot hold
+    back the rest of the fleet. A value of 0 or less disables the deadline.
+    """
+    return float(os.environ.get("PLATFORM_MCP_FANOUT_TIMEOUT_SECONDS", "30"))
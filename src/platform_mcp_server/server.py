@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import sys
 import time
+from collections.abc import Sequence
 
 import structlog
 
@@ -16,6 +17,7 @@ import structlog
 # Note 6: protocol. It converts plain async functions into MCP-compliant tool descriptors
 # Note 7: automatically, so you write ordinary Python and get a standards-compliant server.
 from mcp.server.fastmcp import FastMCP
+from pydantic import BaseModel
 
 from platform_mcp_server.config import load_cluster_map, validate_cluster_config
 from platform_mcp_server.models import scrub_sensitive_values
@@ -78,7 +80,7 @@ async def check_node_pool_pressure(cluster: str) -> str:
         # Note 28: are treated as a specific cluster ID and dispatched to the single handler.
         if cluster == "all":
             results = await check_node_pool_pressure_all()
-            output = "\n\n".join(scrub_sensitive_values(r.model_dump_json(indent=2)) for r in results)
+            output = _render_fan_out(results)
         else:
             result = await check_node_pool_pressure_handler(cluster)
             # Note 29: scrub_sensitive_values() is applied to every output string before it is
@@ -121,7 +123,7 @@ async def get_pod_health(
     try:
         if cluster == "all":
             results = await get_pod_health_all(namespace, status_filter)
-            output = "\n\n".join(scrub_sensitive_values(r.model_dump_json(indent=2)) for r in results)
+            output = _render_fan_out(results)
         else:
             result = await get_pod_health_handler(cluster, namespace, status_filter)
             output = scrub_sensitive_values(result.model_dump_json(indent=2))
@@ -148,7 +150,7 @@ async def get_kubernetes_upgrade_status(cluster: str) -> str:
     try:
         if cluster == "all":
             results = await get_upgrade_status_all()
-            output = "\n\n".join(scrub_sensitive_values(r.model_dump_json(indent=2)) for r in results)
+            output = _render_fan_out(results)
         else:
             result = await get_upgrade_status_handler(cluster)
             output = scrub_sensitive_values(result.model_dump_json(indent=2))
@@ -176,7 +178,7 @@ async def get_upgrade_progress(cluster: str, node_pool: str | None = None) -> st
     try:
         if cluster == "all":
             results = await get_upgrade_progress_all(node_pool)
-            output = "\n\n".join(scrub_sensitive_values(r.model_dump_json(indent=2)) for r in results)
+            output = _render_fan_out(results)
         else:
             result = await get_upgrade_progress_handler(cluster, node_pool)
             output = scrub_sensitive_values(result.model_dump_json(indent=2))
@@ -206,7 +208,7 @@ async def get_upgrade_duration_metrics(cluster: str, node_pool: str, history_cou
     try:
         if cluster == "all":
             results = await get_upgrade_metrics_all(node_pool, history_count)
-            output = "\n\n".join(scrub_sensitive_values(r.model_dump_json(indent=2)) for r in results)
+            output = _render_fan_out(results)
         else:
             result = await get_upgrade_metrics_handler(cluster, node_pool, history_count)
             output = scrub_sensitive_values(result.model_dump_json(indent=2))
@@ -235,7 +237,7 @@ async def check_pdb_upgrade_risk(cluster: str, node_pool: str | None = None, mod
     try:
         if cluster == "all":
             results = await check_pdb_risk_all(node_pool, mode)
-            output = "\n\n".join(scrub_sensitive_values(r.model_dump_json(indent=2)) for r in results)
+            output = _render_fan_out(results)
         else:
             result = await check_pdb_risk_handler(cluster, node_pool, mode)
             output = scrub_sensitive_values(result.model_dump_json(indent=2))
@@ -251,6 +253,16 @@ def _elapsed_ms(start: float) -> int:
     return int((time.monotonic() - start) * 1000)
 
 
+def _render_fan_out(results: Sequence[BaseModel]) -> str:
+    """Serialise and scrub each fan-out result, separated by blank lines."""
+    # Each result is scrubbed on its own rather than scrubbing the joined string, because
+    # the resource group pattern matches up to the next "/" and could otherwise run across
+    # the boundary into the following cluster's output. str.join() materialises a
+    # generator into a list internally anyway, so building the list explicitly is free.
+    chunks = [scrub_sensitive_values(r.model_dump_json(indent=2)) for r in results]
+    return "\n\n".join(chunks)
+
+
 # Claude Desktop MCP server configuration example:
 # Add to ~/Library/Application Support/Claude/claude_desktop_config.json (macOS)
 # or %APPDATA%\Claude\claude_desktop_config.json (Windows):
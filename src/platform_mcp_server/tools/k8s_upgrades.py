@@ -8,30 +8,41 @@ from typing import Any
 
 import structlog
 
+from platform_mcp_server.clients import shared_client
 from platform_mcp_server.clients.azure_aks import AzureAksClient
 from platform_mcp_server.config import ALL_CLUSTER_IDS, resolve_cluster
 from platform_mcp_server.models import NodePoolVersionInfo, ToolError, UpgradeStatusOutput
+from platform_mcp_server.utils import gather_bounded
 
 log = structlog.get_logger()
 
 
-async def get_upgrade_status_handler(cluster_id: str) -> UpgradeStatusOutput:
-    """Core handler for get_kubernetes_upgrade_status on a single cluster."""
+async def get_upgrade_status_handler(cluster_id: str, timestamp: str | None = None) -> UpgradeStatusOutput:
+    """Core handler for get_kubernetes_upgrade_status on a single cluster.
+
+    Args:
+        cluster_id: The cluster to inspect.
+        timestamp: Report timestamp shared across a fan-out batch; the current time when omitted.
+    """
     config = resolve_cluster(cluster_id)
-    aks_client = AzureAksClient(config)
+    aks_client = shared_client(AzureAksClient, config)
     errors: list[ToolError] = []
 
-    # Note 1: `cluster_info` and `upgrade_profile` are fetched in separate try/except
-    # Note 2: blocks rather than a single combined call because they are independent
-    # Note 3: failure domains: the cluster info endpoint can succeed even when the
-    # Note 4: upgrade profile endpoint is unavailable (e.g., feature not enabled on
-    # Note 5: the subscription). Separating them lets us return partial data with
-    # Note 6: structured errors instead of failing the entire request on one timeout.
-    # Get cluster info
+    # Note 1: `cluster_info` and `upgrade_profile` are fetched as separate calls rather
+    # Note 2: than a single combined call because they are independent failure domains:
+    # Note 3: the cluster info endpoint can succeed even when the upgrade profile endpoint
+    # Note 4: is unavailable (e.g., feature not enabled on the subscription). Issuing both
+    # Note 5: through one gather() overlaps the two ARM round-trips, and return_exceptions=True
+    # Note 6: lets us return partial data with structured errors instead of failing outright.
+    results = await asyncio.gather(
+        aks_client.get_cluster_info(),
+        aks_client.get_upgrade_profile(),
+        return_exceptions=True,
+    )
+    info_result, profile_result = results
+
     cluster_info: dict[str, Any] | None = None
-    try:
-        cluster_info = await aks_client.get_cluster_info()
-    except Exception:
+    if isinstance(info_result, BaseException):
         errors.append(
             ToolError(
                 error="Failed to get cluster info",
@@ -40,12 +51,11 @@ async def get_upgrade_status_handler(cluster_id: str) -> UpgradeStatusOutput:
                 partial_data=True,
             )
         )
+    else:
+        cluster_info = info_result
 
-    # Get upgrade profile
     upgrade_profile: dict[str, Any] | None = None
-    try:
-        upgrade_profile = await aks_client.get_upgrade_profile()
-    except Exception:
+    if isinstance(profile_result, BaseException):
         errors.append(
             ToolError(
                 error="Failed to get upgrade profile",
@@ -54,6 +64,8 @@ async def get_upgrade_status_handler(cluster_id: str) -> UpgradeStatusOutput:
                 partial_data=True,
             )
         )
+    else:
+        upgrade_profile = profile_result
 
     # Note 7: `cluster_info is None` is the early-exit guard: without the cluster's
     # Note 8: basic metadata (version, pool list) there is nothing meaningful to build
@@ -68,7 +80,7 @@ async def get_upgrade_status_handler(cluster_id: str) -> UpgradeStatusOutput:
             available_upgrades=[],
             upgrade_active=False,
             summary=f"Failed to retrieve data for {cluster_id}",
-            timestamp=datetime.now(tz=UTC).isoformat(),
+            timestamp=timestamp or datetime.now(tz=UTC).isoformat(),
             errors=errors,
         )
 
@@ -82,12 +94,14 @@ async def get_upgrade_status_handler(cluster_id: str) -> UpgradeStatusOutput:
     for pool in cluster_info.get("node_pools", []):
         current_ver = pool.get("current_version")
         target_ver = pool.get("target_version")
+        state = pool.get("provisioning_state")
         # Note 16: The upgrade detection uses two signals joined by OR because AKS may
         # Note 17: report `provisioning_state == "Upgrading"` before the target version
         # Note 18: field is populated, and may leave provisioning_state as "Succeeded"
         # Note 19: while current_ver != target_ver during a slow roll. Either signal alone
-        # Note 20: can miss a window; both together give full coverage.
-        is_upgrading = pool.get("provisioning_state") == "Upgrading" or (
+        # Note 20: can miss a window; both together give full coverage. Each field is read
+        # Note 21: from the pool dict once above and reused below.
+        is_upgrading = state == "Upgrading" or (
             current_ver is not None and target_ver is not None and current_ver != target_ver
         )
         if is_upgrading:
@@ -96,8 +110,8 @@ async def get_upgrade_status_handler(cluster_id: str) -> UpgradeStatusOutput:
         node_pools.append(
             NodePoolVersionInfo(
                 pool_name=pool["name"],
-                current_version=pool.get("current_version", "unknown"),
-                target_version=pool.get("target_version") if is_upgrading else None,
+                current_version=current_ver if current_ver is not None else "unknown",
+                target_version=target_ver if is_upgrading else None,
                 upgrading=is_upgrading,
             )
         )
@@ -109,11 +123,13 @@ async def get_upgrade_status_handler(cluster_id: str) -> UpgradeStatusOutput:
 
     cp_version = cluster_info.get("control_plane_version", "unknown")
     upgrade_count = len(available_upgrades)
-    summary = f"{cluster_id} running {cp_version}"
     if upgrade_active:
-        summary += ", upgrade in progress"
+        status = ", upgrade in progress"
     elif upgrade_count > 0:
-        summary += f", {upgrade_count} upgrade{'s' if upgrade_count != 1 else ''} available"
+        status = f", {upgrade_count} upgrade{'s' if upgrade_count != 1 else ''} available"
+    else:
+        status = ""
+    summary = f"{cluster_id} running {cp_version}{status}"
 
     return UpgradeStatusOutput(
         cluster=cluster_id,
@@ -122,28 +138,31 @@ async def get_upgrade_status_handler(cluster_id: str) -> UpgradeStatusOutput:
         available_upgrades=available_upgrades,
         upgrade_active=upgrade_active,
         summary=summary,
-        timestamp=datetime.now(tz=UTC).isoformat(),
+        timestamp=timestamp or datetime.now(tz=UTC).isoformat(),
         errors=errors,
     )
 
 
 async def get_upgrade_status_all() -> list[UpgradeStatusOutput]:
     """Fan-out get_kubernetes_upgrade_status to all clusters concurrently."""
-    tasks = [get_upgrade_status_handler(cid) for cid in ALL_CLUSTER_IDS]
-    # Note 21: `asyncio.gather(*tasks, return_exceptions=True)` runs all coroutines
-    # Note 22: concurrently on the event loop. The critical detail is `return_exceptions=True`:
-    # Note 23: without it, the first raised exception would immediately cancel the remaining
-    # Note 24: tasks and propagate out of gather, discarding results already computed.
-    # Note 25: With it, exceptions are captured as regular return values in the results
-    # Note 26: list, letting the loop below inspect each cluster outcome independently.
-    results = await asyncio.gather(*tasks, return_exceptions=True)
+    # Note 22: One timestamp marks the whole fleet report, so every cluster's output carries
+    # Note 23: the same "as of" time and the clock is read once rather than once per cluster.
+    timestamp = datetime.now(tz=UTC).isoformat()
+    tasks = [get_upgrade_status_handler(cid, timestamp) for cid in ALL_CLUSTER_IDS]
+    # Note 24: gather_bounded runs the coroutines concurrently, at most
+    # Note 25: PLATFORM_MCP_FANOUT_CONCURRENCY at a time so a large fleet does not burst ARM.
+    # Note 26: Like `gather(..., return_exceptions=True)` it never raises for a failed cluster:
+    # Note 27: without that, the first exception would propagate and discard results already
+    # Note 28: computed. Exceptions are instead captured as regular values in the results
+    # Note 29: list, letting the loop below inspect each cluster outcome independently.
+    results = await gather_bounded(tasks)
     outputs: list[UpgradeStatusOutput] = []
     for cid, result in zip(ALL_CLUSTER_IDS, results, strict=True):
-        # Note 27: `isinstance(result, BaseException)` is deliberately broad: it catches
-        # Note 28: subclasses of both `Exception` (runtime errors) and `SystemExit`/
-        # Note 29: `KeyboardInterrupt` (which inherit from BaseException, not Exception).
-        # Note 30: Using BaseException here means no failure mode can silently slip through
-        # Note 31: and be mistakenly appended to `outputs` as a valid UpgradeStatusOutput.
+        # Note 30: `isinstance(result, BaseException)` is deliberately broad: it catches
+        # Note 31: subclasses of both `Exception` (runtime errors) and `SystemExit`/
+        # Note 32: `KeyboardInterrupt` (which inherit from BaseException, not Exception).
+        # Note 33: Using BaseException here means no failure mode can silently slip through
+        # Note 34: and be mistakenly appended to `outputs` as a valid UpgradeStatusOutput.
         if isinstance(result, BaseException):
             log.error("fan_out_cluster_failed", tool="get_kubernetes_upgrade_status", cluster=cid, error=str(result))
         else:
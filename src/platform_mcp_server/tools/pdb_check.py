@@ -4,18 +4,41 @@ from __future__ import annotations
 
 import asyncio
 from datetime import UTC, datetime
+from functools import lru_cache
 from typing import Any
 
 import structlog
 
+from platform_mcp_server.clients import shared_client
 from platform_mcp_server.clients.k8s_core import K8sCoreClient
 from platform_mcp_server.clients.k8s_policy import K8sPolicyClient
 from platform_mcp_server.config import ALL_CLUSTER_IDS, resolve_cluster
 from platform_mcp_server.models import PdbCheckOutput, PdbRisk, ToolError
+from platform_mcp_server.utils import gather_bounded
 from platform_mcp_server.validation import validate_mode, validate_node_pool
 
 log = structlog.get_logger()
 
+# Field selector matching nodes that have been cordoned (spec.unschedulable=true).
+CORDONED_NODE_SELECTOR = "spec.unschedulable=true"
+
+
+async def _get_blockers(policy_client: K8sPolicyClient) -> list[dict[str, Any]]:
+    """List PDBs and return the ones that would block a node drain."""
+    pdbs = await policy_client.get_pdbs()
+    # Clusters without any PDBs (common in dev) cannot have blockers, so evaluation is skipped.
+    if not pdbs:
+        return []
+    return await policy_client.evaluate_pdb_satisfiability(pdbs)
+
+
+def _discard(task: asyncio.Future[Any]) -> None:
+    """Cancel a task whose result is no longer needed without leaking its exception."""
+    # A task that already failed cannot be cancelled; retrieving its exception stops asyncio
+    # from logging "Task exception was never retrieved" for a result nobody asked for.
+    if not task.cancel() and not task.cancelled():
+        task.exception()
+
 
 # Note 1: validate_mode and validate_node_pool are called at the very top of the handler,
 # Note 2: before any network I/O, implementing a fail-fast pattern. This avoids wasting
@@ -24,18 +47,23 @@ async def check_pdb_risk_handler(
     cluster_id: str,
     node_pool: str | None = None,
     mode: str = "preflight",
+    timestamp: str | None = None,
 ) -> PdbCheckOutput:
-    """Core handler for check_pdb_upgrade_risk on a single cluster."""
+    """Core handler for check_pdb_upgrade_risk on a single cluster.
+
+    Args:
+        cluster_id: The cluster to inspect.
+        node_pool: Limit live-mode node checks to this pool.
+        mode: "preflight" or "live".
+        timestamp: Report timestamp shared across a fan-out batch; the current time when omitted.
+    """
     validate_mode(mode)
     validate_node_pool(node_pool)
     config = resolve_cluster(cluster_id)
-    policy_client = K8sPolicyClient(config)
-    core_client = K8sCoreClient(config)
+    policy_client = shared_client(K8sPolicyClient, config)
+    core_client = shared_client(K8sCoreClient, config)
     errors: list[ToolError] = []
 
-    pdbs = await policy_client.get_pdbs()
-    blockers = await policy_client.evaluate_pdb_satisfiability(pdbs)
-
     # Note 4: "preflight" mode evaluates risk BEFORE an upgrade begins -- it answers
     # Note 5: "would any PDB block a drain if we started right now?" without requiring
     # Note 6: any nodes to be cordoned yet. Use this before initiating a cluster upgrade.
@@ -43,24 +71,57 @@ async def check_pdb_risk_handler(
     # Note 8: requires at least one cordoned node to be meaningful.
     if mode == "live":
         # In live mode, only report blockers on cordoned nodes
-        nodes = await core_client.get_nodes()
-        # Note 9: A "cordoned" node has unschedulable=True set by the upgrade controller
-        # Note 10: (via kubectl cordon or the AKS upgrade agent). Cordoned means the node
-        # Note 11: will not accept new pods but is not yet fully drained -- existing pods
-        # Note 12: are still running on it. The drain step comes after cordoning.
-        cordoned_nodes = {n["name"] for n in nodes if n["unschedulable"]}
+        # Note 9: The node list does not depend on the PDBs, so it is fetched alongside the
+        # Note 10: whole PDB chain. Satisfiability evaluation starts as soon as the PDB list
+        # Note 11: arrives, while the node list may still be in flight.
+        # Note 12: When a pool is given, only that pool's nodes are listed. The label selector
+        # Note 13: is evaluated server-side, so the payload scales with the pool, not the cluster.
+        # Note 14: Only cordoned nodes matter here, so the API server is asked for those alone via
+        # Note 15: a field selector. During a rolling upgrade that is a handful of nodes rather
+        # Note 16: than the whole cluster, and the common "nothing cordoned" case is an empty list.
+        if node_pool:
+            nodes_coro = core_client.get_pool_nodes(node_pool, field_selector=CORDONED_NODE_SELECTOR)
+        else:
+            nodes_coro = core_client.get_nodes(field_selector=CORDONED_NODE_SELECTOR)
+        nodes_task = asyncio.ensure_future(nodes_coro)
+        try:
+            blockers = await _get_blockers(policy_client)
+        except BaseException:
+            _discard(nodes_task)
+            raise
+
+        # Note 17: A "cordoned" node has unschedulable=True set by the upgrade controller
+        # Note 18: (via kubectl cordon or the AKS upgrade agent). Cordoned means the node
+        # Note 19: will not accept new pods but is not yet fully drained -- existing pods
+        # Note 20: are still running on it. The drain step comes after cordoning.
+        # Note 21: The unschedulable check is kept as a cheap guard on the selected nodes.
+        # Note 22: Without blockers there is nothing to report whichever nodes are cordoned, so
+        # Note 23: the node listing is abandoned rather than awaited -- the common case in a
+        # Note 24: healthy fleet.
+        cordoned_nodes: set[str] = set()
+        if blockers:
+            nodes = await nodes_task
+            cordoned_nodes = {n["name"] for n in nodes if n["unschedulable"]}
+        else:
+            _discard(nodes_task)
 
         if not cordoned_nodes:
-            # No cordoned nodes means no active upgrade drain blocks
+            # No blockers or no cordoned nodes means no active upgrade drain blocks
             return PdbCheckOutput(
                 cluster=cluster_id,
                 mode=mode,
                 risks=[],
                 summary=f"No active PDB blocks detected in {cluster_id}",
-                timestamp=datetime.now(tz=UTC).isoformat(),
+                timestamp=timestamp or datetime.now(tz=UTC).isoformat(),
                 errors=errors,
             )
 
+        # Note 25: affected_nodes is sorted so that the list is deterministic across
+        # Note 26: runs. An LLM reading this output benefits from stable ordering because
+        # Note 27: it avoids false diffs when comparing two successive tool calls. The sort
+        # Note 28: is loop-invariant, so it runs once here rather than once per blocker.
+        cordoned_sorted = sorted(cordoned_nodes)
+
         # Filter blockers — in live mode we report all blocking PDBs when cordoned nodes exist
         risks = [
             PdbRisk(
@@ -69,15 +130,13 @@ async def check_pdb_risk_handler(
                 workload=_workload_from_selector(b.get("selector", {})),
                 reason=b["block_reason"],
                 affected_pods=b.get("expected_pods", 0),
-                # Note 13: affected_nodes is sorted so that the list is deterministic across
-                # Note 14: runs. An LLM reading this output benefits from stable ordering because
-                # Note 15: it avoids false diffs when comparing two successive tool calls.
-                affected_nodes=sorted(cordoned_nodes),
+                affected_nodes=cordoned_sorted,
             )
             for b in blockers
         ]
     else:
         # Preflight mode — evaluate all PDBs
+        blockers = await _get_blockers(policy_client)
         risks = [
             PdbRisk(
                 pdb_name=b["name"],
@@ -85,8 +144,8 @@ async def check_pdb_risk_handler(
                 workload=_workload_from_selector(b.get("selector", {})),
                 reason=b["block_reason"],
                 affected_pods=b.get("expected_pods", 0),
-                # Note 16: In preflight mode affected_nodes is omitted (no nodes are cordoned yet),
-                # Note 17: so the PdbRisk model receives no affected_nodes argument here.
+                # Note 29: In preflight mode affected_nodes is omitted (no nodes are cordoned yet),
+                # Note 30: so the PdbRisk model receives no affected_nodes argument here.
             )
             for b in blockers
         ]
@@ -102,7 +161,7 @@ async def check_pdb_risk_handler(
         mode=mode,
         risks=risks,
         summary=summary,
-        timestamp=datetime.now(tz=UTC).isoformat(),
+        timestamp=timestamp or datetime.now(tz=UTC).isoformat(),
         errors=errors,
     )
 
@@ -112,15 +171,18 @@ async def check_pdb_risk_all(
     mode: str = "preflight",
 ) -> list[PdbCheckOutput]:
     """Fan-out check_pdb_upgrade_risk to all clusters concurrently."""
-    tasks = [check_pdb_risk_handler(cid, node_pool, mode) for cid in ALL_CLUSTER_IDS]
-    # Note 18: return_exceptions=True prevents a single failing cluster from short-circuiting
-    # Note 19: the entire fan-out; each cluster result is handled independently below.
-    results = await asyncio.gather(*tasks, return_exceptions=True)
+    # Note 31: A single report timestamp is shared by every cluster in the batch.
+    timestamp = datetime.now(tz=UTC).isoformat()
+    tasks = [check_pdb_risk_handler(cid, node_pool, mode, timestamp) for cid in ALL_CLUSTER_IDS]
+    # Note 32: gather_bounded caps how many clusters are queried at once and, like
+    # Note 33: return_exceptions=True, prevents a single failing cluster from short-circuiting
+    # Note 34: the entire fan-out; each cluster result is handled independently below.
+    results = await gather_bounded(tasks)
     outputs: list[PdbCheckOutput] = []
-    # Note 20: strict=True on zip() enforces that ALL_CLUSTER_IDS and results are the same
-    # Note 21: length. asyncio.gather always returns exactly one result per task, so this
-    # Note 22: should never fire -- but if it does it means a programming error, not a
-    # Note 23: runtime cluster failure, and raising immediately is the correct behavior.
+    # Note 35: strict=True on zip() enforces that ALL_CLUSTER_IDS and results are the same
+    # Note 36: length. gather_bounded always returns exactly one result per task, so this
+    # Note 37: should never fire -- but if it does it means a programming error, not a
+    # Note 38: runtime cluster failure, and raising immediately is the correct behavior.
     for cid, result in zip(ALL_CLUSTER_IDS, results, strict=True):
         if isinstance(result, BaseException):
             log.error("fan_out_cluster_failed", tool="check_pdb_upgrade_risk", cluster=cid, error=str(result))
@@ -129,19 +191,29 @@ async def check_pdb_risk_all(
     return outputs
 
 
-# Note 24: PDB selectors use label keys to identify the workload they protect.
-# Note 25: The "app" label is the original informal Kubernetes convention and remains
-# Note 26: by far the most common key found in real-world deployments and Helm charts.
-# Note 27: "app.kubernetes.io/name" is the newer structured label recommended by the
-# Note 28: Kubernetes well-known labels spec (sig-apps), but adoption is still partial.
-# Note 29: Checking "app" first therefore matches the majority of clusters in practice.
+# Note 39: PDB selectors use label keys to identify the workload they protect.
+# Note 40: The "app" label is the original informal Kubernetes convention and remains
+# Note 41: by far the most common key found in real-world deployments and Helm charts.
+# Note 42: "app.kubernetes.io/name" is the newer structured label recommended by the
+# Note 43: Kubernetes well-known labels spec (sig-apps), but adoption is still partial.
+# Note 44: Checking "app" first therefore matches the majority of clusters in practice.
 def _workload_from_selector(selector: dict[str, Any]) -> str:
     """Derive a workload name from PDB selector labels."""
     if "app" in selector:
         return str(selector["app"])
     if "app.kubernetes.io/name" in selector:
         return str(selector["app.kubernetes.io/name"])
-    # Note 30: Falling back to str(selector) preserves all label key-value pairs so that
-    # Note 31: an operator reading the output still has enough context to identify the workload
-    # Note 32: even when neither standard label key is present.
-    return str(selector) if selector else "unknown"
+    # Note 45: Falling back to str(selector) preserves all label key-value pairs so that
+    # Note 46: an operator reading the output still has enough context to identify the workload
+    # Note 47: even when neither standard label key is present.
+    return _format_selector(tuple(selector.items())) if selector else "unknown"
+
+
+# Note 48: Only the fallback is memoised: the two label lookups above are cheaper than building
+# Note 49: a cache key, but formatting a whole selector is not, and the same system PDB selectors
+# Note 50: (e.g. kube-dns, metrics-server) recur on every cluster in a fleet-wide check. The key is
+# Note 51: an ordered tuple rather than a frozenset so the formatted label order is unchanged.
+@lru_cache(maxsize=4096)
+def _format_selector(items: tuple[tuple[str, Any], ...]) -> str:
+    """Render selector labels as the dict string shown in PdbRisk.workload."""
+    return str(dict(items))
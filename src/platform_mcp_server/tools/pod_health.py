@@ -3,17 +3,19 @@
 from __future__ import annotations
 
 import asyncio
-from collections import defaultdict
+from collections import Counter
 from datetime import UTC, datetime
 from typing import Any
 
 import structlog
 
+from platform_mcp_server.clients import shared_client
 from platform_mcp_server.clients.k8s_core import K8sCoreClient
 from platform_mcp_server.clients.k8s_events import K8sEventsClient
 from platform_mcp_server.config import ALL_CLUSTER_IDS, resolve_cluster
 from platform_mcp_server.models import PodDetail, PodHealthOutput, ToolError
-from platform_mcp_server.tools.pod_classification import categorize_failure, is_unhealthy
+from platform_mcp_server.tools.pod_classification import classify_pod
+from platform_mcp_server.utils import gather_bounded
 from platform_mcp_server.validation import validate_namespace, validate_status_filter
 
 log = structlog.get_logger()
@@ -25,132 +27,159 @@ log = structlog.get_logger()
 # Note 5: so the LLM has accurate aggregate data even when individual pod details are capped.
 RESULT_CAP = 50
 
+# Note 6: Pod health is a point-in-time diagnostic, so a list that trails etcd by a moment is
+# Note 7: acceptable. resourceVersion "0" lets the API server answer from its watch cache,
+# Note 8: which avoids a quorum read on every call. Only name, namespace, phase, reason and the
+# Note 9: container statuses (name, waiting reason, last terminated reason, restart count) of
+# Note 10: each pod are read here; the pod list API offers no projection narrower than that.
+POD_LIST_RESOURCE_VERSION = "0"
 
-# Note 6: OOMKilled is a container termination reason, not a waiting reason.
-# Note 7: After a container is OOM-killed, Kubernetes records the event in
-# Note 8: "last_terminated" (the previous container run), not in "state.waiting".
-# Note 9: Checking state.waiting.reason for "OOMKilled" would always miss it; the
-# Note 10: correct field to inspect is container_status["last_terminated"]["reason"].
-def _get_oomkill_info(container_statuses: list[dict[str, Any]]) -> tuple[str | None, str | None, int]:
-    """Extract OOMKill container info."""
-    for cs in container_statuses:
-        last_term = cs.get("last_terminated", {})
-        if last_term.get("reason") == "OOMKilled":
-            # Note 11: Returns the specific container name so callers can report WHICH
-            # Note 12: container in a multi-container pod was killed, not just the pod.
-            return cs.get("name"), None, cs.get("restart_count", 0)
-    # Note 13: Returning (None, None, 0) signals "no OOMKill detected"; the caller
-    # Note 14: uses container_name is None as the sentinel to switch to summed restarts.
-    return None, None, 0
+# Note 11: Maps a status_filter value to the only pod phase it keeps; "all" has no entry.
+_STATUS_FILTER_PHASES = {"pending": "Pending", "failed": "Failed"}
+
+
+def _event_sort_key(event: dict[str, Any]) -> str:
+    """Order events oldest first; events without a timestamp sort before all others."""
+    return event.get("timestamp") or ""
 
 
 async def get_pod_health_handler(
     cluster_id: str,
     namespace: str | None = None,
     status_filter: str = "all",
+    timestamp: str | None = None,
 ) -> PodHealthOutput:
-    """Core handler for get_pod_health on a single cluster."""
-    # Note 15: validate_namespace and validate_status_filter are called before any API
-    # Note 16: calls so invalid inputs raise immediately (fail-fast), avoiding unnecessary
-    # Note 17: network round trips.
+    """Core handler for get_pod_health on a single cluster.
+
+    Args:
+        cluster_id: The cluster to inspect.
+        namespace: Limit the pod listing to this namespace.
+        status_filter: "all", "pending" or "failed".
+        timestamp: Report timestamp shared across a fan-out batch; the current time when omitted.
+    """
+    # Note 12: validate_namespace and validate_status_filter are called before any API
+    # Note 13: calls so invalid inputs raise immediately (fail-fast), avoiding unnecessary
+    # Note 14: network round trips.
     validate_namespace(namespace)
     validate_status_filter(status_filter)
     config = resolve_cluster(cluster_id)
-    core_client = K8sCoreClient(config)
-    events_client = K8sEventsClient(config)
+    core_client = shared_client(K8sCoreClient, config)
+    events_client = shared_client(K8sEventsClient, config)
     errors: list[ToolError] = []
 
-    pods = await core_client.get_pods(namespace=namespace)
+    # Note 15: status_filter narrows the pods by phase: "all" keeps every unhealthy pod,
+    # Note 16: "pending" keeps only Pending-phase pods (not yet running), and "failed"
+    # Note 17: keeps only Failed-phase pods (terminated with non-zero exit or eviction).
+    # Note 18: For a single phase the filter is pushed to the API server as a field selector,
+    # Note 19: so the healthy majority of pods is never serialised or transferred. "all" cannot
+    # Note 20: be narrowed this way: a Running pod in CrashLoopBackOff is still unhealthy.
+    required_phase = _STATUS_FILTER_PHASES.get(status_filter)
+    field_selector = f"status.phase={required_phase}" if required_phase is not None else None
+    pods_coro = core_client.get_pods(
+        namespace=namespace,
+        field_selector=field_selector,
+        resource_version=POD_LIST_RESOURCE_VERSION,
+    )
+
+    # Note 21: The pod list and the pod events have no data dependency, so both requests are
+    # Note 22: issued together and the cluster costs the slower of the two round trips rather
+    # Note 23: than their sum. return_exceptions=True keeps one failing call from discarding
+    # Note 24: the other's result.
+    results = await asyncio.gather(
+        pods_coro,
+        events_client.get_pod_events(namespace=namespace),
+        return_exceptions=True,
+    )
+    pods_result, events_result = results
+
+    # Note 25: Without the pod list there is nothing to classify. A structured empty result
+    # Note 26: is returned instead of raising so a fan-out still reports this cluster's error.
+    if isinstance(pods_result, BaseException):
+        errors.append(ToolError(error="Failed to retrieve pods", source="k8s-api", cluster=cluster_id))
+        return PodHealthOutput(
+            cluster=cluster_id,
+            pods=[],
+            groups={},
+            total_matching=0,
+            truncated=False,
+            summary=f"Failed to retrieve pods for {cluster_id}",
+            timestamp=timestamp or datetime.now(tz=UTC).isoformat(),
+            errors=errors,
+        )
+    pods = pods_result
 
     # Get pod events for context
-    try:
-        events = await events_client.get_pod_events(namespace=namespace)
-    except Exception:
-        events = []
+    events: list[dict[str, Any]] = []
+    if isinstance(events_result, BaseException):
         errors.append(
             ToolError(error="Failed to retrieve pod events", source="events-api", cluster=cluster_id, partial_data=True)
         )
+    else:
+        events = events_result
 
     # Build event lookup: pod_name -> most recent event message
-    # Note 17: event_map is constructed once outside the pod loop so each pod detail
-    # Note 18: can look up its most recent event in O(1) via dict key access.
-    # Note 19: Building this map before the loop avoids an O(n*m) nested scan where
-    # Note 20: n=pods and m=events, keeping total complexity O(n + m).
-    event_map: dict[str, str] = {}
-    for evt in events:
-        pod_name = evt.get("pod_name", "")
-        if pod_name:
-            # Note 21: Later events in the list overwrite earlier ones for the same pod,
-            # Note 22: so event_map naturally retains the most recent event message per pod.
-            event_map[pod_name] = evt.get("message", "")
-
-    # Filter to unhealthy pods
-    # Note 23: is_unhealthy is applied as a pre-filter before any grouping or capping.
-    # Note 24: This ensures that groups and total_matching count reflect the real universe
-    # Note 25: of unhealthy pods, not just the capped display subset.
-    unhealthy_pods = [p for p in pods if is_unhealthy(p)]
-
-    # Apply status_filter
-    # Note 26: status_filter is a three-way branch: "all" keeps every unhealthy pod,
-    # Note 27: "pending" keeps only Pending-phase pods (not yet running), and "failed"
-    # Note 28: keeps only Failed-phase pods (terminated with non-zero exit or eviction).
-    if status_filter == "pending":
-        unhealthy_pods = [p for p in unhealthy_pods if p.get("phase") == "Pending"]
-    elif status_filter == "failed":
-        unhealthy_pods = [p for p in unhealthy_pods if p.get("phase") == "Failed"]
-
-    total_matching = len(unhealthy_pods)
-
-    # Build grouped counts (over all matching, not just capped)
-    # Note 29: Grouping runs over the full unhealthy_pods list BEFORE capping so that
-    # Note 30: the "groups" breakdown in the output reflects the true cluster state,
-    # Note 31: not merely the first 50 pods that happen to appear in the API response.
-    groups: dict[str, int] = defaultdict(int)
-    for pod in unhealthy_pods:
-        category = categorize_failure(pod.get("reason"), pod.get("container_statuses", []))
-        groups[category] += 1
-
-    # Cap results
-    # Note 32: Truncation is detected before slicing so that the summary message can
-    # Note 33: accurately state the true count vs the displayed count.
-    truncated = total_matching > RESULT_CAP
-    display_pods = unhealthy_pods[:RESULT_CAP]
-
-    # Build pod details
+    # Note 27: event_map is constructed once outside the pod loop so each pod detail
+    # Note 28: can look up its most recent event in O(1) via dict key access.
+    # Note 29: Building this map before the loop avoids an O(n*m) nested scan where
+    # Note 30: n=pods and m=events.
+    # Note 31: The API server does not promise any event ordering, so events are sorted by
+    # Note 32: timestamp first and later entries overwrite earlier ones for the same pod; the map
+    # Note 33: keeps the newest message per pod. The sort is stable, so events without a
+    # Note 34: timestamp (sorted first) or with equal timestamps keep their server order.
+    # Note 35: ISO-8601 UTC timestamps order correctly as strings, so no parsing is needed.
+    event_map: dict[str, str] = {
+        evt["pod_name"]: evt.get("message", "") for evt in sorted(events, key=_event_sort_key) if evt.get("pod_name")
+    }
+
+    # Note 36: The phase is still checked before classify_pod; the comparison is cheap and keeps
+    # Note 37: the filter correct regardless of how the pod list was fetched.
+    # Note 38: One pass over the pods filters, groups and builds details. classify_pod walks
+    # Note 39: each pod's container statuses once and yields its health, failure category and
+    # Note 40: OOMKill details together. Only the category of each matching pod is kept for
+    # Note 41: the counts, while PodDetail objects are only built for the first RESULT_CAP pods.
+    matched_categories: list[str] = []
     pod_details: list[PodDetail] = []
-    for pod in display_pods:
-        container_statuses = pod.get("container_statuses", [])
-        category = categorize_failure(pod.get("reason"), container_statuses)
-        container_name, memory_limit, restart_count = _get_oomkill_info(container_statuses)
-
-        # Sum up restart counts from all containers if not OOMKill
-        # Note 34: container_name is None means _get_oomkill_info found no OOMKill event.
-        # Note 35: In that case, restart_count from _get_oomkill_info is 0 (meaningless),
-        # Note 36: so we replace it with the sum across all containers in the pod.
-        # Note 37: For OOMKill pods, the per-container restart_count from last_terminated
-        # Note 38: is already the correct and most informative value, so it is kept as-is.
-        if container_name is None:
-            restart_count = sum(cs.get("restart_count", 0) for cs in container_statuses)
-
-        pod_details.append(
-            PodDetail(
-                name=pod["name"],
-                namespace=pod["namespace"],
-                phase=pod.get("phase", "Unknown"),
-                reason=pod.get("reason"),
-                failure_category=category,
-                restart_count=restart_count,
-                last_event=event_map.get(pod["name"]),
-                container_name=container_name,
-                memory_limit=memory_limit,
+    for pod in pods:
+        if required_phase is not None and pod.get("phase") != required_phase:
+            continue
+        classification = classify_pod(pod)
+        if not classification.unhealthy:
+            continue
+        matched_categories.append(classification.category)
+        if len(pod_details) < RESULT_CAP:
+            # Note 42: OOMKilled is recorded in last_terminated, not state.waiting, so
+            # Note 43: classify_pod reports the killed container by name along with its own
+            # Note 44: restart count. For any other pod restart_count is summed across all
+            # Note 45: containers and container_name stays None. memory_limit is not exposed
+            # Note 46: by the pod listing.
+            pod_details.append(
+                PodDetail(
+                    name=pod["name"],
+                    namespace=pod["namespace"],
+                    phase=pod.get("phase", "Unknown"),
+                    reason=pod.get("reason"),
+                    failure_category=classification.category,
+                    restart_count=classification.restart_count,
+                    last_event=event_map.get(pod["name"]),
+                    container_name=classification.oom_container,
+                    memory_limit=None,
+                )
             )
-        )
 
-    # Note 39: The summary string follows four cases to give the LLM a clear, human-readable
-    # Note 40: one-liner: truncated (showing N of M), multiple (N unhealthy pods),
-    # Note 41: single (1 unhealthy pod -- avoids "1 pods"), and zero (no unhealthy pods).
-    # Note 42: The conditional plural suffix ('s' if ... != 1 else '') is a common Python
-    # Note 43: idiom for grammatically correct singular/plural without importing inflect libs.
+    # Note 47: total_matching and groups cover every matching pod, so they reflect the true
+    # Note 48: cluster state. Counter tallies the categories in C in a single call.
+    total_matching = len(matched_categories)
+    groups = Counter(matched_categories)
+
+    # Note 49: Truncation compares the full match count with the cap so that the summary
+    # Note 50: message can accurately state the true count vs the displayed count.
+    truncated = total_matching > RESULT_CAP
+
+    # Note 51: The summary string follows four cases to give the LLM a clear, human-readable
+    # Note 52: one-liner: truncated (showing N of M), multiple (N unhealthy pods),
+    # Note 53: single (1 unhealthy pod -- avoids "1 pods"), and zero (no unhealthy pods).
+    # Note 54: The conditional plural suffix ('s' if ... != 1 else '') is a common Python
+    # Note 55: idiom for grammatically correct singular/plural without importing inflect libs.
     if truncated:
         summary = f"Showing {RESULT_CAP} of {total_matching} matching pods in {cluster_id}"
     elif total_matching > 0:
@@ -165,7 +194,7 @@ async def get_pod_health_handler(
         total_matching=total_matching,
         truncated=truncated,
         summary=summary,
-        timestamp=datetime.now(tz=UTC).isoformat(),
+        timestamp=timestamp or datetime.now(tz=UTC).isoformat(),
         errors=errors,
     )
 
@@ -175,15 +204,17 @@ async def get_pod_health_all(
     status_filter: str = "all",
 ) -> list[PodHealthOutput]:
     """Fan-out get_pod_health to all clusters concurrently."""
-    tasks = [get_pod_health_handler(cid, namespace, status_filter) for cid in ALL_CLUSTER_IDS]
-    # Note 44: asyncio.gather(*tasks, return_exceptions=True) launches all cluster handlers
-    # Note 45: concurrently. return_exceptions=True means a crash in one cluster handler
-    # Note 46: is returned as an exception object rather than re-raised, so remaining
-    # Note 47: cluster results are still collected and returned to the caller.
-    results = await asyncio.gather(*tasks, return_exceptions=True)
+    # Note 56: A single report timestamp is shared by every cluster in the batch.
+    timestamp = datetime.now(tz=UTC).isoformat()
+    tasks = [get_pod_health_handler(cid, namespace, status_filter, timestamp) for cid in ALL_CLUSTER_IDS]
+    # Note 57: gather_bounded caps how many clusters are queried at once, so a large fleet
+    # Note 58: does not open every cluster's pod and event requests simultaneously. Like
+    # Note 59: return_exceptions=True, a crash in one cluster handler is returned as an
+    # Note 60: exception object, so remaining cluster results are still collected.
+    results = await gather_bounded(tasks)
     outputs: list[PodHealthOutput] = []
-    # Note 48: strict=True on zip() catches any mismatch between task count and result count,
-    # Note 49: which would indicate an internal bug rather than a cluster-level failure.
+    # Note 61: strict=True on zip() catches any mismatch between task count and result count,
+    # Note 62: which would indicate an internal bug rather than a cluster-level failure.
     for cid, result in zip(ALL_CLUSTER_IDS, results, strict=True):
         if isinstance(result, BaseException):
             log.error("fan_out_cluster_failed", tool="get_pod_health", cluster=cid, error=str(result))
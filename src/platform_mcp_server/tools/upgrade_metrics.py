@@ -3,13 +3,16 @@
 from __future__ import annotations
 
 import asyncio
+import heapq
 from datetime import UTC, datetime
+from typing import Any
 
 import structlog
 
+from platform_mcp_server.clients import shared_client
 from platform_mcp_server.clients.azure_aks import AzureAksClient
-from platform_mcp_server.clients.k8s_events import K8sEventsClient
-from platform_mcp_server.config import ALL_CLUSTER_IDS, get_thresholds, resolve_cluster
+from platform_mcp_server.clients.k8s_events import UPGRADE_EVENT_REASONS, K8sEventsClient
+from platform_mcp_server.config import ALL_CLUSTER_IDS, ThresholdConfig, get_thresholds, resolve_cluster
 from platform_mcp_server.models import (
     CurrentRunMetrics,
     HistoricalStats,
@@ -17,7 +20,7 @@ from platform_mcp_server.models import (
     ToolError,
     UpgradeDurationOutput,
 )
-from platform_mcp_server.utils import parse_iso_timestamp
+from platform_mcp_server.utils import gather_bounded, parse_iso_timestamp
 from platform_mcp_server.validation import validate_node_pool
 
 log = structlog.get_logger()
@@ -25,98 +28,142 @@ log = structlog.get_logger()
 
 _parse_ts = parse_iso_timestamp
 
+# Note 9: Maps each event reason the handler pairs to its index in a node's
+# Note 10: [earliest NodeUpgrade, latest NodeReady] state, so one dict probe both filters
+# Note 11: out unrelated events and picks the slot, before any timestamp is parsed.
+_EVENT_SLOTS: dict[str | None, int] = {"NodeUpgrade": 0, "NodeReady": 1}
+
 
 async def get_upgrade_metrics_handler(
     cluster_id: str,
     node_pool: str,
     history_count: int = 5,
+    thresholds: ThresholdConfig | None = None,
 ) -> UpgradeDurationOutput:
-    """Core handler for get_upgrade_duration_metrics on a single cluster."""
+    """Core handler for get_upgrade_duration_metrics on a single cluster.
+
+    Args:
+        cluster_id: The cluster to inspect.
+        node_pool: The node pool whose upgrade is measured.
+        history_count: Number of historical Activity Log records to request.
+        thresholds: Pre-resolved thresholds; read from the environment when omitted.
+    """
     validate_node_pool(node_pool)
     config = resolve_cluster(cluster_id)
-    events_client = K8sEventsClient(config)
-    aks_client = AzureAksClient(config)
-    thresholds = get_thresholds()
+    events_client = shared_client(K8sEventsClient, config)
+    aks_client = shared_client(AzureAksClient, config)
+    if thresholds is None:
+        thresholds = get_thresholds()
     errors: list[ToolError] = []
 
-    # Get current run events
-    node_events = await events_client.get_node_events(reasons=["NodeUpgrade", "NodeReady"])
+    # Note 12: The current-run node events and the historical Activity Log records come from
+    # Note 13: different APIs and do not depend on each other, so both requests are issued
+    # Note 14: together and the handler waits for the slower one rather than their sum.
+    # Note 15: return_exceptions=True keeps an Activity Log failure from discarding the events.
+    results = await asyncio.gather(
+        events_client.get_node_events(reasons=UPGRADE_EVENT_REASONS),
+        aks_client.get_activity_log_upgrades(count=history_count),
+        return_exceptions=True,
+    )
+    events_result, activity_result = results
+    # Without the node events there is no current run to report, so that failure still propagates.
+    if isinstance(events_result, BaseException):
+        raise events_result
+    node_events = events_result
+    # Note 16: The clock is read once, after the API calls return, so the elapsed time and the
+    # Note 17: report timestamp describe the same instant.
+    now = datetime.now(tz=UTC)
 
-    # Note 9: Two separate dicts track the earliest NodeUpgrade and latest
-    # Note 10: NodeReady timestamp per node. Using dicts keyed by node name
-    # Note 11: makes the subsequent pairing O(1) per lookup rather than O(n).
+    # Note 18: A single dict keyed by node name tracks [earliest NodeUpgrade, latest NodeReady]
+    # Note 19: per node, so each event costs one lookup and the pairing needs no second dict.
     # Pair NodeUpgrade → NodeReady per node to get per-node durations
-    upgrade_times: dict[str, datetime] = {}
-    ready_times: dict[str, datetime] = {}
+    node_state: dict[str, list[datetime | None]] = {}
+    # Note 20: The bound lookups are hoisted out of the per-event loop so each iteration
+    # Note 21: skips the attribute resolution on the dicts.
+    slot_for = _EVENT_SLOTS.get
+    state_for = node_state.get
     for evt in node_events:
-        node_name = evt.get("node_name", "")
+        slot = slot_for(evt.get("reason"))
+        if slot is None:
+            continue
+        # An event without a node name cannot be paired, rather than being pooled under "".
+        node_name = evt.get("node_name")
+        if not node_name:
+            continue
         ts = _parse_ts(evt.get("timestamp"))
         if not ts:
             continue
-        # Note 12: For NodeUpgrade we keep the EARLIEST timestamp because a node
-        # Note 13: may emit multiple upgrade events; the first one marks when
-        # Note 14: Kubernetes actually began draining the node.
-        if evt["reason"] == "NodeUpgrade":
-            if node_name not in upgrade_times or ts < upgrade_times[node_name]:
-                upgrade_times[node_name] = ts
-        # Note 15: For NodeReady we keep the LATEST timestamp -- after a reboot
-        # Note 16: kubelet can fire several NodeReady events as conditions stabilise;
-        # Note 17: the last one is when the node was truly healthy and rejoined scheduling.
-        elif evt["reason"] == "NodeReady" and (node_name not in ready_times or ts > ready_times[node_name]):
-            ready_times[node_name] = ts
+        state = state_for(node_name)
+        if state is None:
+            state = node_state[node_name] = [None, None]
+        current = state[slot]
+        # Note 22: For NodeUpgrade we keep the EARLIEST timestamp because a node
+        # Note 23: may emit multiple upgrade events; the first one marks when
+        # Note 24: Kubernetes actually began draining the node.
+        # Note 25: For NodeReady we keep the LATEST timestamp -- after a reboot
+        # Note 26: kubelet can fire several NodeReady events as conditions stabilise;
+        # Note 27: the last one is when the node was truly healthy and rejoined scheduling.
+        if current is None or (ts < current if slot == 0 else ts > current):
+            state[slot] = ts
 
     # Calculate per-node durations for completed nodes
-    completed_durations: dict[str, float] = {}
-    for node_name, start_ts in upgrade_times.items():
-        end_ts = ready_times.get(node_name)
-        # Note 18: The guard `end_ts > start_ts` filters out event ordering
-        # Note 19: anomalies where a stale NodeReady precedes the upgrade event,
-        # Note 20: which would produce a negative (nonsensical) duration.
-        if end_ts and end_ts > start_ts:
-            completed_durations[node_name] = (end_ts - start_ts).total_seconds()
+    # Note 28: The guard `end_ts > start_ts` filters out event ordering
+    # Note 29: anomalies where a stale NodeReady precedes the upgrade event,
+    # Note 30: which would produce a negative (nonsensical) duration.
+    upgrade_starts = [start_ts for start_ts, _ in node_state.values() if start_ts is not None]
+    completed_durations = {
+        node_name: (end_ts - start_ts).total_seconds()
+        for node_name, (start_ts, end_ts) in node_state.items()
+        if start_ts is not None and end_ts is not None and end_ts > start_ts
+    }
 
     current_run: CurrentRunMetrics | None = None
     if completed_durations:
-        durations = list(completed_durations.values())
-        mean_per_node = sum(durations) / len(durations)
-        nodes_in_progress = len(upgrade_times) - len(completed_durations)
-        # Note 21: estimated_remaining is None when all nodes are already done;
-        # Note 22: multiplying by zero would be misleading because the upgrade
-        # Note 23: is complete, not estimated to take zero seconds.
+        # Note 31: One pass over the completed nodes accumulates the total and tracks the
+        # Note 32: fastest and slowest node together, instead of copying the durations into a
+        # Note 33: list and then walking them three more times for sum(), min() and max().
+        # Note 34: The `<` / `>=` comparisons keep the tie order of the previous stable sort:
+        # Note 35: the first of several equal durations is fastest, the last is slowest.
+        items = iter(completed_durations.items())
+        fastest, total = next(items)
+        slowest = fastest
+        fastest_s = slowest_s = total
+        for node_name, seconds in items:
+            total += seconds
+            if seconds < fastest_s:
+                fastest, fastest_s = node_name, seconds
+            if seconds >= slowest_s:
+                slowest, slowest_s = node_name, seconds
+        mean_per_node = total / len(completed_durations)
+        nodes_in_progress = len(upgrade_starts) - len(completed_durations)
+        # Note 36: estimated_remaining is None when all nodes are already done;
+        # Note 37: multiplying by zero would be misleading because the upgrade
+        # Note 38: is complete, not estimated to take zero seconds.
         estimated_remaining = mean_per_node * nodes_in_progress if nodes_in_progress > 0 else None
 
         # Wall-clock elapsed from earliest NodeUpgrade event to now
-        # Note 24: min(upgrade_times.values()) finds the earliest start across ALL
-        # Note 25: nodes, giving the true wall-clock start of the overall upgrade.
-        # Note 26: Wall-clock elapsed differs from mean per-node: it measures the
-        # Note 27: real time a human operator has been waiting (including any overlap
-        # Note 28: of nodes upgrading in parallel), while mean per-node measures the
-        # Note 29: average individual node cost and drives the remaining estimate.
-        earliest_start = min(upgrade_times.values())
-        wall_clock_elapsed = (datetime.now(tz=UTC) - earliest_start).total_seconds()
-
-        # Note 30: sorted() on (name, duration) tuples sorts by duration (index 1)
-        # Note 31: ascending, so index [0] is the fastest node and index [-1] is the
-        # Note 32: slowest; negative indexing is idiomatic Python for the last item.
-        sorted_nodes = sorted(completed_durations.items(), key=lambda x: x[1])
-        fastest = sorted_nodes[0][0] if sorted_nodes else None
-        slowest = sorted_nodes[-1][0] if sorted_nodes else None
+        # Note 39: min(upgrade_starts) finds the earliest start across ALL
+        # Note 40: nodes, giving the true wall-clock start of the overall upgrade.
+        # Note 41: Wall-clock elapsed differs from mean per-node: it measures the
+        # Note 42: real time a human operator has been waiting (including any overlap
+        # Note 43: of nodes upgrading in parallel), while mean per-node measures the
+        # Note 44: average individual node cost and drives the remaining estimate.
+        earliest_start = min(upgrade_starts)
+        wall_clock_elapsed = (now - earliest_start).total_seconds()
 
         current_run = CurrentRunMetrics(
             elapsed_seconds=wall_clock_elapsed,
             estimated_remaining_seconds=estimated_remaining,
             nodes_completed=len(completed_durations),
-            nodes_total=len(upgrade_times),
+            nodes_total=len(upgrade_starts),
             mean_seconds_per_node=mean_per_node,
             slowest_node=slowest,
             fastest_node=fastest,
         )
 
     # Get historical data from Activity Log
-    try:
-        activity_records = await aks_client.get_activity_log_upgrades(count=history_count)
-    except Exception:
-        activity_records = []
+    activity_records: list[dict[str, Any]] = []
+    if isinstance(activity_result, BaseException):
         errors.append(
             ToolError(
                 error="Failed to retrieve historical upgrade data",
@@ -125,43 +172,51 @@ async def get_upgrade_metrics_handler(
                 partial_data=True,
             )
         )
+    else:
+        activity_records = activity_result
 
     historical: list[HistoricalUpgradeRecord] = []
+    # Note 45: The durations for the statistics are collected while the records are built,
+    # Note 46: rather than by a second pass over `historical` afterwards. They are read back
+    # Note 47: from the validated model so they carry the same coerced float value it reports.
+    all_durations: list[float] = []
     for record in activity_records:
         duration = record.get("duration_seconds")
         if duration is not None:
-            historical.append(
-                HistoricalUpgradeRecord(
-                    date=record.get("date", "unknown"),
-                    version_path=record.get("description", "unknown"),
-                    total_duration_seconds=duration,
-                    node_count=0,  # Activity log doesn't give per-node detail
-                    min_per_node_seconds=0,
-                    max_per_node_seconds=0,
-                )
+            upgrade_record = HistoricalUpgradeRecord(
+                date=record.get("date", "unknown"),
+                version_path=record.get("description", "unknown"),
+                total_duration_seconds=duration,
+                node_count=0,  # Activity log doesn't give per-node detail
+                min_per_node_seconds=0,
+                max_per_node_seconds=0,
             )
+            historical.append(upgrade_record)
+            all_durations.append(upgrade_record.total_duration_seconds)
 
     # Statistical summary
     stats: HistoricalStats | None = None
-    if historical:
-        all_durations = [h.total_duration_seconds for h in historical]
-        all_durations.sort()
-        mean_dur = sum(all_durations) / len(all_durations)
-        # Note 33: P90 index is computed as int(len * 0.9), which is a floor
-        # Note 34: division into the sorted list. For example, with 10 items the
-        # Note 35: index is 9 (the last element), meaning 90% of values are at or
-        # Note 36: below that point. The min(..., len - 1) clamp prevents an off-
-        # Note 37: by-one IndexError when the list is very short (e.g. 1 element).
-        p90_idx = int(len(all_durations) * 0.9)
-        p90_dur = all_durations[min(p90_idx, len(all_durations) - 1)]
-        # Note 38: The threshold is stored in minutes (human-readable config) but
-        # Note 39: durations are in seconds, so * 60 converts to the same unit
-        # Note 40: before the comparison.
+    if all_durations:
+        n_durations = len(all_durations)
+        mean_dur = sum(all_durations) / n_durations
+        # Note 48: P90 index is computed as int(len * 0.9), which is a floor
+        # Note 49: division into the sorted order. For example, with 10 items the
+        # Note 50: index is 9 (the last element), meaning 90% of values are at or
+        # Note 51: below that point. The min(..., len - 1) clamp prevents an off-
+        # Note 52: by-one IndexError when the list is very short (e.g. 1 element).
+        # Note 53: Only the values at or above that index matter, so heapq.nlargest keeps
+        # Note 54: the top `len - index` durations in a bounded heap, O(n log k) rather than
+        # Note 55: sorting everything; the smallest of them is the P90 value.
+        p90_idx = min(int(n_durations * 0.9), n_durations - 1)
+        p90_dur = min(heapq.nlargest(n_durations - p90_idx, all_durations))
+        # Note 56: The threshold is stored in minutes (human-readable config) but
+        # Note 57: durations are in seconds, so * 60 converts to the same unit
+        # Note 58: before the comparison.
         baseline_seconds = thresholds.upgrade_anomaly_minutes * 60
-        # Note 41: all_within_baseline is True only when EVERY historical duration
-        # Note 42: is under the threshold -- a single outlier flips it to False.
-        # Note 43: This is stricter than a "usually within baseline" check, giving
-        # Note 44: the operator a clear signal that the cluster has been consistent.
+        # Note 59: all_within_baseline is True only when EVERY historical duration
+        # Note 60: is under the threshold -- a single outlier flips it to False.
+        # Note 61: This is stricter than a "usually within baseline" check, giving
+        # Note 62: the operator a clear signal that the cluster has been consistent.
         all_within = all(d <= baseline_seconds for d in all_durations)
 
         stats = HistoricalStats(
@@ -173,11 +228,11 @@ async def get_upgrade_metrics_handler(
     # Anomaly flag
     anomaly_flag: str | None = None
     if current_run:
-        # Note 45: estimated_total projects the final upgrade cost by adding the
-        # Note 46: already-elapsed seconds to the remaining estimate. This means the
-        # Note 47: flag can fire before the upgrade finishes -- early warning is more
-        # Note 48: useful than a post-mortem alert. The formula is:
-        # Note 49:   estimated_total = elapsed + estimated_remaining
+        # Note 63: estimated_total projects the final upgrade cost by adding the
+        # Note 64: already-elapsed seconds to the remaining estimate. This means the
+        # Note 65: flag can fire before the upgrade finishes -- early warning is more
+        # Note 66: useful than a post-mortem alert. The formula is:
+        # Note 67:   estimated_total = elapsed + estimated_remaining
         # Estimate total duration
         estimated_total = current_run.elapsed_seconds
         if current_run.estimated_remaining_seconds:
@@ -213,7 +268,7 @@ async def get_upgrade_metrics_handler(
         stats=stats,
         anomaly_flag=anomaly_flag,
         summary="; ".join(parts),
-        timestamp=datetime.now(tz=UTC).isoformat(),
+        timestamp=now.isoformat(),
         errors=errors,
     )
 
@@ -223,17 +278,21 @@ async def get_upgrade_metrics_all(
     history_count: int = 5,
 ) -> list[UpgradeDurationOutput]:
     """Fan-out get_upgrade_duration_metrics to all clusters concurrently."""
-    # Note 50: asyncio.gather launches all per-cluster coroutines concurrently so
-    # Note 51: network latency for N clusters is paid once in parallel rather than
-    # Note 52: N times sequentially. return_exceptions=True prevents one failing
-    # Note 53: cluster from cancelling the rest; failures are handled in the loop.
-    tasks = [get_upgrade_metrics_handler(cid, node_pool, history_count) for cid in ALL_CLUSTER_IDS]
-    results = await asyncio.gather(*tasks, return_exceptions=True)
+    # Note 68: Thresholds are rebuilt from environment variables on each call, so they are
+    # Note 69: resolved once here and shared by every cluster's handler.
+    thresholds = get_thresholds()
+    tasks = [get_upgrade_metrics_handler(cid, node_pool, history_count, thresholds) for cid in ALL_CLUSTER_IDS]
+    # Note 70: gather_bounded runs the per-cluster coroutines concurrently, so network latency
+    # Note 71: for N clusters is paid in parallel rather than N times sequentially, but keeps at
+    # Note 72: most PLATFORM_MCP_FANOUT_CONCURRENCY in flight so a large fleet does not trip ARM
+    # Note 73: or API server throttling. A failing cluster comes back as an exception object
+    # Note 74: instead of cancelling the rest; failures are handled in the loop.
+    results = await gather_bounded(tasks)
     outputs: list[UpgradeDurationOutput] = []
-    # Note 54: zip(..., strict=True) enforces that ALL_CLUSTER_IDS and results have
-    # Note 55: the same length at runtime; a mismatch would indicate a programming
-    # Note 56: error and raises ValueError immediately rather than silently dropping
-    # Note 57: items, which would produce misleading output.
+    # Note 75: zip(..., strict=True) enforces that ALL_CLUSTER_IDS and results have
+    # Note 76: the same length at runtime; a mismatch would indicate a programming
+    # Note 77: error and raises ValueError immediately rather than silently dropping
+    # Note 78: items, which would produce misleading output.
     for cid, result in zip(ALL_CLUSTER_IDS, results, strict=True):
         if isinstance(result, BaseException):
             log.error("fan_out_cluster_failed", tool="get_upgrade_duration_metrics", cluster=cid, error=str(result))
@@ -3,14 +3,17 @@
 from __future__ import annotations
 
 import asyncio
+import heapq
+from collections import Counter
 from datetime import UTC, datetime
 from typing import Any, Literal
 
 import structlog
 
+from platform_mcp_server.clients import shared_client
 from platform_mcp_server.clients.azure_aks import AzureAksClient
 from platform_mcp_server.clients.k8s_core import K8sCoreClient
-from platform_mcp_server.clients.k8s_events import K8sEventsClient
+from platform_mcp_server.clients.k8s_events import UPGRADE_EVENT_REASONS, K8sEventsClient
 from platform_mcp_server.clients.k8s_policy import K8sPolicyClient
 from platform_mcp_server.config import ALL_CLUSTER_IDS, get_thresholds, resolve_cluster
 from platform_mcp_server.models import (
@@ -20,8 +23,8 @@ from platform_mcp_server.models import (
     ToolError,
     UpgradeProgressOutput,
 )
-from platform_mcp_server.tools.pod_classification import categorize_failure, is_unhealthy
-from platform_mcp_server.utils import parse_iso_timestamp
+from platform_mcp_server.tools.pod_classification import classify_pod
+from platform_mcp_server.utils import gather_bounded, parse_iso_timestamp
 from platform_mcp_server.validation import validate_node_pool
 
 log = structlog.get_logger()
@@ -31,69 +34,68 @@ log = structlog.get_logger()
 # Note 3: because this summary is supplementary context during an upgrade -- the
 # Note 4: operator primarily cares about node states, not an exhaustive pod list.
 _POD_TRANSITION_CAP = 20
-_ACTIVE_UPGRADE_STATES = {"cordoned", "upgrading", "pdb_blocked", "stalled"}
+_ACTIVE_UPGRADE_STATES = frozenset({"cordoned", "upgrading", "pdb_blocked", "stalled"})
+# Per-node pod lists issued inside one cluster. Deliberately independent of
+# PLATFORM_MCP_FANOUT_CONCURRENCY, which sizes the cross-cluster fan-out.
+_NODE_POD_LIST_CONCURRENCY = 4
 
 
 _parse_event_timestamp = parse_iso_timestamp
 
 
-# Note 10: The return type uses Literal to enumerate all six valid states as
-# Note 11: strings. This lets type checkers (mypy/pyright) catch any call site
-# Note 12: that compares against a state string not in the allowed set.
+# Note 5: The return type uses Literal to enumerate all six valid states as
+# Note 6: strings. This lets type checkers (mypy/pyright) catch any call site
+# Note 7: that compares against a state string not in the allowed set.
 def _classify_node_state(
     node: dict[str, Any],
     target_version: str,
-    node_events: dict[str, list[dict[str, Any]]],
-    pdb_blockers: set[str],
-    upgrade_start: datetime | None,
-    thresholds_minutes: int,
+    upgraded_nodes: set[str],
+    ready_nodes: set[str],
+    pdb_blockers: frozenset[str],
+    past_threshold: bool,
 ) -> Literal["upgraded", "upgrading", "cordoned", "pdb_blocked", "pending", "stalled"]:
     """Classify a node into one of the six upgrade states."""
     name = node["name"]
     version = node.get("version", "").lstrip("v")
     unschedulable = node.get("unschedulable", False)
 
-    events = node_events.get(name, [])
-    has_upgrade_event = any(e["reason"] == "NodeUpgrade" for e in events)
-    has_ready_event = any(e["reason"] == "NodeReady" for e in events)
+    has_upgrade_event = name in upgraded_nodes
+    has_ready_event = name in ready_nodes
 
-    # Note 13: The "upgraded" check comes first because it is the terminal state.
-    # Note 14: A node that has both events and the right version is definitively done;
-    # Note 15: checking it first avoids accidentally classifying it as "upgrading".
+    # Note 8: The "upgraded" check comes first because it is the terminal state.
+    # Note 9: A node that has both events and the right version is definitively done;
+    # Note 10: checking it first avoids accidentally classifying it as "upgrading".
     # Upgraded: has NodeReady after NodeUpgrade and version matches target
     if has_upgrade_event and has_ready_event and version == target_version:
         return "upgraded"
 
-    # Note 16: The "upgrading" branch is entered only when NodeUpgrade fired but
-    # Note 17: NodeReady has not yet, meaning the node is mid-process. Within that
-    # Note 18: branch, stall and PDB checks come before the plain "upgrading" return
-    # Note 19: because they are more specific conditions that need to surface first.
+    # Note 11: The "upgrading" branch is entered only when NodeUpgrade fired but
+    # Note 12: NodeReady has not yet, meaning the node is mid-process. Within that
+    # Note 13: branch, stall and PDB checks come before the plain "upgrading" return
+    # Note 14: because they are more specific conditions that need to surface first.
     # Upgrading: has NodeUpgrade event but not yet NodeReady
     if has_upgrade_event and not has_ready_event:
         # Check if stalled first
-        if upgrade_start:
-            # Note 20: thresholds_minutes is stored in minutes (human-readable config);
-            # Note 21: dividing total_seconds() by 60 converts to the same unit for
-            # Note 22: the comparison. The threshold is the upgrade_anomaly_minutes value.
-            elapsed_minutes = (datetime.now(tz=UTC) - upgrade_start).total_seconds() / 60
-            if elapsed_minutes > thresholds_minutes:
-                # Note 23: pdb_blockers is a set of PDB names, giving O(1) membership
-                # Note 24: tests. When the upgrade has exceeded the time threshold AND
-                # Note 25: a PDB is blocking AND the node is cordoned, the delay is
-                # Note 26: informational (expected PDB behavior) rather than a true stall.
-                if pdb_blockers and unschedulable:
-                    return "pdb_blocked"
-                return "stalled"
+        # Note 15: past_threshold depends only on the upgrade start and the snapshot time,
+        # Note 16: so the handler works it out once for the whole wave rather than per node.
+        if past_threshold:
+            # Note 17: pdb_blockers is the read-only set of blocking PDB names; only its
+            # Note 18: emptiness matters here. When the upgrade has exceeded the time threshold AND
+            # Note 19: a PDB is blocking AND the node is cordoned, the delay is
+            # Note 20: informational (expected PDB behavior) rather than a true stall.
+            if pdb_blockers and unschedulable:
+                return "pdb_blocked"
+            return "stalled"
         # PDB blocked: actively upgrading, cordoned, and PDB blocking drain
         if unschedulable and pdb_blockers:
             return "pdb_blocked"
         return "upgrading"
 
-    # Note 27: "cordoned" is checked after the upgrading branch because a node with
-    # Note 28: a NodeUpgrade event is always at least "upgrading", not merely "cordoned".
-    # Note 29: Reaching this branch means the node has no NodeUpgrade event, so
-    # Note 30: being unschedulable indicates it was cordoned in preparation but the
-    # Note 31: upgrade event has not fired yet.
+    # Note 21: "cordoned" is checked after the upgrading branch because a node with
+    # Note 22: a NodeUpgrade event is always at least "upgrading", not merely "cordoned".
+    # Note 23: Reaching this branch means the node has no NodeUpgrade event, so
+    # Note 24: being unschedulable indicates it was cordoned in preparation but the
+    # Note 25: upgrade event has not fired yet.
     # Cordoned: unschedulable but no NodeUpgrade event yet
     if unschedulable:
         return "cordoned"
@@ -109,21 +111,39 @@ async def _collect_pod_transitions(
     cluster_id: str,
 ) -> PodTransitionSummary:
     """Collect pod transitions on nodes actively involved in the upgrade."""
-    # Note 32: active_node_names uses a set comprehension so membership tests
-    # Note 33: against it later are O(1) instead of O(n) for a list.
+    # Note 26: active_node_names uses a set comprehension so each node name appears
+    # Note 27: once and is queried once below, however the node list was assembled.
     # Identify nodes in active upgrade states
     active_node_names = {n.name for n in node_states if n.state in _ACTIVE_UPGRADE_STATES}
 
-    # Note 34: The early return here is a short-circuit guard: if no node is in
-    # Note 35: an active upgrade state there is nothing to report, and the
-    # Note 36: expensive pod-list API call should be skipped entirely. Returning
-    # Note 37: an empty PodTransitionSummary() keeps the return type consistent.
+    # Note 28: The early return here is a short-circuit guard: if no node is in
+    # Note 29: an active upgrade state there is nothing to report, and the
+    # Note 30: pod-list API calls should be skipped entirely. Returning
+    # Note 31: an empty PodTransitionSummary() keeps the return type consistent.
     if not active_node_names:
         return PodTransitionSummary()
 
-    try:
-        all_pods = await core_client.get_pods()
-    except Exception:
+    # Note 32: Rather than listing every pod in the cluster and discarding those on other
+    # Note 33: nodes, each active node gets its own spec.nodeName field selector so the API
+    # Note 34: server only returns pods on nodes being upgraded. A surge upgrade touches a
+    # Note 35: handful of nodes at a time, so the bounded fan-out stays small. Sorting the
+    # Note 36: names keeps the flattened pod order (and so the reported list) deterministic.
+    # The per-node lists bypass the LIST cache (see get_pods_on_node) and use this module's own
+    # limit. No deadline of their own is set: under get_upgrade_progress_all, the outer
+    # per-cluster fan-out deadline is what bounds them.
+    node_pod_lists = await gather_bounded(
+        (core_client.get_pods_on_node(name) for name in sorted(active_node_names)),
+        limit=_NODE_POD_LIST_CONCURRENCY,
+        timeout=0,
+    )
+    active_pods: list[dict[str, Any]] = []
+    failed_nodes = 0
+    for pods_or_exc in node_pod_lists:
+        if isinstance(pods_or_exc, BaseException):
+            failed_nodes += 1
+            continue
+        active_pods.extend(pods_or_exc)
+    if failed_nodes:
         errors.append(
             ToolError(
                 error="Failed to retrieve pods for transition summary",
@@ -132,32 +152,38 @@ async def _collect_pod_transitions(
                 partial_data=True,
             )
         )
-        return PodTransitionSummary()
-
-    # Filter to unhealthy pods on active upgrade nodes
-    affected = [p for p in all_pods if p.get("node_name") in active_node_names and is_unhealthy(p)]
-
-    pending_count = sum(1 for p in affected if p.get("phase") == "Pending")
-    failed_count = sum(1 for p in affected if p.get("phase") in ("Failed", "Unknown"))
-    # Include running pods with bad container states in failed count
-    other_unhealthy = len(affected) - pending_count - failed_count
-    failed_count += other_unhealthy
-
-    # Group by failure category
-    by_category: dict[str, int] = {}
-    for pod in affected:
-        category = categorize_failure(pod.get("reason"), pod.get("container_statuses", []))
-        by_category[category] = by_category.get(category, 0) + 1
-
-    # Note 38: phase_order maps phase strings to integers so the sort key is
-    # Note 39: a cheap integer comparison rather than a string comparison.
-    # Note 40: Failed pods sort first (0) because they are the highest-severity
-    # Note 41: signal during an upgrade; Pending pods (2) are expected churn.
-    # Note 42: Phases not in the dict get a default of 3 and sort last, keeping
-    # Note 43: them out of the way without requiring an exhaustive mapping.
+        if failed_nodes == len(node_pod_lists):
+            return PodTransitionSummary()
+
+    # Note 37: One pass keeps the unhealthy pods on active upgrade nodes and tallies their
+    # Note 38: phase and failure category as it goes. classify_pod answers both "unhealthy?"
+    # Note 39: and "which category?" from a single walk over each pod's container statuses.
+    affected: list[dict[str, Any]] = []
+    pending_count = 0
+    by_category: Counter[str] = Counter()
+    for pod in active_pods:
+        classification = classify_pod(pod)
+        if not classification.unhealthy:
+            continue
+        affected.append(pod)
+        if pod.get("phase") == "Pending":
+            pending_count += 1
+        by_category[classification.category] += 1
+    # Failed and Unknown pods, plus running pods with bad container states, all count as failed
+    failed_count = len(affected) - pending_count
+
+    # Note 40: phase_order maps phase strings to integers so the sort key is
+    # Note 41: a cheap integer comparison rather than a string comparison.
+    # Note 42: Failed pods sort first (0) because they are the highest-severity
+    # Note 43: signal during an upgrade; Pending pods (2) are expected churn.
+    # Note 44: Phases not in the dict get a default of 3 and sort last, keeping
+    # Note 45: them out of the way without requiring an exhaustive mapping.
+    # Note 46: Only the first _POD_TRANSITION_CAP pods in that order are reported, so
+    # Note 47: heapq.nsmallest selects them in O(n log k) instead of sorting every affected
+    # Note 48: pod. Like a stable sort, it keeps equal-phase pods in their original order.
     # Sort: Failed first, then Pending
     phase_order = {"Failed": 0, "Unknown": 1, "Pending": 2}
-    affected.sort(key=lambda p: phase_order.get(p.get("phase", ""), 3))
+    reported = heapq.nsmallest(_POD_TRANSITION_CAP, affected, key=lambda p: phase_order.get(p.get("phase", ""), 3))
 
     # Build affected pod list (capped)
     affected_pods = [
@@ -168,7 +194,7 @@ async def _collect_pod_transitions(
             reason=p.get("reason"),
             node_name=p.get("node_name"),
         )
-        for p in affected[:_POD_TRANSITION_CAP]
+        for p in reported
     ]
 
     return PodTransitionSummary(
@@ -187,10 +213,10 @@ async def get_upgrade_progress_handler(
     """Core handler for get_upgrade_progress on a single cluster."""
     validate_node_pool(node_pool)
     config = resolve_cluster(cluster_id)
-    aks_client = AzureAksClient(config)
-    core_client = K8sCoreClient(config)
-    events_client = K8sEventsClient(config)
-    policy_client = K8sPolicyClient(config)
+    aks_client = shared_client(AzureAksClient, config)
+    core_client = shared_client(K8sCoreClient, config)
+    events_client = shared_client(K8sEventsClient, config)
+    policy_client = shared_client(K8sPolicyClient, config)
     thresholds = get_thresholds()
     errors: list[ToolError] = []
 
@@ -214,16 +240,20 @@ async def get_upgrade_progress_handler(
         )
 
     # Check if any pool is upgrading
-    upgrading_pools = [
-        p
-        for p in cluster_info.get("node_pools", [])
-        if p.get("provisioning_state") == "Upgrading" or p.get("current_version") != p.get("target_version")
-    ]
-
-    if node_pool:
-        upgrading_pools = [p for p in upgrading_pools if p["name"] == node_pool]
+    # Note 49: Only the first upgrading pool (matching node_pool, if given) is reported, so
+    # Note 50: next() over a generator applies both filters in one pass and stops at the first
+    # Note 51: match instead of building the full list of upgrading pools.
+    target_pool = next(
+        (
+            p
+            for p in cluster_info.get("node_pools", [])
+            if (p.get("provisioning_state") == "Upgrading" or p.get("current_version") != p.get("target_version"))
+            and (not node_pool or p["name"] == node_pool)
+        ),
+        None,
+    )
 
-    if not upgrading_pools:
+    if target_pool is None:
         return UpgradeProgressOutput(
             cluster=cluster_id,
             upgrade_in_progress=False,
@@ -233,50 +263,111 @@ async def get_upgrade_progress_handler(
             errors=errors,
         )
 
-    target_pool = upgrading_pools[0]
     target_version = target_pool.get("target_version", "unknown")
 
-    # Get nodes and events
-    nodes = await core_client.get_nodes()
+    # Note 52: Nodes, node events and PDBs come from independent API calls, so they are
+    # Note 53: issued together once cluster_info has confirmed an upgrade is running and the
+    # Note 54: handler waits for the slowest rather than their sum. They are not started
+    # Note 55: alongside cluster_info because idle clusters, the common case in a fan-out,
+    # Note 56: return above without needing any of them.
+    results = await asyncio.gather(
+        core_client.get_nodes(),
+        events_client.get_node_events(reasons=UPGRADE_EVENT_REASONS),
+        policy_client.get_pdbs(),
+        return_exceptions=True,
+    )
+    nodes_result, events_result, pdbs_result = results
+    # Note 57: "now" is read once, as soon as the snapshot has arrived, so every node's stall
+    # Note 58: check, the elapsed time and the output timestamp describe the same instant.
+    now = datetime.now(tz=UTC)
+    # Without the node list there is nothing to report progress on, so that failure propagates.
+    if isinstance(nodes_result, BaseException):
+        raise nodes_result
+    nodes = nodes_result
     if node_pool:
         nodes = [n for n in nodes if n.get("pool") == node_pool]
 
-    node_events_list = await events_client.get_node_events(reasons=["NodeUpgrade", "NodeReady", "NodeNotReady"])
-
-    # Group events by node
-    node_events: dict[str, list[dict[str, Any]]] = {}
+    node_events_list: list[dict[str, Any]] = []
+    if isinstance(events_result, BaseException):
+        errors.append(
+            ToolError(
+                error="Failed to retrieve node events; upgrade states may be incomplete",
+                source="events-api",
+                cluster=cluster_id,
+                partial_data=True,
+            )
+        )
+    else:
+        node_events_list = events_result
+
+    # Note 59: Classification only asks whether a node has seen a NodeUpgrade and a NodeReady
+    # Note 60: event, so one pass over the events records the node names for each reason and
+    # Note 61: every per-node check becomes a set membership test instead of a list scan.
+    upgraded_nodes: set[str] = set()
+    ready_nodes: set[str] = set()
     for evt in node_events_list:
-        node_name = evt.get("node_name", "")
-        if node_name not in node_events:
-            node_events[node_name] = []
-        node_events[node_name].append(evt)
+        reason = evt["reason"]
+        if reason == "NodeUpgrade":
+            upgraded_nodes.add(evt.get("node_name", ""))
+        elif reason == "NodeReady":
+            ready_nodes.add(evt.get("node_name", ""))
 
     # Get PDB blockers
-    pdbs = await policy_client.get_pdbs()
+    pdbs: list[dict[str, Any]] = []
+    if isinstance(pdbs_result, BaseException):
+        errors.append(
+            ToolError(
+                error="Failed to retrieve PDBs; PDB-blocked nodes may be reported as upgrading or stalled",
+                source="k8s-api",
+                cluster=cluster_id,
+                partial_data=True,
+            )
+        )
+    else:
+        pdbs = pdbs_result
     blocker_list = await policy_client.evaluate_pdb_satisfiability(pdbs)
-    # Note 44: pdb_blocker_names is a set so that _classify_node_state can test
-    # Note 45: membership in O(1). Converting from the list here, once, avoids
-    # Note 46: repeating the conversion inside the per-node classification loop.
-    pdb_blocker_names = {b["name"] for b in blocker_list}
-
-    # Note 47: upgrade_start is the EARLIEST NodeUpgrade event across ALL nodes,
-    # Note 48: not per-node. This single timestamp represents when the overall
-    # Note 49: upgrade wave began and is used to compute total elapsed time for
-    # Note 50: the anomaly threshold check, independent of individual node timing.
+    # Note 62: pdb_blocker_names is built once here rather than inside the per-node
+    # Note 63: classification loop, and as a frozenset, like the module-level state and
+    # Note 64: reason constants, because nothing downstream is meant to modify it.
+    pdb_blocker_names = frozenset(b["name"] for b in blocker_list)
+
+    # Note 65: upgrade_start is the EARLIEST NodeUpgrade event across ALL nodes,
+    # Note 66: not per-node. This single timestamp represents when the overall
+    # Note 67: upgrade wave began and is used to compute total elapsed time for
+    # Note 68: the anomaly threshold check, independent of individual node timing.
     # Find upgrade start time from earliest NodeUpgrade event
-    upgrade_start: datetime | None = None
-    for events_for_node in node_events.values():
-        for evt in events_for_node:
-            if evt["reason"] == "NodeUpgrade":
-                ts = _parse_event_timestamp(evt.get("timestamp"))
-                if ts and (upgrade_start is None or ts < upgrade_start):
-                    upgrade_start = ts
+    # Note 69: min() over a generator keeps the running minimum in C; the flat event list
+    # Note 70: needs no per-node grouping or nested loop.
+    upgrade_start: datetime | None = min(
+        (
+            ts
+            for evt in node_events_list
+            if evt["reason"] == "NodeUpgrade" and (ts := _parse_event_timestamp(evt.get("timestamp"))) is not None
+        ),
+        default=None,
+    )
+
+    # Note 71: The elapsed time is computed before classification because the stall check
+    # Note 72: and the anomaly flag below both compare it with upgrade_anomaly_minutes,
+    # Note 73: converted here to seconds to match total_seconds().
+    elapsed_seconds: float | None = None
+    if upgrade_start:
+        elapsed_seconds = (now - upgrade_start).total_seconds()
+    past_threshold = elapsed_seconds is not None and elapsed_seconds > thresholds.upgrade_anomaly_minutes * 60
 
     # Classify each node
     node_states: list[NodeUpgradeState] = []
+    # Note 74: States are tallied as nodes are classified, so the upgraded count and the
+    # Note 75: PDB-block check below are lookups rather than further scans of node_states.
+    state_counts: Counter[str] = Counter()
     for node in nodes:
         state = _classify_node_state(
-            node, target_version, node_events, pdb_blocker_names, upgrade_start, thresholds.upgrade_anomaly_minutes
+            node,
+            target_version,
+            upgraded_nodes,
+            ready_nodes,
+            pdb_blocker_names,
+            past_threshold,
         )
 
         blocking_pdb = None
@@ -289,6 +380,7 @@ async def get_upgrade_progress_handler(
             blocking_pdb = chosen["name"]
             blocking_pdb_ns = chosen.get("namespace")
 
+        state_counts[state] += 1
         node_states.append(
             NodeUpgradeState(
                 name=node["name"],
@@ -300,36 +392,30 @@ async def get_upgrade_progress_handler(
         )
 
     # Compute stats
-    upgraded_count = sum(1 for n in node_states if n.state == "upgraded")
+    upgraded_count = state_counts["upgraded"]
     total_count = len(node_states)
     remaining = total_count - upgraded_count
 
     # Duration estimation
-    elapsed_seconds: float | None = None
     estimated_remaining: float | None = None
-    if upgrade_start:
-        elapsed_seconds = (datetime.now(tz=UTC) - upgrade_start).total_seconds()
-        if upgraded_count > 0 and remaining > 0:
-            mean_per_node = elapsed_seconds / upgraded_count
-            # Note 51: estimated_remaining uses linear extrapolation: mean time per
-            # Note 52: completed node multiplied by the number still remaining. This
-            # Note 53: assumes nodes upgrade at a roughly uniform rate, which is a
-            # Note 54: reasonable approximation for homogeneous node pools. Formula:
-            # Note 55:   estimated_remaining = mean_per_node * remaining
-            estimated_remaining = mean_per_node * remaining
-
-    # Note 56: The anomaly flag has two distinct cases: a PDB block is an expected
-    # Note 57: (informational) delay caused by pod disruption budgets preventing drain,
-    # Note 58: while a plain stall with no PDB explanation is a genuine problem.
-    # Note 59: Separating the two cases lets operators distinguish "waiting on PDB"
-    # Note 60: from "something is actually broken", avoiding false alarm escalations.
-    # Note 61: The comparison `elapsed_seconds > thresholds.upgrade_anomaly_minutes * 60`
-    # Note 62: converts the minute-based config threshold to seconds before comparing.
+    if elapsed_seconds is not None and upgraded_count > 0 and remaining > 0:
+        mean_per_node = elapsed_seconds / upgraded_count
+        # Note 76: estimated_remaining uses linear extrapolation: mean time per
+        # Note 77: completed node multiplied by the number still remaining. This
+        # Note 78: assumes nodes upgrade at a roughly uniform rate, which is a
+        # Note 79: reasonable approximation for homogeneous node pools. Formula:
+        # Note 80:   estimated_remaining = mean_per_node * remaining
+        estimated_remaining = mean_per_node * remaining
+
+    # Note 81: The anomaly flag has two distinct cases: a PDB block is an expected
+    # Note 82: (informational) delay caused by pod disruption budgets preventing drain,
+    # Note 83: while a plain stall with no PDB explanation is a genuine problem.
+    # Note 84: Separating the two cases lets operators distinguish "waiting on PDB"
+    # Note 85: from "something is actually broken", avoiding false alarm escalations.
     # Anomaly flagging
     anomaly_flag: str | None = None
-    if elapsed_seconds and elapsed_seconds > thresholds.upgrade_anomaly_minutes * 60:
-        has_pdb_block = any(n.state == "pdb_blocked" for n in node_states)
-        if has_pdb_block:
+    if elapsed_seconds is not None and past_threshold:
+        if state_counts["pdb_blocked"]:
             anomaly_flag = f"Upgrade duration ({int(elapsed_seconds / 60)}m) exceeds baseline but PDB block detected"
         else:
             anomaly_flag = (
@@ -337,10 +423,10 @@ async def get_upgrade_progress_handler(
                 f"{thresholds.upgrade_anomaly_minutes}-minute expected baseline"
             )
 
-    # Note 63: _collect_pod_transitions is called only after node_states is built
-    # Note 64: because it needs the full list to determine which nodes are active.
-    # Note 65: The function itself short-circuits immediately if no active nodes
-    # Note 66: exist, so there is no wasted async call in the quiescent case.
+    # Note 86: _collect_pod_transitions is called only after node_states is built
+    # Note 87: because it needs the full list to determine which nodes are active.
+    # Note 88: The function itself short-circuits immediately if no active nodes
+    # Note 89: exist, so there is no wasted async call in the quiescent case.
     # Pod transition summary
     pod_transitions = await _collect_pod_transitions(core_client, node_states, errors, cluster_id)
 
@@ -363,25 +449,26 @@ async def get_upgrade_progress_handler(
         anomaly_flag=anomaly_flag,
         pod_transitions=pod_transitions,
         summary=summary,
-        timestamp=datetime.now(tz=UTC).isoformat(),
+        timestamp=now.isoformat(),
         errors=errors,
     )
 
 
 async def get_upgrade_progress_all(node_pool: str | None = None) -> list[UpgradeProgressOutput]:
     """Fan-out get_upgrade_progress to all clusters concurrently."""
-    # Note 67: asyncio.gather fires all per-cluster coroutines concurrently,
-    # Note 68: so the total latency is roughly the slowest cluster rather than
-    # Note 69: the sum of all cluster latencies. return_exceptions=True means
-    # Note 70: a single cluster failure does not cancel the remaining tasks.
+    # Note 90: gather_bounded runs the per-cluster coroutines concurrently, so the total
+    # Note 91: latency is roughly the slowest cluster rather than the sum, but keeps at most
+    # Note 92: PLATFORM_MCP_FANOUT_CONCURRENCY clusters in flight: each one issues several API
+    # Note 93: calls, and an unbounded burst across a large fleet invites 429 throttling.
+    # Note 94: A single cluster failure is returned in place and does not cancel the rest.
     tasks = [get_upgrade_progress_handler(cid, node_pool) for cid in ALL_CLUSTER_IDS]
-    results = await asyncio.gather(*tasks, return_exceptions=True)
+    results = await gather_bounded(tasks)
     outputs: list[UpgradeProgressOutput] = []
-    # Note 71: strict=True in zip is a correctness guard -- it raises ValueError
-    # Note 72: if ALL_CLUSTER_IDS and results have different lengths. Since
-    # Note 73: asyncio.gather always returns exactly one result per task, this
-    # Note 74: would only fail if ALL_CLUSTER_IDS was mutated during execution,
-    # Note 75: making strict=True an inexpensive sanity check worth keeping.
+    # Note 95: strict=True in zip is a correctness guard -- it raises ValueError
+    # Note 96: if ALL_CLUSTER_IDS and results have different lengths. Since
+    # Note 97: gather_bounded always returns exactly one result per task, this
+    # Note 98: would only fail if ALL_CLUSTER_IDS was mutated during execution,
+    # Note 99: making strict=True an inexpensive sanity check worth keeping.
     for cid, result in zip(ALL_CLUSTER_IDS, results, strict=True):
         if isinstance(result, BaseException):
             log.error("fan_out_cluster_failed", tool="get_upgrade_progress", cluster=cid, error=str(result))
@@ -2,14 +2,22 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Awaitable, Coroutine, Iterable
 from datetime import datetime
+from functools import lru_cache
 
+from platform_mcp_server.config import get_fanout_concurrency, get_fanout_timeout
 
+
+@lru_cache(maxsize=4096)
 def parse_iso_timestamp(ts_str: str | None) -> datetime | None:
     """Parse an ISO 8601 timestamp string to a timezone-aware datetime.
 
     Returns None for empty/None input or unparseable strings, enabling
-    graceful degradation when event timestamps are malformed.
+    graceful degradation when event timestamps are malformed. Results are
+    memoised: events share second-granularity timestamps and are re-read on
+    every poll, and the returned datetimes are immutable.
     """
     if not ts_str:
         return None
@@ -17,3 +25,67 @@ def parse_iso_timestamp(ts_str: str | None) -> datetime | None:
         return datetime.fromisoformat(ts_str)
     except ValueError, TypeError:
         return None
+
+
+async def gather_bounded[T](
+    aws: Iterable[Awaitable[T]],
+    limit: int | None = None,
+    timeout: float | None = None,
+) -> list[T | BaseException]:
+    """Await all awaitables concurrently with at most ``limit`` in flight at once.
+
+    Behaves like ``asyncio.gather(*aws, return_exceptions=True)``: results come back
+    in input order and a failure is returned in place rather than raised. The limit
+    defaults to get_fanout_concurrency(), which keeps fleet-wide fan-out from bursting
+    every cluster's API (and ARM's per-subscription throttle) at the same instant.
+
+    All awaitables share one deadline, ``timeout`` seconds from the call (default
+    get_fanout_timeout(); 0 or less disables it). Any still pending at the deadline,
+    including those still queued behind the limit, are cancelled and reported as
+    TimeoutError so the fast clusters' results are returned without waiting on a hung one.
+    """
+    # The semaphore is created per call rather than at module level so it is always
+    # bound to the running event loop, which differs between tests and server runs.
+    semaphore = asyncio.Semaphore(limit if limit is not None else get_fanout_concurrency())
+    if timeout is None:
+        timeout = get_fanout_timeout()
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout if timeout > 0 else None
+
+    pending = list(aws)
+    results: dict[int, T | BaseException] = {}
+
+    async def _run(index: int, aw: Awaitable[T]) -> None:
+        try:
+            async with asyncio.timeout_at(deadline) as scope:
+                async with semaphore:
+                    results[index] = await aw
+        except TimeoutError as exc:
+            if scope.expired():
+                msg = f"did not complete within the {timeout:g}s fan-out deadline"
+                results[index] = TimeoutError(msg)
+            else:
+                results[index] = exc
+        except asyncio.CancelledError as exc:
+            # A CancelledError raised by the awaitable itself, while this task was not asked
+            # to cancel, is a result like any other failure, as with gather(). A real
+            # cancellation (the caller or the TaskGroup cancelling this task) must propagate.
+            task = asyncio.current_task()
+            if task is not None and task.cancelling():
+                raise
+            results[index] = exc
+        except Exception as exc:
+            # Failures are stored in place so one cluster never cancels its siblings.
+            results[index] = exc
+        finally:
+            # A coroutine that timed out while still queued was never started; closing it
+            # avoids a "coroutine was never awaited" warning. Closing a finished one is a no-op.
+            if isinstance(aw, Coroutine):
+                aw.close()
+
+    # A TaskGroup rather than gather(): if the caller is cancelled, every child is cancelled
+    # and awaited before this returns, so no per-cluster task outlives the fan-out.
+    async with asyncio.TaskGroup() as group:
+        for index, aw in enumerate(pending):
+            group.create_task(_run(index, aw))
+    return [results[index] for index in range(len(pending))]
@@ -6,6 +6,7 @@
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 
 # Note 2: re.compile() pre-compiles the regex pattern into a reusable pattern object.
 # Calling re.match(pattern, string) on every request would reparse the pattern each
@@ -13,15 +14,16 @@ import re
 
 # Note 3: RFC 1123 labels must be lowercase alphanumeric, may contain hyphens in the
 # middle, and are capped at 63 characters. Kubernetes enforces this rule for all
-# namespace names, so the regex anchors with ^ and $ to match the full string.
+# namespace names, so the validators use fullmatch() to require the whole string to
+# match. Unlike a `$` anchor with match(), fullmatch() does not accept a trailing newline.
 # RFC 1123 label: lowercase alphanumeric and hyphens, 1-63 chars, starts/ends with alphanumeric
-_NAMESPACE_RE = re.compile(r"^[a-z0-9]([a-z0-9\-]{0,61}[a-z0-9])?$")
+_NAMESPACE_RE = re.compile(r"[a-z0-9]([a-z0-9\-]{0,61}[a-z0-9])?")
 
 # Note 4: AKS node pool names have a stricter constraint than generic RFC 1123 labels:
 # they must start with a letter (not a digit) and are limited to 12 characters.
 # This extra restriction comes from AKS, not from Kubernetes core.
 # AKS node pool: lowercase alphanumeric, 1-12 chars, starts with letter
-_NODE_POOL_RE = re.compile(r"^[a-z][a-z0-9]{0,11}$")
+_NODE_POOL_MAX_LEN = 12
 
 # Note 5: A set literal gives O(1) average-case membership tests via hashing.
 # Using a set here instead of a list means `mode not in _VALID_MODES` is constant
@@ -31,16 +33,27 @@ _VALID_MODES = {"preflight", "live"}
 # Valid values for the status_filter parameter used by get_pod_health.
 _VALID_STATUS_FILTERS = {"all", "pending", "failed"}
 
+# Note 6: sorted() produces a deterministic, alphabetically ordered list of valid
+# options. Sets have no guaranteed iteration order, so without sorted() the error
+# message could differ between runs, making tests brittle and user-facing output
+# confusing. The sets never change, so the joined strings are built once at import.
+_VALID_MODES_STR = ", ".join(sorted(_VALID_MODES))
+_VALID_STATUS_FILTERS_STR = ", ".join(sorted(_VALID_STATUS_FILTERS))
 
-# Note 6: This is the "guard clause" (or "early return") pattern. By returning
+
+# Note 7: This is the "guard clause" (or "early return") pattern. By returning
 # immediately when the input is None, the rest of the function stays unindented
 # and focused on the actual validation logic, avoiding a nested if-else pyramid.
+# Note 8: Each tool call validates its inputs, and a session reuses a handful of namespace and pool
+# names, so accepted values are memoised. A rejected value raises, and lru_cache never
+# caches exceptions, so invalid input is re-checked (and re-rejected) every time.
+@lru_cache(maxsize=1024)
 def validate_namespace(namespace: str | None) -> None:
     """Validate a Kubernetes namespace name against RFC 1123."""
     if namespace is None:
         return
-    if not _NAMESPACE_RE.match(namespace):
-        # Note 7: The `!r` conversion flag calls repr() on the value before
+    if not _NAMESPACE_RE.fullmatch(namespace):
+        # Note 9: The `!r` conversion flag calls repr() on the value before
         # interpolating it. This wraps strings in quotes and escapes special
         # characters, making it immediately clear in error messages that the
         # offending value is a string and revealing invisible characters.
@@ -48,11 +61,21 @@ def validate_namespace(namespace: str | None) -> None:
         raise ValueError(msg)
 
 
+@lru_cache(maxsize=1024)
 def validate_node_pool(node_pool: str | None) -> None:
     """Validate an AKS node pool name."""
     if node_pool is None:
         return
-    if not _NODE_POOL_RE.match(node_pool):
+    # Note 10: The rule is simple enough to check with str methods instead of a regex.
+    # isascii() must come first: isalpha()/isalnum()/islower() also accept non-ASCII
+    # letters and digits such as "é" or "²", which AKS rejects.
+    if not (
+        0 < len(node_pool) <= _NODE_POOL_MAX_LEN
+        and node_pool.isascii()
+        and node_pool[0].isalpha()
+        and node_pool.isalnum()
+        and node_pool.islower()
+    ):
         msg = f"Invalid node pool name: {node_pool!r}. Must be 1-12 lowercase alphanumeric starting with a letter."
         raise ValueError(msg)
 
@@ -60,18 +83,12 @@ def validate_node_pool(node_pool: str | None) -> None:
 def validate_mode(mode: str) -> None:
     """Validate the PDB check mode parameter."""
     if mode not in _VALID_MODES:
-        # Note 8: sorted() is called here to produce a deterministic, alphabetically
-        # ordered list of valid options. Sets have no guaranteed iteration order,
-        # so without sorted() the error message could differ between runs, making
-        # tests brittle and user-facing output confusing.
-        valid = ", ".join(sorted(_VALID_MODES))
-        msg = f"Invalid mode: {mode!r}. Must be one of: {valid}"
+        msg = f"Invalid mode: {mode!r}. Must be one of: {_VALID_MODES_STR}"
         raise ValueError(msg)
 
 
 def validate_status_filter(status_filter: str) -> None:
     """Validate the status_filter parameter for get_pod_health."""
     if status_filter not in _VALID_STATUS_FILTERS:
-        valid = ", ".join(sorted(_VALID_STATUS_FILTERS))
-        msg = f"Invalid status_filter: {status_filter!r}. Must be one of: {valid}"
+        msg = f"Invalid status_filter: {status_filter!r}. Must be one of: {_VALID_STATUS_FILTERS_STR}"
         raise ValueError(msg)
@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
+import os
+import shutil
+import tempfile
 import textwrap
+from pathlib import Path
 from typing import Any
 from unittest.mock import MagicMock
 
@@ -57,20 +61,27 @@ _TEST_CLUSTERS_YAML = textwrap.dedent("""\
 """)
 
 
-@pytest.fixture(autouse=True, scope="session")
-def _load_test_clusters(tmp_path_factory: pytest.TempPathFactory) -> None:
-    """Write a test clusters.yaml and load it before any tests run."""
-    config_path = tmp_path_factory.mktemp("config") / "clusters.yaml"
-    config_path.write_text(_TEST_CLUSTERS_YAML)
-    import os
+def pytest_configure(config: pytest.Config) -> None:
+    """Write a test clusters.yaml and load it before collection starts.
 
+    A configure hook rather than an autouse session fixture: the map is loaded once, before
+    any test module is imported, without adding a fixture to every test's setup graph.
+    """
+    config_dir = Path(tempfile.mkdtemp(prefix="platform-mcp-config-"))
+    config.add_cleanup(lambda: shutil.rmtree(config_dir, ignore_errors=True))
+    config_path = config_dir / "clusters.yaml"
+    config_path.write_text(_TEST_CLUSTERS_YAML)
     os.environ["PLATFORM_MCP_CLUSTERS"] = str(config_path)
     load_cluster_map()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_cluster_config() -> dict[str, ClusterConfig]:
-    """Return the full cluster config mapping for test use."""
+    """Return the full cluster config mapping for test use.
+
+    Session-scoped: it only hands back the module-level CLUSTER_MAP, which pytest_configure
+    loads once for the whole run, so rebuilding the fixture per test bought no isolation.
+    """
     return CLUSTER_MAP
 
 
@@ -116,9 +127,8 @@ def make_node(
     labels: dict[str, str] | None = None,
 ) -> dict[str, Any]:
     """Create a mock node dict for test fixtures."""
-    node_labels = {"agentpool": pool}
-    if labels:
-        node_labels.update(labels)
+    # Extra labels win over the default agentpool label, as with dict.update().
+    node_labels = ({"agentpool": pool} | labels) if labels else {"agentpool": pool}
 
     return {
         "metadata": {
@@ -141,6 +151,11 @@ def make_node(
     }
 
 
+# Shared by every make_pod() call that passes no statuses. Consumers only iterate the field,
+# and a tuple cannot be mutated by one test in a way another would see.
+_NO_CONTAINER_STATUSES: tuple[dict[str, Any], ...] = ()
+
+
 def make_pod(
     name: str = "test-pod-abc123",
     namespace: str = "default",
@@ -161,7 +176,7 @@ def make_pod(
         },
         "status": {
             "phase": phase,
-            "container_statuses": container_statuses or [],
+            "container_statuses": container_statuses if container_statuses is not None else _NO_CONTAINER_STATUSES,
         },
     }
     if reason:
@@ -15,6 +15,7 @@ from __future__ import annotations
 # that subtract two datetime objects — naive datetimes cannot be subtracted from
 # timezone-aware ones without raising a TypeError.
 from datetime import UTC, datetime
+from types import SimpleNamespace
 
 # Note 4: MagicMock auto-generates any attribute or method access, making it ideal for
 # deeply nested SDK response objects like Azure's ManagedCluster. patch is used as a
@@ -38,28 +39,28 @@ def _make_mock_pool(
     current_version: str = "1.29.8",
     target_version: str = "1.29.8",
     provisioning_state: str = "Succeeded",
-) -> MagicMock:
-    # Note 6: Every attribute set on this mock mirrors a real field from Azure's
+) -> SimpleNamespace:
+    # Note 6: Every attribute set on this fake mirrors a real field from Azure's
     # AgentPool SDK object. The defaults ("Standard_DS2_v2", count=3, etc.) reflect
     # realistic production values for a general-purpose AKS node pool, which helps
     # readers understand the domain without needing to consult Azure documentation.
-    pool = MagicMock()
-    pool.name = name
-    pool.vm_size = "Standard_DS2_v2"
-    pool.count = count
-    pool.min_count = 1
-    pool.max_count = 10
-    pool.current_orchestrator_version = current_version
-    pool.orchestrator_version = target_version
-    pool.provisioning_state = provisioning_state
-    # Note 7: `pool.power_state.code = "Running"` works because MagicMock automatically
-    # creates `pool.power_state` as another MagicMock when first accessed. Setting `.code`
-    # on that nested mock stores the value as expected. This auto-nesting behavior is what
-    # distinguishes MagicMock from a plain object — no class hierarchy needed.
-    pool.power_state.code = "Running"
-    pool.os_type = "Linux"
-    pool.mode = "User"
-    return pool
+    # Note 7: The client only reads these fields, so a SimpleNamespace is enough and is far
+    # cheaper to build than a MagicMock. Unlike a MagicMock, it raises AttributeError for a
+    # field it was not given, so a test breaks loudly if the client starts reading a new
+    # SDK attribute instead of silently receiving an auto-created mock.
+    return SimpleNamespace(
+        name=name,
+        vm_size="Standard_DS2_v2",
+        count=count,
+        min_count=1,
+        max_count=10,
+        current_orchestrator_version=current_version,
+        orchestrator_version=target_version,
+        provisioning_state=provisioning_state,
+        power_state=SimpleNamespace(code="Running"),
+        os_type="Linux",
+        mode="User",
+    )
 
 
 # Note 8: A file-local fixture defined with @pytest.fixture provides the AzureAksClient
@@ -179,13 +180,48 @@ class TestGetUpgradeProfile:
         assert "1.30.0" in result["control_plane_upgrades"]
         assert "1.30.0" in result["pool_upgrades"]["userpool"]
 
+    async def test_repeat_calls_served_from_cache(self, client: AzureAksClient) -> None:
+        # Note 18: The upgrade profile is cached per client for a few minutes. The second
+        # call must not reach the SDK, and mutating the first result must not leak into the
+        # second, because callers receive a copy of the cached payload.
+        mock_container = MagicMock()
+        profile = MagicMock()
+        profile.control_plane_profile.kubernetes_version = "1.29.8"
+        profile.control_plane_profile.upgrades = []
+        profile.agent_pool_profiles = []
+        mock_container.managed_clusters.get_upgrade_profile.return_value = profile
+
+        with patch.object(client, "_get_container_client", return_value=mock_container):
+            first = await client.get_upgrade_profile()
+            first["control_plane_upgrades"].append("9.9.9")
+            second = await client.get_upgrade_profile()
+
+        mock_container.managed_clusters.get_upgrade_profile.assert_called_once()
+        assert second["control_plane_upgrades"] == []
+
+    async def test_expired_cache_refetches(self, client: AzureAksClient) -> None:
+        mock_container = MagicMock()
+        mock_container.managed_clusters.get_upgrade_profile.return_value = MagicMock(agent_pool_profiles=[])
+
+        # The TTL is bound when the method is decorated, so the cache clock is advanced instead.
+        with (
+            patch.object(client, "_get_container_client", return_value=mock_container),
+            patch("platform_mcp_server.clients.time") as mock_time,
+        ):
+            mock_time.monotonic.return_value = 0.0
+            await client.get_upgrade_profile()
+            mock_time.monotonic.return_value = 301.0
+            await client.get_upgrade_profile()
+
+        assert mock_container.managed_clusters.get_upgrade_profile.call_count == 2
+
 
 class TestGetActivityLogUpgrades:
     async def test_returns_historical_records(self, client: AzureAksClient) -> None:
         mock_monitor = MagicMock()
         entry = MagicMock()
         entry.status.value = "Succeeded"
-        # Note 18: Two distinct datetime values are used (event_timestamp and submission_timestamp)
+        # Note 19: Two distinct datetime values are used (event_timestamp and submission_timestamp)
         # with a deliberate 1-hour gap. This lets the test verify the duration calculation
         # (3600.0 seconds == 1 hour) rather than just asserting the timestamps are present.
         # Choosing timezone-aware UTC datetimes matches production behavior where all
@@ -196,7 +232,7 @@ class TestGetActivityLogUpgrades:
         entry.description = "Upgrade to 1.29.8"
         mock_monitor.activity_logs.list.return_value = [entry]
 
-        # Note 19: `patch.object` is used on `_get_monitor_client` (not `_get_container_client`)
+        # Note 20: `patch.object` is used on `_get_monitor_client` (not `_get_container_client`)
         # because this method interacts with Azure Monitor, not the Container Service API.
         # Using the wrong patch target would cause the real `_get_monitor_client` to run,
         # which would attempt to authenticate against Azure and fail in CI.
@@ -204,14 +240,14 @@ class TestGetActivityLogUpgrades:
             records = await client.get_activity_log_upgrades(count=5)
 
         assert len(records) == 1
-        # Note 20: 3600.0 seconds is the expected duration for a 1-hour upgrade window.
+        # Note 21: 3600.0 seconds is the expected duration for a 1-hour upgrade window.
         # Asserting on a concrete float value (rather than just checking the key exists)
         # ensures the duration arithmetic is correct. The `.0` suffix confirms the result
         # is a float, which is the expected return type for `timedelta.total_seconds()`.
         assert records[0]["duration_seconds"] == 3600.0  # 1 hour
 
     async def test_fewer_records_than_requested(self, client: AzureAksClient) -> None:
-        # Note 21: This test covers the boundary case where the activity log contains
+        # Note 22: This test covers the boundary case where the activity log contains
         # fewer entries than the `count` parameter requests. Production code that slices
         # a list without bounds-checking would raise an IndexError in this scenario.
         # An empty return value from the API is the simplest edge case to test.
@@ -224,7 +260,7 @@ class TestGetActivityLogUpgrades:
         assert len(records) == 0
 
     async def test_partial_failure_handling(self, client: AzureAksClient) -> None:
-        # Note 22: "Timeout" is a realistic error string for Azure Monitor API calls,
+        # Note 23: "Timeout" is a realistic error string for Azure Monitor API calls,
         # which can experience throttling or latency under load. By asserting the
         # exception propagates (rather than being swallowed), the test enforces that the
         # client does not silently hide errors from callers — important for observability.
@@ -236,3 +272,24 @@ class TestGetActivityLogUpgrades:
             pytest.raises(Exception, match="Timeout"),
         ):
             await client.get_activity_log_upgrades()
+
+    async def test_repeat_calls_served_from_cache(self, client: AzureAksClient) -> None:
+        # History is cached per requested count; a different count is a separate query.
+        mock_monitor = MagicMock()
+        mock_monitor.activity_logs.list.return_value = []
+
+        with patch.object(client, "_get_monitor_client", return_value=mock_monitor):
+            await client.get_activity_log_upgrades(count=5)
+            await client.get_activity_log_upgrades(count=5)
+            await client.get_activity_log_upgrades(count=10)
+
+        assert mock_monitor.activity_logs.list.call_count == 2
+
+    async def test_failure_is_not_cached(self, client: AzureAksClient) -> None:
+        mock_monitor = MagicMock()
+        mock_monitor.activity_logs.list.side_effect = [Exception("Timeout"), []]
+
+        with patch.object(client, "_get_monitor_client", return_value=mock_monitor):
+            with pytest.raises(Exception, match="Timeout"):
+                await client.get_activity_log_upgrades()
+            assert await client.get_activity_log_upgrades() == []
@@ -10,6 +10,8 @@
 # allowing forward references in type hints without runtime errors.
 from __future__ import annotations
 
+import asyncio
+
 # Note 3: Both MagicMock and patch are imported from unittest.mock. MagicMock creates
 # stand-in objects with auto-generated attributes, while patch is a context manager /
 # decorator that temporarily replaces a named object in a module's namespace for the
@@ -17,9 +19,12 @@ from __future__ import annotations
 # normally touch network or filesystem resources.
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 # Note 4: All five client classes are imported so their initialization behavior can be
 # tested uniformly. Importing directly from the production modules (not from a test
 # helper) ensures the tests exercise the real class constructors.
+from platform_mcp_server.clients import shared_client, ttl_cached
 from platform_mcp_server.clients.azure_aks import AzureAksClient
 from platform_mcp_server.clients.k8s_core import K8sCoreClient
 from platform_mcp_server.clients.k8s_events import K8sEventsClient
@@ -209,3 +214,91 @@ class TestAzureAksClientInit:
             m2 = client._get_monitor_client()
         assert m1 is m2
         mock_mon.assert_called_once()
+
+
+# Note 21: shared_client is the process-wide cache that the tool handlers use instead of
+# constructing a fresh client per call. The tests verify both halves of its contract:
+# the same (class, config) pair yields the identical instance, while a different class
+# or a different cluster yields a separate one so API surfaces never share state.
+class TestSharedClient:
+    def test_same_class_and_cluster_reuses_instance(self) -> None:
+        config = CLUSTER_MAP["prod-eastus"]
+        assert shared_client(K8sCoreClient, config) is shared_client(K8sCoreClient, config)
+
+    def test_different_class_or_cluster_gets_new_instance(self) -> None:
+        prod = CLUSTER_MAP["prod-eastus"]
+        dev = CLUSTER_MAP["dev-eastus"]
+        core = shared_client(K8sCoreClient, prod)
+        assert shared_client(K8sEventsClient, prod) is not core
+        assert shared_client(K8sCoreClient, dev) is not core
+        assert isinstance(shared_client(AzureAksClient, dev), AzureAksClient)
+
+
+class _CountingLister:
+    """Minimal client whose list call counts invocations and can be made to fail."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.fail = False
+        self.release = asyncio.Event()
+        self.release.set()
+
+    @ttl_cached(5.0)
+    async def list_items(self, namespace: str | None = None) -> list[str]:
+        self.calls += 1
+        await self.release.wait()
+        if self.fail:
+            raise RuntimeError("API down")
+        return [f"{namespace}-item"]
+
+
+class TestTtlCached:
+    async def test_repeat_call_within_ttl_is_served_from_cache(self) -> None:
+        lister = _CountingLister()
+        first = await lister.list_items("payments")
+        first.append("mutated")
+        assert await lister.list_items("payments") == ["payments-item"]
+        assert await lister.list_items(namespace="other") == ["other-item"]
+        assert lister.calls == 2
+
+    async def test_concurrent_callers_share_one_request(self) -> None:
+        lister = _CountingLister()
+        lister.release.clear()
+        waiters = [asyncio.create_task(lister.list_items("payments")) for _ in range(3)]
+        await asyncio.sleep(0)
+        lister.release.set()
+        assert await asyncio.gather(*waiters) == [["payments-item"]] * 3
+        assert lister.calls == 1
+
+    async def test_failures_are_not_cached(self) -> None:
+        lister = _CountingLister()
+        lister.fail = True
+        with pytest.raises(RuntimeError):
+            await lister.list_items()
+        lister.fail = False
+        assert await lister.list_items() == ["None-item"]
+        assert lister.calls == 2
+
+    async def test_entry_expires_after_ttl(self) -> None:
+        class _Uncached:
+            calls = 0
+
+            @ttl_cached(0.0)
+            async def list_items(self) -> list[str]:
+                self.calls += 1
+                return []
+
+        lister = _Uncached()
+        await lister.list_items()
+        await lister.list_items()
+        assert lister.calls == 2
+
+    async def test_expired_entries_are_evicted_when_another_key_is_cached(self) -> None:
+        lister = _CountingLister()
+        with patch("platform_mcp_server.clients.time") as mock_time:
+            mock_time.monotonic.return_value = 0.0
+            await lister.list_items("payments")
+            mock_time.monotonic.return_value = 6.0
+            await lister.list_items("other")
+        # The expired "payments" result is removed, not merely refetched when its key recurs.
+        assert list(vars(lister)["_ttl_cache_list_items"]) == [(("other",), ())]
@@ -10,6 +10,8 @@
 # files with complex cross-module type references.
 from __future__ import annotations
 
+from collections.abc import Callable
+
 # Note 3: Only MagicMock and patch are needed from unittest.mock here because all
 # Kubernetes API interactions are synchronous at the mock level (the async behavior
 # is in the production code, not in the mock itself). pytest-asyncio transparently
@@ -197,10 +199,78 @@ class TestGetNodes:
         with patch.object(client, "_get_api", return_value=mock_api), pytest.raises(Exception, match="Connection"):
             await client.get_nodes()
 
+    async def test_label_selector_passed_to_api(self, client: K8sCoreClient) -> None:
+        mock_api = MagicMock()
+        mock_api.list_node.return_value = MagicMock(items=[])
+
+        with patch.object(client, "_get_api", return_value=mock_api):
+            await client.get_nodes(label_selector="agentpool=userpool")
+
+        mock_api.list_node.assert_called_once_with(label_selector="agentpool=userpool")
+
+    async def test_pool_nodes_forward_field_selector(self, client: K8sCoreClient) -> None:
+        mock_api = MagicMock()
+        mock_api.list_node.return_value = MagicMock(items=[])
+
+        with patch.object(client, "_get_api", return_value=mock_api):
+            await client.get_pool_nodes("userpool", field_selector="spec.unschedulable=true")
+
+        assert sorted(
+            (c.kwargs["label_selector"], c.kwargs["field_selector"]) for c in mock_api.list_node.call_args_list
+        ) == [
+            ("agentpool=userpool", "spec.unschedulable=true"),
+            ("kubernetes.azure.com/agentpool=userpool", "spec.unschedulable=true"),
+        ]
+
+
+def _list_node_by_label(nodes_by_selector: dict[str, list[MagicMock]]) -> Callable[..., MagicMock]:
+    """Return a list_node side effect that answers each label selector from a fixed map."""
+
+    def _list_node(label_selector: str, **_: str) -> MagicMock:
+        return MagicMock(items=nodes_by_selector.get(label_selector, []))
+
+    return _list_node
+
+
+class TestGetPoolNodes:
+    async def test_queries_both_labels_and_keeps_each_node_once(self, client: K8sCoreClient) -> None:
+        # Note 19: Both selectors are always sent, concurrently, because under a field selector an
+        # empty primary result cannot be told apart from a cluster without the primary label. A node
+        # carrying both labels (the usual AKS case) appears in both lists but is returned once.
+        node = _make_mock_node(name="node-1")
+        mock_api = MagicMock()
+        mock_api.list_node.side_effect = _list_node_by_label(
+            {"agentpool=userpool": [node], "kubernetes.azure.com/agentpool=userpool": [node]}
+        )
+
+        with patch.object(client, "_get_api", return_value=mock_api):
+            nodes = await client.get_pool_nodes("userpool")
+
+        assert [n["name"] for n in nodes] == ["node-1"]
+        assert sorted(c.kwargs["label_selector"] for c in mock_api.list_node.call_args_list) == [
+            "agentpool=userpool",
+            "kubernetes.azure.com/agentpool=userpool",
+        ]
+
+    async def test_falls_back_to_qualified_label(self, client: K8sCoreClient) -> None:
+        mock_api = MagicMock()
+        mock_api.list_node.side_effect = _list_node_by_label(
+            {
+                "kubernetes.azure.com/agentpool=fbpool": [
+                    _make_mock_node(name="node-1", pool_label="fbpool", use_fallback_label=True)
+                ]
+            }
+        )
+
+        with patch.object(client, "_get_api", return_value=mock_api):
+            nodes = await client.get_pool_nodes("fbpool")
+
+        assert [n["pool"] for n in nodes] == ["fbpool"]
+
 
 class TestGetPods:
     async def test_returns_pods_all_namespaces(self, client: K8sCoreClient) -> None:
-        # Note 19: `list_pod_for_all_namespaces` is the CoreV1Api method for fetching pods
+        # Note 20: `list_pod_for_all_namespaces` is the CoreV1Api method for fetching pods
         # cluster-wide. The test verifies both the count of returned pods and that the
         # correct API method was used (via `assert_called_once()`). If production code
         # accidentally called `list_namespaced_pod` without a namespace, the assertion on
@@ -217,7 +287,7 @@ class TestGetPods:
         mock_api.list_pod_for_all_namespaces.assert_called_once()
 
     async def test_returns_pods_filtered_by_namespace(self, client: K8sCoreClient) -> None:
-        # Note 20: When `namespace` is provided, the client should call `list_namespaced_pod`
+        # Note 21: When `namespace` is provided, the client should call `list_namespaced_pod`
         # instead of `list_pod_for_all_namespaces`. `assert_called_once_with("payments")`
         # is stricter than `assert_called_once()` — it verifies both that the method was
         # called exactly once AND that it received the correct argument. This ensures the
@@ -234,7 +304,7 @@ class TestGetPods:
         mock_api.list_namespaced_pod.assert_called_once_with("payments")
 
     async def test_error_handling(self, client: K8sCoreClient) -> None:
-        # Note 21: Network timeouts are a common real-world failure mode for Kubernetes
+        # Note 22: Network timeouts are a common real-world failure mode for Kubernetes
         # API calls, especially in large clusters with many pods. The test ensures this
         # error propagates to the caller rather than being caught and swallowed silently,
         # which would result in an empty list being returned — a silent failure.
@@ -245,7 +315,7 @@ class TestGetPods:
             await client.get_pods()
 
     async def test_container_status_waiting(self, client: K8sCoreClient) -> None:
-        # Note 22: Container status objects in Kubernetes are discriminated unions:
+        # Note 23: Container status objects in Kubernetes are discriminated unions:
         # a container is in exactly one of three states — waiting, running, or terminated.
         # The `cs.state.waiting.reason = "CrashLoopBackOff"` setup simulates the most
         # operationally significant waiting reason: a container that has crashed and is
@@ -257,7 +327,7 @@ class TestGetPods:
         cs.ready = False
         cs.restart_count = 5
         cs.state.waiting.reason = "CrashLoopBackOff"
-        # Note 23: Setting `cs.state.terminated = None` and `cs.last_state.terminated = None`
+        # Note 24: Setting `cs.state.terminated = None` and `cs.last_state.terminated = None`
         # is necessary because MagicMock attributes are truthy by default. If production
         # code checks `if cs.state.terminated:` before reading its fields, a MagicMock
         # (truthy) would incorrectly enter the terminated branch. Explicit None assignment
@@ -273,7 +343,7 @@ class TestGetPods:
         with patch.object(client, "_get_api", return_value=mock_api):
             pods = await client.get_pods()
 
-        # Note 24: The assertion checks the exact structure of the serialized container
+        # Note 25: The assertion checks the exact structure of the serialized container
         # state dict. This is an integration-level assertion on the output shape, ensuring
         # the production serialization code maps the mock object fields into the expected
         # dict keys. If the production code changes the output key from "waiting" to
@@ -281,7 +351,7 @@ class TestGetPods:
         assert pods[0]["container_statuses"][0]["state"] == {"waiting": {"reason": "CrashLoopBackOff"}}
 
     async def test_container_status_terminated(self, client: K8sCoreClient) -> None:
-        # Note 25: exit_code = 0 indicates a clean (successful) termination. This is
+        # Note 26: exit_code = 0 indicates a clean (successful) termination. This is
         # the typical state for a batch job container or an init container that completed
         # successfully. Testing exit_code = 0 specifically confirms the client does not
         # treat zero as falsy and omit it from the output dict.
@@ -306,7 +376,7 @@ class TestGetPods:
         assert pods[0]["container_statuses"][0]["state"] == {"terminated": {"reason": "Completed", "exit_code": 0}}
 
     async def test_container_status_last_terminated(self, client: K8sCoreClient) -> None:
-        # Note 26: `last_state.terminated` captures the previous termination state of a
+        # Note 27: `last_state.terminated` captures the previous termination state of a
         # container. This is critical for diagnosing OOMKilled containers: the current
         # state might be "Running" (after restart), while `last_state` reveals it was
         # killed by the OOM killer. exit_code = 137 is the standard Linux exit code for
@@ -335,7 +405,7 @@ class TestGetPods:
         }
 
     async def test_field_selector_passed(self, client: K8sCoreClient) -> None:
-        # Note 27: Kubernetes field selectors filter resources server-side before the
+        # Note 28: Kubernetes field selectors filter resources server-side before the
         # response is returned. `status.phase=Pending` is a common selector used to find
         # pods stuck in Pending state (e.g., due to resource constraints or missing PVCs).
         # `assert_called_once_with(field_selector="status.phase=Pending")` verifies the
@@ -350,3 +420,28 @@ class TestGetPods:
             await client.get_pods(field_selector="status.phase=Pending")
 
         mock_api.list_pod_for_all_namespaces.assert_called_once_with(field_selector="status.phase=Pending")
+
+    async def test_resource_version_passed(self, client: K8sCoreClient) -> None:
+        mock_api = MagicMock()
+        pod_list = MagicMock()
+        pod_list.items = []
+        mock_api.list_namespaced_pod.return_value = pod_list
+
+        with patch.object(client, "_get_api", return_value=mock_api):
+            await client.get_pods(namespace="payments", resource_version="0")
+
+        mock_api.list_namespaced_pod.assert_called_once_with("payments", resource_version="0")
+
+    async def test_pods_on_node_bypass_the_list_cache(self, client: K8sCoreClient) -> None:
+        # Per-node lists are not cached, so repeating one reaches the API server each time
+        # and leaves no entry behind on the shared client.
+        mock_api = MagicMock()
+        mock_api.list_pod_for_all_namespaces.return_value.items = []
+
+        with patch.object(client, "_get_api", return_value=mock_api):
+            await client.get_pods_on_node("node-1")
+            await client.get_pods_on_node("node-1")
+
+        assert mock_api.list_pod_for_all_namespaces.call_count == 2
+        mock_api.list_pod_for_all_namespaces.assert_called_with(field_selector="spec.nodeName=node-1")
+        assert "_ttl_cache_get_pods" not in vars(client)
@@ -20,7 +20,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from platform_mcp_server.clients.k8s_events import K8sEventsClient
+from platform_mcp_server.clients.k8s_events import UPGRADE_EVENT_REASONS, K8sEventsClient
 from platform_mcp_server.config import CLUSTER_MAP
 
 
@@ -101,19 +101,32 @@ class TestGetNodeEvents:
         # tests the exclusion logic: "NodeNotReady" should be filtered out when the caller
         # asks for only ["NodeUpgrade", "NodeReady"]. The set assertion `reasons == {...}`
         # verifies the correct subset is returned without caring about order.
-        mock_api = MagicMock()
-        event_list = MagicMock()
-        event_list.items = [
+        all_events = [
             _make_mock_event(reason="NodeReady", object_name="node-1"),
             _make_mock_event(reason="NodeUpgrade", object_name="node-2"),
             _make_mock_event(reason="NodeNotReady", object_name="node-3"),
         ]
-        mock_api.list_event_for_all_namespaces.return_value = event_list
+
+        # The fake API server honours the field selector the way the real one does.
+        def _list_events(field_selector: str) -> MagicMock:
+            wanted = dict(term.split("=") for term in field_selector.split(","))
+            event_list = MagicMock()
+            event_list.items = [
+                e
+                for e in all_events
+                if e.involved_object.kind == wanted["involvedObject.kind"] and e.reason == wanted["reason"]
+            ]
+            return event_list
+
+        mock_api = MagicMock()
+        mock_api.list_event_for_all_namespaces.side_effect = _list_events
 
         with patch.object(client, "_get_api", return_value=mock_api):
             events = await client.get_node_events(reasons=["NodeUpgrade", "NodeReady"])
 
         assert len(events) == 2
+        selectors = {c.kwargs["field_selector"] for c in mock_api.list_event_for_all_namespaces.call_args_list}
+        assert selectors == {"involvedObject.kind=Node,reason=NodeUpgrade", "involvedObject.kind=Node,reason=NodeReady"}
         # Note 12: A set comprehension is used to collect all distinct reason values from
         # the filtered result, then compared to the expected set. This pattern is resilient
         # to ordering differences (the API may return events in any order) and validates
@@ -121,6 +134,21 @@ class TestGetNodeEvents:
         reasons = {e["reason"] for e in events}
         assert reasons == {"NodeUpgrade", "NodeReady"}
 
+    async def test_upgrade_event_reasons_issue_one_selector_each(self, client: K8sEventsClient) -> None:
+        # The upgrade tools only pair NodeUpgrade with NodeReady, so NodeNotReady is deliberately
+        # not requested: exactly one list call per shared reason, in tuple order.
+        mock_api = MagicMock()
+        mock_api.list_event_for_all_namespaces.return_value.items = []
+
+        with patch.object(client, "_get_api", return_value=mock_api):
+            await client.get_node_events(reasons=UPGRADE_EVENT_REASONS)
+
+        selectors = [c.kwargs["field_selector"] for c in mock_api.list_event_for_all_namespaces.call_args_list]
+        assert selectors == [
+            "involvedObject.kind=Node,reason=NodeUpgrade",
+            "involvedObject.kind=Node,reason=NodeReady",
+        ]
+
     async def test_timestamp_parsing(self, client: K8sEventsClient) -> None:
         # Note 13: A specific timezone-aware datetime is created and passed to the mock
         # event. The test then asserts that the output timestamp matches `ts.isoformat()`.
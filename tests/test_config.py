@@ -14,6 +14,8 @@ from platform_mcp_server.config import (
     ClusterConfig,
     ThresholdConfig,
     _load_cluster_map,
+    get_fanout_concurrency,
+    get_fanout_timeout,
     get_thresholds,
     load_cluster_map,
     resolve_cluster,
@@ -120,6 +122,32 @@ class TestThresholdConfig:
             thresholds.cpu_critical = 50.0  # type: ignore[misc]
 
 
+class TestFanoutConcurrency:
+    """Tests for the fleet-wide fan-out concurrency limit and deadline."""
+
+    def test_default_concurrency(self) -> None:
+        with patch.dict(os.environ, clear=False) as env:
+            env.pop("PLATFORM_MCP_FANOUT_CONCURRENCY", None)
+            assert get_fanout_concurrency() == 8
+
+    def test_override_from_env(self) -> None:
+        with patch.dict(os.environ, {"PLATFORM_MCP_FANOUT_CONCURRENCY": "3"}):
+            assert get_fanout_concurrency() == 3
+
+    def test_non_positive_value_clamped_to_one(self) -> None:
+        with patch.dict(os.environ, {"PLATFORM_MCP_FANOUT_CONCURRENCY": "0"}):
+            assert get_fanout_concurrency() == 1
+
+    def test_default_timeout(self) -> None:
+        with patch.dict(os.environ, clear=False) as env:
+            env.pop("PLATFORM_MCP_FANOUT_TIMEOUT_SECONDS", None)
+            assert get_fanout_timeout() == 30.0
+
+    def test_timeout_override_from_env(self) -> None:
+        with patch.dict(os.environ, {"PLATFORM_MCP_FANOUT_TIMEOUT_SECONDS": "2.5"}):
+            assert get_fanout_timeout() == 2.5
+
+
 class TestValidateClusterConfig:
     """Tests for startup config validation."""
 
@@ -41,7 +41,7 @@ from platform_mcp_server.tools.node_pools import (
     check_node_pool_pressure_handler,
 )
 from platform_mcp_server.tools.pdb_check import _workload_from_selector, check_pdb_risk_all, check_pdb_risk_handler
-from platform_mcp_server.tools.pod_classification import categorize_failure, is_unhealthy
+from platform_mcp_server.tools.pod_classification import classify_pod
 from platform_mcp_server.tools.pod_health import get_pod_health_all, get_pod_health_handler
 from platform_mcp_server.tools.upgrade_metrics import _parse_ts, get_upgrade_metrics_all, get_upgrade_metrics_handler
 from platform_mcp_server.tools.upgrade_progress import (
@@ -351,6 +351,12 @@ class TestParseMemoryBytes:
     def test_parses_plain_bytes(self) -> None:
         assert _parse_memory_bytes("1048576") == 1_048_576.0
 
+    def test_parses_exponent_without_suffix(self) -> None:
+        assert _parse_memory_bytes("1e3") == 1000.0
+
+    def test_parses_fractional_gi(self) -> None:
+        assert _parse_memory_bytes("1.5Gi") == 1.5 * 1024**3
+
 
 # Note 26: `_classify_pressure` returns a severity string ("ok", "warning", "critical")
 # based on which metric exceeds which threshold. The helper accepts `None` for metrics
@@ -399,6 +405,12 @@ class TestClassifyPressureEdgeCases:
         result = _classify_pressure(None, None, 11, self._thresholds())  # type: ignore[arg-type]
         assert result == "critical"
 
+    def test_later_warning_does_not_downgrade_critical(self) -> None:
+        # CPU is critical while memory and pending pods only reach warning; the
+        # highest severity must survive the later, lower-severity checks.
+        result = _classify_pressure(91.0, 81.0, 1, self._thresholds())  # type: ignore[arg-type]
+        assert result == "critical"
+
 
 # Note 31: This test targets the sub-branch inside the pending-pods counting logic
 # where a pending pod has a `node_name` that maps to a known pool. The handler
@@ -574,39 +586,48 @@ class TestWorkloadFromSelector:
         result = _workload_from_selector({"tier": "backend"})
         assert isinstance(result, str)
 
+    def test_fallback_keeps_label_order(self) -> None:
+        selector = {"tier": "backend", "component": "api"}
+        assert _workload_from_selector(selector) == str(selector)
+        assert _workload_from_selector(selector) == str(selector)
+
 
 # ---------------------------------------------------------------------------
 # tools/pod_classification.py — all remaining branches
 # ---------------------------------------------------------------------------
 
 
-# Note 43: `categorize_failure` maps a pod's top-level reason and its container
+# Note 43: `classify_pod` maps a pod's top-level reason and its container
 # waiting reasons to one of several failure categories: "scheduling", "registry",
 # "config", "runtime", or "unknown". The test class below drives a single test
 # per category per input pathway (top-level reason vs container-level reason) to
 # achieve full branch coverage of the lookup tables.
-class TestCategorizeFailureWaitingReasons:
+def _category(reason: str | None, container_statuses: list[dict]) -> str:
+    return classify_pod({"phase": "Running", "reason": reason, "container_statuses": container_statuses}).category
+
+
+class TestClassifyPodCategories:
     def test_scheduling_waiting_reason(self) -> None:
         # Note 44: Container statuses are passed as a list of dicts, each with a
         # nested `state.waiting.reason` structure that mirrors the Kubernetes pod
         # status JSON. The top-level reason argument is `None` here to confirm that
         # the container-level reason alone is sufficient to trigger the classification.
         cs = [{"state": {"waiting": {"reason": "FailedScheduling"}}}]
-        assert categorize_failure(None, cs) == "scheduling"
+        assert _category(None, cs) == "scheduling"
 
     def test_registry_waiting_reason(self) -> None:
         cs = [{"state": {"waiting": {"reason": "ImagePullBackOff"}}}]
-        assert categorize_failure(None, cs) == "registry"
+        assert _category(None, cs) == "registry"
 
     def test_config_waiting_reason(self) -> None:
         cs = [{"state": {"waiting": {"reason": "CreateContainerConfigError"}}}]
-        assert categorize_failure(None, cs) == "config"
+        assert _category(None, cs) == "config"
 
     def test_runtime_top_level_reason(self) -> None:
         # Note 45: An empty container status list `[]` forces the function to fall
         # through to the top-level reason lookup. "CrashLoopBackOff" is in the
         # RUNTIME_REASONS set, so the expected category is "runtime".
-        assert categorize_failure("CrashLoopBackOff", []) == "runtime"
+        assert _category("CrashLoopBackOff", []) == "runtime"
 
     def test_registry_top_level_reason(self) -> None:
         # Covers line 38: top-level reason in REGISTRY_REASONS with no container statuses
@@ -614,17 +635,17 @@ class TestCategorizeFailureWaitingReasons:
         # coverage report. The comment from the original developer confirms which exact
         # source line is being targeted. This practice of citing the line number
         # bridges the gap between coverage tooling and test intent.
-        assert categorize_failure("ImagePullBackOff", []) == "registry"
+        assert _category("ImagePullBackOff", []) == "registry"
 
     def test_config_top_level_reason(self) -> None:
-        assert categorize_failure("InvalidImageName", []) == "config"
+        assert _category("InvalidImageName", []) == "config"
 
 
-# Note 47: `is_unhealthy` evaluates a pod dict and returns `True` if the pod shows
+# Note 47: `classify_pod(...).unhealthy` is `True` when the pod shows
 # signs of unhealthy behaviour. The two tests below each target a distinct branch:
 # OOMKilled in the last-terminated state (a past crash) and a waiting reason that
 # falls into the combined "bad reasons" set (an ongoing crash or image issue).
-class TestIsUnhealthyOomKill:
+class TestClassifyPodUnhealthy:
     def test_oomkill_in_last_terminated_is_unhealthy(self) -> None:
         # Note 48: `last_terminated` is distinct from the current `state`. A pod
         # running fine right now might still be unhealthy if its most recent container
@@ -639,10 +660,10 @@ class TestIsUnhealthyOomKill:
                 }
             ],
         }
-        assert is_unhealthy(pod) is True
+        assert classify_pod(pod).unhealthy is True
 
     def test_waiting_runtime_reason_is_unhealthy(self) -> None:
-        # Covers line 54: waiting reason in RUNTIME_REASONS | REGISTRY_REASONS | CONFIG_REASONS
+        # Covers line 54: waiting reason in UNHEALTHY_REASONS
         # Note 49: A pod in "Running" phase with a container in waiting state might
         # seem paradoxical, but Kubernetes allows this during crash-loop recovery. The
         # function must look inside the container statuses even when the pod phase
@@ -657,7 +678,84 @@ class TestIsUnhealthyOomKill:
                 }
             ],
         }
-        assert is_unhealthy(pod) is True
+        assert classify_pod(pod).unhealthy is True
+
+
+# Note 50: `classify_pod` answers "unhealthy?", "which category?" and "which container
+# was OOMKilled?" in one walk; each case below pins the expected pair of answers.
+class TestClassifyPod:
+    @pytest.mark.parametrize(
+        ("pod", "unhealthy", "category"),
+        [
+            ({"phase": "Running", "container_statuses": []}, False, "unknown"),
+            ({"phase": "Pending", "reason": "Unschedulable", "container_statuses": []}, True, "scheduling"),
+            ({"phase": "Failed", "reason": "Error", "container_statuses": []}, True, "runtime"),
+            ({"phase": "Unknown", "reason": "Evicted", "container_statuses": []}, True, "unknown"),
+            (
+                {
+                    "phase": "Running",
+                    "reason": "ImagePullBackOff",
+                    "container_statuses": [
+                        {"state": {"waiting": {"reason": "CreateContainerConfigError"}}},
+                        {"state": {"waiting": {"reason": "CrashLoopBackOff"}}},
+                    ],
+                },
+                True,
+                "config",
+            ),
+            (
+                {
+                    "phase": "Running",
+                    "container_statuses": [
+                        {"state": {"running": {}}, "last_terminated": {"reason": "Completed"}},
+                        {"state": {"waiting": {"reason": "ErrImagePull"}}},
+                    ],
+                },
+                True,
+                "registry",
+            ),
+            (
+                {
+                    "phase": "Pending",
+                    "reason": "ErrImagePull",
+                    "container_statuses": [{"state": {"waiting": {"reason": "ContainerCreating"}}}],
+                },
+                True,
+                "registry",
+            ),
+        ],
+    )
+    def test_health_and_category(self, pod: dict, unhealthy: bool, category: str) -> None:
+        result = classify_pod(pod)
+        assert result.unhealthy is unhealthy
+        assert result.category == category
+
+    def test_oomkill_reports_first_killed_container_restarts(self) -> None:
+        pod = {
+            "phase": "Running",
+            "container_statuses": [
+                {"name": "sidecar", "state": {}, "restart_count": 1},
+                {"name": "app", "state": {}, "restart_count": 4, "last_terminated": {"reason": "OOMKilled"}},
+                {"name": "proxy", "state": {}, "restart_count": 2, "last_terminated": {"reason": "OOMKilled"}},
+            ],
+        }
+        result = classify_pod(pod)
+        assert result.unhealthy is True
+        assert result.category == "runtime"
+        assert result.oom_container == "app"
+        assert result.restart_count == 4
+
+    def test_restarts_summed_without_oomkill(self) -> None:
+        pod = {
+            "phase": "Running",
+            "container_statuses": [
+                {"name": "app", "state": {"waiting": {"reason": "CrashLoopBackOff"}}, "restart_count": 3},
+                {"name": "sidecar", "state": {}, "restart_count": 2},
+            ],
+        }
+        result = classify_pod(pod)
+        assert result.oom_container is None
+        assert result.restart_count == 5
 
 
 # ---------------------------------------------------------------------------
@@ -665,7 +763,7 @@ class TestIsUnhealthyOomKill:
 # ---------------------------------------------------------------------------
 
 
-# Note 50: `_make_ph_pod` is a module-level factory for pod health test data. Default
+# Note 51: `_make_ph_pod` is a module-level factory for pod health test data. Default
 # values represent the most common test scenario (a pending pod with an unschedulable
 # reason). Callers override only the fields relevant to their specific test case,
 # keeping test data minimal and the intent legible.
@@ -687,7 +785,7 @@ def _make_ph_pod(
 
 
 class TestPodHealthExtraCoverage:
-    # Note 51: The events-exception test covers the branch where the pod listing
+    # Note 52: The events-exception test covers the branch where the pod listing
     # succeeds but the subsequent call to fetch events fails. The handler is expected
     # to append an error with source "events-api" rather than raising. Returning an
     # empty pod list from `mock_core` isolates the events error path; if pods were
@@ -706,7 +804,7 @@ class TestPodHealthExtraCoverage:
 
         assert any(e.source == "events-api" for e in result.errors)
 
-    # Note 52: The `status_filter="failed"` test exercises the filtering branch inside
+    # Note 53: The `status_filter="failed"` test exercises the filtering branch inside
     # `get_pod_health_handler`. Two pods are returned by the mock: one Pending and one
     # Failed. The filter should keep only Failed pods. Using two pods of different
     # phases guarantees the filter is actually applied rather than trivially passing
@@ -726,7 +824,7 @@ class TestPodHealthExtraCoverage:
         ):
             result = await get_pod_health_handler("prod-eastus", status_filter="failed")
 
-        # Note 53: `all(p.phase == "Failed" for p in result.pods)` asserts the
+        # Note 54: `all(p.phase == "Failed" for p in result.pods)` asserts the
         # invariant that every pod in the result matches the filter. An empty list
         # would make this assertion vacuously true, so a robust follow-up check would
         # also assert `len(result.pods) > 0`. The current assertion is sufficient
@@ -734,7 +832,7 @@ class TestPodHealthExtraCoverage:
         assert all(p.phase == "Failed" for p in result.pods)
 
     async def test_fan_out_skips_failed_clusters(self) -> None:
-        # Note 54: `PodHealthOutput` includes `groups` (a dict) and `total_matching`
+        # Note 55: `PodHealthOutput` includes `groups` (a dict) and `total_matching`
         # and `truncated` fields that must be present for the model to validate. The
         # "good" result is constructed with minimal but valid values to keep the test
         # focused on the fan-out skip behaviour rather than the model shape.
@@ -762,7 +860,7 @@ class TestPodHealthExtraCoverage:
 # ---------------------------------------------------------------------------
 
 
-# Note 55: `_parse_ts` is a thin wrapper around `datetime.fromisoformat` that returns
+# Note 56: `_parse_ts` is a thin wrapper around `datetime.fromisoformat` that returns
 # `None` instead of raising on invalid input. Testing all three branches (None input,
 # invalid string, valid string) provides a complete behavioural specification of the
 # helper in the test suite, acting as living documentation alongside the source code.
@@ -771,7 +869,7 @@ class TestParseTsHelper:
         assert _parse_ts(None) is None
 
     def test_returns_none_for_invalid_string(self) -> None:
-        # Note 56: "not-a-date" is chosen because it is clearly invalid yet will not
+        # Note 57: "not-a-date" is chosen because it is clearly invalid yet will not
         # accidentally become a valid ISO format in any future Python version. The
         # assertion confirms that the function swallows the `ValueError` from
         # `fromisoformat` and returns `None` rather than propagating the exception.
@@ -782,7 +880,7 @@ class TestParseTsHelper:
         assert isinstance(result, datetime)
 
 
-# Note 57: `_make_upg_event` creates a minimal event dict for upgrade metrics tests.
+# Note 58: `_make_upg_event` creates a minimal event dict for upgrade metrics tests.
 # All fields are required by the downstream processing code, so the factory fills them
 # all. The `timestamp` field is deliberately a positional parameter (not keyword-only)
 # to allow concise one-liner calls in test bodies.
@@ -791,7 +889,7 @@ def _make_upg_event(node_name: str, reason: str, timestamp: str) -> dict:
 
 
 class TestUpgradeMetricsExtraCoverage:
-    # Note 58: The null-timestamp test covers the `continue` statement inside the
+    # Note 59: The null-timestamp test covers the `continue` statement inside the
     # event-processing loop. When `_parse_ts` returns `None` for an event's timestamp
     # the loop skips that event entirely. Placing the null-timestamp event first in
     # the list confirms the `continue` does not affect processing of subsequent events.
@@ -799,7 +897,7 @@ class TestUpgradeMetricsExtraCoverage:
         """An event with a null timestamp is skipped via continue."""
         mock_events = AsyncMock()
         mock_events.get_node_events.return_value = [
-            # Note 59: The first event has `timestamp: None`. The `_parse_ts` call
+            # Note 60: The first event has `timestamp: None`. The `_parse_ts` call
             # on this value returns `None`, triggering the `continue`. The two
             # following events have valid timestamps and form a complete upgrade cycle
             # (NodeUpgrade → NodeReady), so the assertion can verify that exactly
@@ -820,7 +918,7 @@ class TestUpgradeMetricsExtraCoverage:
         assert result.current_run is not None
         assert result.current_run.nodes_completed == 1
 
-    # Note 60: The activity-log exception test covers the `except` block inside the
+    # Note 61: The activity-log exception test covers the `except` block inside the
     # section that fetches historical upgrade records from the Azure Monitor activity
     # log. The handler must treat this as a non-fatal error and continue returning
     # whatever data it gathered from Kubernetes events. The structured error object
@@ -839,7 +937,7 @@ class TestUpgradeMetricsExtraCoverage:
 
         assert any(e.source == "activity-log" for e in result.errors)
 
-    # Note 61: The estimated-remaining-seconds test targets the branch that computes
+    # Note 62: The estimated-remaining-seconds test targets the branch that computes
     # a time estimate when at least one node is still in progress (NodeUpgrade seen,
     # NodeReady not yet seen). The estimate is derived from the average per-node
     # duration of already-completed nodes multiplied by the remaining node count.
@@ -866,7 +964,7 @@ class TestUpgradeMetricsExtraCoverage:
         assert result.current_run.estimated_remaining_seconds is not None
         assert result.current_run.estimated_remaining_seconds > 0
 
-    # Note 62: The "exact history count" test covers the conditional inside the
+    # Note 63: The "exact history count" test covers the conditional inside the
     # summary-generation logic that chooses between "N historical records" and
     # "N of M historical records". When the number of records found equals the
     # requested `history_count`, the shorter form is used. Returning exactly 2
@@ -887,7 +985,7 @@ class TestUpgradeMetricsExtraCoverage:
         ):
             result = await get_upgrade_metrics_handler("prod-eastus", "userpool", history_count=2)
 
-        # Note 63: The negative assertion `assert "of 2" not in result.summary`
+        # Note 64: The negative assertion `assert "of 2" not in result.summary`
         # is as important as the positive one. It confirms the conditional logic
         # chose the short form over the "N of M" form. Without it, a handler that
         # always renders both phrases would pass the first assertion but still be wrong.
@@ -895,7 +993,7 @@ class TestUpgradeMetricsExtraCoverage:
         assert "of 2" not in result.summary
 
     async def test_fan_out_skips_failed_clusters(self) -> None:
-        # Note 64: `UpgradeDurationOutput` has several optional fields (`current_run`,
+        # Note 65: `UpgradeDurationOutput` has several optional fields (`current_run`,
         # `stats`, `anomaly_flag`) that are set to `None` here. This exercises the
         # fan-out collector's handling of outputs that may have partially populated
         # fields, ensuring the collector does not crash when optional fields are absent.
@@ -923,7 +1021,7 @@ class TestUpgradeMetricsExtraCoverage:
 # ---------------------------------------------------------------------------
 
 
-# Note 65: `_parse_event_timestamp` mirrors `_parse_ts` but is specific to the
+# Note 66: `_parse_event_timestamp` mirrors `_parse_ts` but is specific to the
 # upgrade-progress module. Separate helper functions in separate modules are tested
 # separately even if they share the same logic, because each module import path is
 # independent and refactoring one must not silently break the other.
@@ -939,7 +1037,7 @@ class TestParseEventTimestampHelper:
         assert isinstance(result, datetime)
 
 
-# Note 66: `_make_upg_pool` creates a node pool dict that represents a pool currently
+# Note 67: `_make_upg_pool` creates a node pool dict that represents a pool currently
 # undergoing a Kubernetes version upgrade. `provisioning_state="Upgrading"` is the
 # key field that tells the handler this pool should be tracked. Default versions are
 # set to a realistic upgrade pair (1.29.8 → 1.30.0) so tests that check version
@@ -965,7 +1063,7 @@ def _make_upg_pool(
     }
 
 
-# Note 67: `_make_upg_node` is a factory for node dicts used in upgrade-progress
+# Note 68: `_make_upg_node` is a factory for node dicts used in upgrade-progress
 # tests. The `unschedulable` flag is a first-class parameter because cordoning
 # (marking a node unschedulable) is one of the key signals the handler uses to
 # determine whether a node is being drained as part of the upgrade process.
@@ -987,7 +1085,7 @@ def _make_upg_node(
     }
 
 
-# Note 68: `_make_upg_evt` creates a node event dict. The default timestamp is a
+# Note 69: `_make_upg_evt` creates a node event dict. The default timestamp is a
 # hardcoded past time to ensure tests that do not care about timing have a stable,
 # non-expiring timestamp. Tests that need to simulate "within threshold" or "past
 # threshold" scenarios override the timestamp with a computed relative value.
@@ -996,7 +1094,7 @@ def _make_upg_evt(node_name: str, reason: str, timestamp: str = "2026-02-28T10:0
 
 
 class TestUpgradeProgressExtraCoverage:
-    # Note 69: The "upgrading" state test confirms the classification branch where a
+    # Note 70: The "upgrading" state test confirms the classification branch where a
     # node has a NodeUpgrade event within the anomaly threshold window and is NOT
     # cordoned. This is the normal, expected state of a node mid-upgrade. Using
     # `timedelta(minutes=5)` for the event timestamp places it well within the 60-
@@ -1012,7 +1110,7 @@ class TestUpgradeProgressExtraCoverage:
         }
         mock_core = AsyncMock()
         mock_core.get_nodes.return_value = [_make_upg_node("node-1", unschedulable=False)]
-        mock_core.get_pods.return_value = []
+        mock_core.get_pods_on_node.return_value = []
         mock_events = AsyncMock()
         # Very recent event — well within the 60-minute anomaly threshold
         recent_ts = (datetime.now(tz=UTC) - timedelta(minutes=5)).isoformat()
@@ -1031,7 +1129,7 @@ class TestUpgradeProgressExtraCoverage:
 
         assert result.nodes[0].state == "upgrading"
 
-    # Note 70: The "stalled" state test is the mirror of the "upgrading" test above.
+    # Note 71: The "stalled" state test is the mirror of the "upgrading" test above.
     # Using `timedelta(hours=2)` places the NodeUpgrade event 120 minutes ago, which
     # exceeds the 60-minute anomaly threshold. With no NodeReady event and no PDB
     # blockers, the handler should classify the node as "stalled" rather than
@@ -1047,7 +1145,7 @@ class TestUpgradeProgressExtraCoverage:
         }
         mock_core = AsyncMock()
         mock_core.get_nodes.return_value = [_make_upg_node("node-1", unschedulable=False)]
-        mock_core.get_pods.return_value = []
+        mock_core.get_pods_on_node.return_value = []
         mock_events = AsyncMock()
         # Upgrade event 2 hours ago (well past 60-minute anomaly threshold)
         old_ts = (datetime.now(tz=UTC) - timedelta(hours=2)).isoformat()
@@ -1066,7 +1164,7 @@ class TestUpgradeProgressExtraCoverage:
 
         assert result.nodes[0].state == "stalled"
 
-    # Note 71: The "pdb_blocked" test at the anomaly threshold combines three
+    # Note 72: The "pdb_blocked" test at the anomaly threshold combines three
     # conditions: (a) a NodeUpgrade event older than the threshold, (b) the node is
     # cordoned (`unschedulable=True`), and (c) there are active PDB blockers from
     # `evaluate_pdb_satisfiability`. All three must be true for the handler to classify
@@ -1082,11 +1180,11 @@ class TestUpgradeProgressExtraCoverage:
             "fqdn": "test.eastus.azmk8s.io",
         }
         mock_core = AsyncMock()
-        # Note 72: `unschedulable=True` simulates a cordoned node — one that has been
+        # Note 73: `unschedulable=True` simulates a cordoned node — one that has been
         # drained as part of the upgrade but has not yet completed. The combination
         # of "cordoned + PDB blocker" is what distinguishes "pdb_blocked" from "stalled".
         mock_core.get_nodes.return_value = [_make_upg_node("node-1", unschedulable=True)]
-        mock_core.get_pods.return_value = []
+        mock_core.get_pods_on_node.return_value = []
         mock_events = AsyncMock()
         old_ts = (datetime.now(tz=UTC) - timedelta(hours=2)).isoformat()
         mock_events.get_node_events.return_value = [_make_upg_evt("node-1", "NodeUpgrade", old_ts)]
@@ -1108,7 +1206,7 @@ class TestUpgradeProgressExtraCoverage:
 
         assert result.nodes[0].state == "pdb_blocked"
 
-    # Note 73: This test is the within-threshold counterpart to the pdb_blocked test
+    # Note 74: This test is the within-threshold counterpart to the pdb_blocked test
     # above. Here the NodeUpgrade event is recent (5 minutes ago, within the 60-minute
     # threshold) but the node is still cordoned and blocked by a PDB. The handler must
     # classify the node as "pdb_blocked" regardless of whether the threshold is
@@ -1124,7 +1222,7 @@ class TestUpgradeProgressExtraCoverage:
         }
         mock_core = AsyncMock()
         mock_core.get_nodes.return_value = [_make_upg_node("node-1", unschedulable=True)]
-        mock_core.get_pods.return_value = []
+        mock_core.get_pods_on_node.return_value = []
         mock_events = AsyncMock()
         recent_ts = (datetime.now(tz=UTC) - timedelta(minutes=5)).isoformat()
         mock_events.get_node_events.return_value = [_make_upg_evt("node-1", "NodeUpgrade", recent_ts)]
@@ -1146,9 +1244,9 @@ class TestUpgradeProgressExtraCoverage:
 
         assert result.nodes[0].state == "pdb_blocked"
 
-    # Note 74: The pod-transitions exception test covers the `except` block inside
+    # Note 75: The pod-transitions exception test covers the `except` block inside
     # `_collect_pod_transitions`. The function fetches pods from the Kubernetes API
-    # and Kubernetes events to build a pod movement timeline. When `get_pods` raises,
+    # and Kubernetes events to build a pod movement timeline. When `get_pods_on_node` raises,
     # the handler is expected to catch the error, append a structured error record
     # with source "k8s-api", and continue so the caller receives a partial result.
     async def test_pod_transitions_exception_adds_error(self) -> None:
@@ -1162,11 +1260,11 @@ class TestUpgradeProgressExtraCoverage:
         }
         mock_core = AsyncMock()
         mock_core.get_nodes.return_value = [_make_upg_node("node-1", unschedulable=True)]
-        # Note 75: `side_effect = Exception(...)` on `get_pods` rather than
+        # Note 76: `side_effect = Exception(...)` on `get_pods_on_node` rather than
         # `get_nodes` ensures the exception is raised during the pod-collection
         # phase rather than the node-collection phase. This pinpoints which code path
         # produces the "k8s-api" error entry.
-        mock_core.get_pods.side_effect = Exception("K8s API unavailable")
+        mock_core.get_pods_on_node.side_effect = Exception("K8s API unavailable")
         mock_events = AsyncMock()
         mock_events.get_node_events.return_value = []
         mock_policy = AsyncMock()
@@ -1183,7 +1281,7 @@ class TestUpgradeProgressExtraCoverage:
 
         assert any(e.source == "k8s-api" for e in result.errors)
 
-    # Note 76: The node_pool filter test verifies that passing `node_pool="system"`
+    # Note 77: The node_pool filter test verifies that passing `node_pool="system"`
     # narrows the set of upgrading pools considered by the handler. Two pools are
     # provided ("system" and "user") but only "system" matches the filter. The
     # assertion checks `result.upgrade_in_progress is True` and `result.node_pool ==
@@ -1199,7 +1297,7 @@ class TestUpgradeProgressExtraCoverage:
         }
         mock_core = AsyncMock()
         mock_core.get_nodes.return_value = [_make_upg_node("node-1", pool="system")]
-        mock_core.get_pods.return_value = []
+        mock_core.get_pods_on_node.return_value = []
         mock_events = AsyncMock()
         mock_events.get_node_events.return_value = []
         mock_policy = AsyncMock()
@@ -1217,7 +1315,7 @@ class TestUpgradeProgressExtraCoverage:
         assert result.upgrade_in_progress is True
         assert result.node_pool == "system"
 
-    # Note 77: The node-level filter test is complementary to the pool-level filter
+    # Note 78: The node-level filter test is complementary to the pool-level filter
     # test above. It verifies that when `node_pool="userpool"` is specified, nodes
     # belonging to other pools ("systempool") are excluded from `result.nodes`. Two
     # nodes in different pools are provided so the test can assert both inclusion
@@ -1232,7 +1330,7 @@ class TestUpgradeProgressExtraCoverage:
             "fqdn": "test.eastus.azmk8s.io",
         }
         mock_core = AsyncMock()
-        # Note 78: Two nodes from two different pools let us confirm both the
+        # Note 79: Two nodes from two different pools let us confirm both the
         # inclusion and exclusion sides of the filter in one test. Checking a set
         # comprehension `{n.name for n in result.nodes}` is more Pythonic than
         # iterating and is O(1) for membership checks, which matters when result
@@ -1241,7 +1339,7 @@ class TestUpgradeProgressExtraCoverage:
             _make_upg_node("node-sys", pool="systempool"),
             _make_upg_node("node-usr", pool="userpool"),
         ]
-        mock_core.get_pods.return_value = []
+        mock_core.get_pods_on_node.return_value = []
         mock_events = AsyncMock()
         mock_events.get_node_events.return_value = []
         mock_policy = AsyncMock()
@@ -1260,7 +1358,7 @@ class TestUpgradeProgressExtraCoverage:
         assert "node-usr" in node_names
         assert "node-sys" not in node_names
 
-    # Note 79: The duration-estimation test covers the branch that computes
+    # Note 80: The duration-estimation test covers the branch that computes
     # `elapsed_seconds` and `estimated_remaining_seconds` for an in-progress upgrade.
     # The handler needs at least one completed node (node-1, version v1.30.0) to
     # calculate a per-node average, and at least one pending node (node-2, still at
@@ -1280,9 +1378,9 @@ class TestUpgradeProgressExtraCoverage:
             _make_upg_node("node-1", version="v1.30.0"),  # will be upgraded
             _make_upg_node("node-2", version="v1.29.8"),  # still pending
         ]
-        mock_core.get_pods.return_value = []
+        mock_core.get_pods_on_node.return_value = []
         mock_events = AsyncMock()
-        # Note 80: `recent_ts` and `ready_ts` are computed relative to `now` so the
+        # Note 81: `recent_ts` and `ready_ts` are computed relative to `now` so the
         # test never becomes stale as wall-clock time advances. Using
         # `datetime.now(tz=UTC)` with a fixed `timedelta` offset ensures the event
         # timestamps are always in the recent past, within the anomaly window.
@@ -1308,14 +1406,14 @@ class TestUpgradeProgressExtraCoverage:
         assert result.estimated_remaining_seconds is not None
         assert result.estimated_remaining_seconds > 0
 
-    # Note 81: The final fan-out error test in this file follows the same
+    # Note 82: The final fan-out error test in this file follows the same
     # `AsyncMock(side_effect=[error] + [good] * N)` pattern seen in every other tool.
     # Consistency across all fan-out tests is intentional: it makes the pattern
     # recognisable, allows future engineers to follow the same pattern when adding new
     # *_all tools, and ensures that the fan-out skip behaviour is verified for every
     # tool that fans out across clusters.
     async def test_fan_out_skips_failed_clusters(self) -> None:
-        # Note 82: `UpgradeProgressOutput` requires `upgrade_in_progress` and `nodes`
+        # Note 83: `UpgradeProgressOutput` requires `upgrade_in_progress` and `nodes`
         # fields in addition to the common fields. Setting `upgrade_in_progress=False`
         # and `nodes=[]` produces a valid "quiet" result that represents a cluster
         # where no upgrade is currently active, which is the most common state.
@@ -1477,6 +1575,20 @@ class TestParserErrorHandling:
     def test_memory_parse_invalid_with_suffix_returns_zero(self) -> None:
         assert _parse_memory_bytes("abcGi") == 0.0
 
+    def test_memory_parse_unknown_suffix_returns_zero(self) -> None:
+        assert _parse_memory_bytes("5Xi") == 0.0
+
+    def test_cpu_parse_non_string_returns_zero(self) -> None:
+        assert _parse_cpu_millicores(None) == 0.0  # type: ignore[arg-type]
+
+    def test_repeated_values_hit_cache(self) -> None:
+        _parse_memory_bytes.cache_clear()
+        for _ in range(3):
+            assert _parse_memory_bytes("8Gi") == 8 * 1024**3
+        info = _parse_memory_bytes.cache_info()
+        assert info.misses == 1
+        assert info.hits == 2
+
 
 class TestTimestampUtility:
     """Tests for the shared parse_iso_timestamp utility."""
@@ -1503,6 +1615,18 @@ class TestTimestampUtility:
 
         assert parse_iso_timestamp("not-a-date") is None
 
+    def test_parse_is_memoised(self) -> None:
+        from platform_mcp_server.utils import parse_iso_timestamp
+
+        parse_iso_timestamp.cache_clear()
+        first = parse_iso_timestamp("2026-02-28T12:00:00Z")
+        assert parse_iso_timestamp("2026-02-28T12:00:00Z") is first
+        assert first is not None
+        assert first.utcoffset() is not None
+        info = parse_iso_timestamp.cache_info()
+        assert info.misses == 1
+        assert info.hits == 1
+
 
 class TestGetClusterInfoErrorHandling:
     """Tests for try/except around get_cluster_info in upgrade_progress."""
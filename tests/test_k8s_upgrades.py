@@ -7,6 +7,8 @@
 # On Python 3.12+, this behaviour is the default and the import is a no-op.
 from __future__ import annotations
 
+import asyncio
+
 # Note 2: `AsyncMock` is essential any time the code under test calls `await` on a
 # collaborator. A regular `MagicMock` does not produce awaitable objects, so
 # `await mock.some_method()` would raise `TypeError: object MagicMock can't be used
@@ -233,3 +235,31 @@ class TestGetUpgradeStatus:
         # metrics-server failures, network issues, or validation errors.
         assert len(result.errors) > 0
         assert result.errors[0].source == "aks-api"
+
+    async def test_cluster_info_and_profile_fetched_concurrently(self) -> None:
+        # Note 23: Each mock waits for the other call to have started before returning.
+        # If the handler awaited the two AKS calls one after the other, the first would
+        # never see the second begin and `asyncio.wait_for` would time out.
+        info_started = asyncio.Event()
+        profile_started = asyncio.Event()
+
+        async def _cluster_info() -> dict:
+            info_started.set()
+            await profile_started.wait()
+            return _make_cluster_info()
+
+        async def _upgrade_profile() -> dict:
+            profile_started.set()
+            await info_started.wait()
+            return _make_upgrade_profile()
+
+        mock_aks = AsyncMock()
+        mock_aks.get_cluster_info.side_effect = _cluster_info
+        mock_aks.get_upgrade_profile.side_effect = _upgrade_profile
+
+        with patch("platform_mcp_server.tools.k8s_upgrades.AzureAksClient", return_value=mock_aks):
+            result = await asyncio.wait_for(get_upgrade_status_handler("prod-eastus"), timeout=1)
+
+        assert result.control_plane_version == "1.29.8"
+        assert result.available_upgrades == ["1.30.0"]
+        assert result.errors == []
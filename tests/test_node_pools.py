@@ -19,6 +19,7 @@ from __future__ import annotations
 # way to inject test doubles without modifying production code.
 from unittest.mock import AsyncMock, patch
 
+from platform_mcp_server.config import get_thresholds
 from platform_mcp_server.tools.node_pools import check_node_pool_pressure_handler
 
 
@@ -322,6 +323,27 @@ class TestCheckNodePoolPressure:
 
         assert len(results) == 6
 
+    async def test_fan_out_resolves_shared_inputs_once(self) -> None:
+        # Thresholds and the report timestamp are computed once per batch and shared.
+        mock_core = AsyncMock()
+        mock_core.get_nodes.return_value = [_make_node("node-1", "userpool")]
+        mock_core.get_pods.return_value = []
+        mock_metrics = AsyncMock()
+        mock_metrics.get_node_metrics.return_value = [_make_metric("node-1")]
+
+        with (
+            patch("platform_mcp_server.tools.node_pools.K8sCoreClient", return_value=mock_core),
+            patch("platform_mcp_server.tools.node_pools.K8sMetricsClient", return_value=mock_metrics),
+            patch("platform_mcp_server.tools.node_pools.get_thresholds", wraps=get_thresholds) as mock_thresholds,
+        ):
+            from platform_mcp_server.tools.node_pools import check_node_pool_pressure_all
+
+            results = await check_node_pool_pressure_all()
+
+        assert len(results) == 6
+        mock_thresholds.assert_called_once()
+        assert len({r.timestamp for r in results}) == 1
+
     async def test_summary_line_present(self) -> None:
         # Note 22: This test targets the human-readable `summary` field of the result
         # object. Such fields are often overlooked because they don't affect programmatic
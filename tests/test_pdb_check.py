@@ -7,6 +7,8 @@
 # unconditionally.
 from __future__ import annotations
 
+import asyncio
+
 # Note 2: `unittest.mock` is the standard-library mocking framework. It is
 # preferred over third-party libraries (e.g., pytest-mock's `mocker`) when you
 # want tests to have zero extra dependencies. `AsyncMock` (added in Python 3.8)
@@ -20,7 +22,7 @@ from unittest.mock import AsyncMock, patch
 # the recommended pattern when you only need to test a single entry-point.
 # It also makes assertions more readable because the symbol name in the test
 # matches exactly what the production call site looks like.
-from platform_mcp_server.tools.pdb_check import check_pdb_risk_handler
+from platform_mcp_server.tools.pdb_check import CORDONED_NODE_SELECTOR, check_pdb_risk_handler
 
 
 # Note 4: Builder / factory functions (named with a leading underscore to signal
@@ -234,6 +236,20 @@ class TestCheckPdbRiskPreflight:
 
         assert len(result.risks) == 0
 
+    async def test_no_pdbs_skips_evaluation(self) -> None:
+        mock_policy = AsyncMock()
+        mock_policy.get_pdbs.return_value = []
+        mock_core = AsyncMock()
+
+        with (
+            patch("platform_mcp_server.tools.pdb_check.K8sPolicyClient", return_value=mock_policy),
+            patch("platform_mcp_server.tools.pdb_check.K8sCoreClient", return_value=mock_core),
+        ):
+            result = await check_pdb_risk_handler("prod-eastus", mode="preflight")
+
+        assert result.risks == []
+        mock_policy.evaluate_pdb_satisfiability.assert_not_called()
+
 
 # Note 24: Separating "preflight" and "live" scenarios into distinct test
 # classes documents that these are two distinct execution modes of the same
@@ -298,8 +314,124 @@ class TestCheckPdbRiskLive:
 
         assert len(result.risks) == 0
 
+    async def test_pdbs_and_nodes_fetched_concurrently(self) -> None:
+        # Note 29: Each mock waits until the other call has started. If the handler
+        # listed PDBs and nodes one after the other, neither event would be set in
+        # time and `asyncio.wait_for` would raise TimeoutError.
+        pdbs_started = asyncio.Event()
+        nodes_started = asyncio.Event()
+
+        async def _get_pdbs() -> list[dict]:
+            pdbs_started.set()
+            await nodes_started.wait()
+            return []
+
+        async def _get_nodes(**_: str | None) -> list[dict]:
+            nodes_started.set()
+            await pdbs_started.wait()
+            return [_make_node("node-1", unschedulable=True)]
+
+        mock_policy = AsyncMock()
+        mock_policy.get_pdbs.side_effect = _get_pdbs
+        mock_policy.evaluate_pdb_satisfiability.return_value = []
+        mock_core = AsyncMock()
+        mock_core.get_nodes.side_effect = _get_nodes
+
+        with (
+            patch("platform_mcp_server.tools.pdb_check.K8sPolicyClient", return_value=mock_policy),
+            patch("platform_mcp_server.tools.pdb_check.K8sCoreClient", return_value=mock_core),
+        ):
+            result = await asyncio.wait_for(check_pdb_risk_handler("prod-eastus", mode="live"), timeout=1)
+
+        assert result.risks == []
+
+    async def test_evaluation_overlaps_node_listing(self) -> None:
+        # Note 30: get_nodes only returns after satisfiability evaluation has begun,
+        # so the handler must start evaluating PDBs without waiting for the node list.
+        evaluation_started = asyncio.Event()
+
+        async def _evaluate(pdbs: list[dict]) -> list[dict]:
+            evaluation_started.set()
+            return []
+
+        async def _get_nodes(**_: str | None) -> list[dict]:
+            await evaluation_started.wait()
+            return [_make_node("node-1", unschedulable=True)]
+
+        mock_policy = AsyncMock()
+        mock_policy.get_pdbs.return_value = [_make_pdb(name="safe-pdb", disruptions_allowed=1)]
+        mock_policy.evaluate_pdb_satisfiability.side_effect = _evaluate
+        mock_core = AsyncMock()
+        mock_core.get_nodes.side_effect = _get_nodes
+
+        with (
+            patch("platform_mcp_server.tools.pdb_check.K8sPolicyClient", return_value=mock_policy),
+            patch("platform_mcp_server.tools.pdb_check.K8sCoreClient", return_value=mock_core),
+        ):
+            result = await asyncio.wait_for(check_pdb_risk_handler("prod-eastus", mode="live"), timeout=1)
+
+        assert result.risks == []
+
+    async def test_node_pool_scopes_node_listing(self) -> None:
+        # Note 31: With a node_pool the handler asks the client for that pool's nodes
+        # only, so the label selector is applied server-side instead of listing the
+        # whole cluster and discarding other pools' nodes.
+        mock_policy = AsyncMock()
+        blocker = _make_pdb(name="tight-pdb", max_unavailable=0)
+        mock_policy.get_pdbs.return_value = [blocker]
+        mock_policy.evaluate_pdb_satisfiability.return_value = [{**blocker, "block_reason": "maxUnavailable=0"}]
+        mock_core = AsyncMock()
+        mock_core.get_pool_nodes.return_value = [_make_node("node-1", unschedulable=True)]
+
+        with (
+            patch("platform_mcp_server.tools.pdb_check.K8sPolicyClient", return_value=mock_policy),
+            patch("platform_mcp_server.tools.pdb_check.K8sCoreClient", return_value=mock_core),
+        ):
+            await check_pdb_risk_handler("prod-eastus", node_pool="userpool", mode="live")
+
+        mock_core.get_pool_nodes.assert_awaited_once_with("userpool", field_selector=CORDONED_NODE_SELECTOR)
+        mock_core.get_nodes.assert_not_called()
+
+    async def test_live_mode_lists_only_cordoned_nodes(self) -> None:
+        blocker = _make_pdb(name="tight-pdb", max_unavailable=0)
+        mock_policy = AsyncMock()
+        mock_policy.get_pdbs.return_value = [blocker]
+        mock_policy.evaluate_pdb_satisfiability.return_value = [{**blocker, "block_reason": "maxUnavailable=0"}]
+        mock_core = AsyncMock()
+        mock_core.get_nodes.return_value = []
+
+        with (
+            patch("platform_mcp_server.tools.pdb_check.K8sPolicyClient", return_value=mock_policy),
+            patch("platform_mcp_server.tools.pdb_check.K8sCoreClient", return_value=mock_core),
+        ):
+            result = await check_pdb_risk_handler("prod-eastus", mode="live")
+
+        mock_core.get_nodes.assert_awaited_once_with(field_selector=CORDONED_NODE_SELECTOR)
+        assert result.summary == "No active PDB blocks detected in prod-eastus"
+
+    async def test_no_blockers_skips_waiting_for_nodes(self) -> None:
+        # The node listing never finishes here; without blockers the handler must not wait for it.
+        async def _get_nodes(**_: str | None) -> list[dict]:
+            await asyncio.Event().wait()
+            return []
+
+        mock_policy = AsyncMock()
+        mock_policy.get_pdbs.return_value = [_make_pdb(name="safe-pdb", disruptions_allowed=1)]
+        mock_policy.evaluate_pdb_satisfiability.return_value = []
+        mock_core = AsyncMock()
+        mock_core.get_nodes.side_effect = _get_nodes
+
+        with (
+            patch("platform_mcp_server.tools.pdb_check.K8sPolicyClient", return_value=mock_policy),
+            patch("platform_mcp_server.tools.pdb_check.K8sCoreClient", return_value=mock_core),
+        ):
+            result = await asyncio.wait_for(check_pdb_risk_handler("prod-eastus", mode="live"), timeout=1)
+
+        assert result.risks == []
+        assert result.summary == "No active PDB blocks detected in prod-eastus"
+
 
-# Note 29: The "fan-out" test class covers a different code path entirely: the
+# Note 32: The "fan-out" test class covers a different code path entirely: the
 # `check_pdb_risk_all` function that iterates over every known cluster and
 # calls the single-cluster handler for each one. Separating this into its own
 # class makes it clear that fan-out logic is tested independently of the
@@ -316,7 +448,7 @@ class TestCheckPdbRiskFanOut:
             patch("platform_mcp_server.tools.pdb_check.K8sPolicyClient", return_value=mock_policy),
             patch("platform_mcp_server.tools.pdb_check.K8sCoreClient", return_value=mock_core),
         ):
-            # Note 30: Importing `check_pdb_risk_all` *inside* the `with` block
+            # Note 33: Importing `check_pdb_risk_all` *inside* the `with` block
             # is a deliberate technique used when the import itself triggers
             # module-level code that reads the symbol being patched. By deferring
             # the import until after the patches are active you guarantee that
@@ -328,7 +460,7 @@ class TestCheckPdbRiskFanOut:
 
             results = await check_pdb_risk_all()
 
-        # Note 31: Asserting `len(results) == 6` encodes the expected number of
+        # Note 34: Asserting `len(results) == 6` encodes the expected number of
         # clusters in the platform. This is a contract test: if a new cluster is
         # added to the platform's cluster registry the test will fail with a
         # clear count mismatch, prompting the developer to also update any
@@ -8,6 +8,8 @@
 # natively supported.
 from __future__ import annotations
 
+import asyncio
+
 # Note 2: `datetime` and `UTC` are imported from the standard library's `datetime`
 # module. `UTC` (available from Python 3.11 onward, or as `timezone.utc` on earlier
 # versions) is a timezone-aware sentinel representing Coordinated Universal Time. Using
@@ -23,7 +25,7 @@ from datetime import UTC, datetime
 # double for the duration of a test, restoring the original on exit.
 from unittest.mock import AsyncMock, patch
 
-from platform_mcp_server.tools.pod_health import get_pod_health_handler
+from platform_mcp_server.tools.pod_health import POD_LIST_RESOURCE_VERSION, get_pod_health_handler
 
 
 # Note 4: The `_make_pod` factory uses the Object Mother pattern. Default arguments
@@ -286,7 +288,9 @@ class TestGetPodHealth:
         # because it distinguishes between "the handler fetched all pods and filtered
         # client-side" versus "the handler fetched only the right pods server-side".
         # Server-side filtering is preferable for performance.
-        mock_core.get_pods.assert_called_once_with(namespace="payments")
+        mock_core.get_pods.assert_called_once_with(
+            namespace="payments", field_selector=None, resource_version=POD_LIST_RESOURCE_VERSION
+        )
 
     async def test_status_filter_pending(self) -> None:
         # Note 23: The `status_filter` parameter allows callers to request only pods
@@ -375,3 +379,102 @@ class TestGetPodHealth:
             results = await get_pod_health_all()
 
         assert len(results) == 6
+
+    async def test_pods_and_events_fetched_concurrently(self) -> None:
+        # Note 29: Each mock waits until the other call has started, so the handler only
+        # completes if the pod list and event requests are in flight at the same time.
+        pods_started = asyncio.Event()
+        events_started = asyncio.Event()
+
+        async def get_pods(namespace: str | None = None, **_: str | None) -> list[dict]:
+            pods_started.set()
+            await events_started.wait()
+            return [_make_pod("pod-1", phase="Pending", reason="Unschedulable")]
+
+        async def get_pod_events(namespace: str | None = None) -> list[dict]:
+            events_started.set()
+            await pods_started.wait()
+            return [_make_event("pod-1", message="0/12 nodes available")]
+
+        mock_core = AsyncMock()
+        mock_core.get_pods.side_effect = get_pods
+        mock_events = AsyncMock()
+        mock_events.get_pod_events.side_effect = get_pod_events
+
+        with (
+            patch("platform_mcp_server.tools.pod_health.K8sCoreClient", return_value=mock_core),
+            patch("platform_mcp_server.tools.pod_health.K8sEventsClient", return_value=mock_events),
+        ):
+            result = await asyncio.wait_for(get_pod_health_handler("prod-eastus"), timeout=1)
+
+        assert result.total_matching == 1
+        assert result.pods[0].last_event == "0/12 nodes available"
+
+    async def test_pods_failure_returns_error_instead_of_raising(self) -> None:
+        mock_core = AsyncMock()
+        mock_core.get_pods.side_effect = Exception("K8s API unavailable")
+        mock_events = AsyncMock()
+        mock_events.get_pod_events.return_value = []
+
+        with (
+            patch("platform_mcp_server.tools.pod_health.K8sCoreClient", return_value=mock_core),
+            patch("platform_mcp_server.tools.pod_health.K8sEventsClient", return_value=mock_events),
+        ):
+            result = await get_pod_health_handler("prod-eastus")
+
+        assert result.pods == []
+        assert result.total_matching == 0
+        assert [e.source for e in result.errors] == ["k8s-api"]
+        assert "Failed to retrieve pods" in result.summary
+
+    async def test_status_filter_pushed_to_field_selector(self) -> None:
+        # Note 30: A single-phase filter is sent to the API server; "all" must not be, since
+        # Running pods can still be unhealthy (see test_namespace_filtering for that call).
+        mock_core = AsyncMock()
+        mock_core.get_pods.return_value = [_make_pod("pod-1", phase="Failed", reason="Error")]
+        mock_events = AsyncMock()
+        mock_events.get_pod_events.return_value = []
+
+        with (
+            patch("platform_mcp_server.tools.pod_health.K8sCoreClient", return_value=mock_core),
+            patch("platform_mcp_server.tools.pod_health.K8sEventsClient", return_value=mock_events),
+        ):
+            result = await get_pod_health_handler("prod-eastus", status_filter="failed")
+
+        mock_core.get_pods.assert_called_once_with(
+            namespace=None, field_selector="status.phase=Failed", resource_version=POD_LIST_RESOURCE_VERSION
+        )
+        assert result.total_matching == 1
+
+    async def test_newest_event_wins_regardless_of_list_order(self) -> None:
+        mock_core = AsyncMock()
+        mock_core.get_pods.return_value = [_make_pod("pod-1", phase="Pending", reason="Unschedulable")]
+        mock_events = AsyncMock()
+        mock_events.get_pod_events.return_value = [
+            _make_event("pod-1", message="newest", timestamp="2026-01-01T10:05:00+00:00"),
+            _make_event("pod-1", message="oldest", timestamp="2026-01-01T10:00:00+00:00"),
+        ]
+
+        with (
+            patch("platform_mcp_server.tools.pod_health.K8sCoreClient", return_value=mock_core),
+            patch("platform_mcp_server.tools.pod_health.K8sEventsClient", return_value=mock_events),
+        ):
+            result = await get_pod_health_handler("prod-eastus")
+
+        assert result.pods[0].last_event == "newest"
+
+    async def test_fan_out_shares_one_timestamp(self) -> None:
+        mock_core = AsyncMock()
+        mock_core.get_pods.return_value = []
+        mock_events = AsyncMock()
+        mock_events.get_pod_events.return_value = []
+
+        with (
+            patch("platform_mcp_server.tools.pod_health.K8sCoreClient", return_value=mock_core),
+            patch("platform_mcp_server.tools.pod_health.K8sEventsClient", return_value=mock_events),
+        ):
+            from platform_mcp_server.tools.pod_health import get_pod_health_all
+
+            results = await get_pod_health_all()
+
+        assert len({r.timestamp for r in results}) == 1
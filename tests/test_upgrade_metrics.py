@@ -8,6 +8,8 @@
 # evaluated when explicitly requested (e.g., by `typing.get_type_hints`).
 from __future__ import annotations
 
+import asyncio
+
 # Note 2: Both `AsyncMock` and `patch` come from the standard-library
 # `unittest.mock` module. `AsyncMock` is essential when patching clients whose
 # methods are coroutines: it ensures that `await mock.method()` resolves
@@ -16,6 +18,8 @@ from __future__ import annotations
 # then restores it automatically, keeping tests fully isolated from real I/O.
 from unittest.mock import AsyncMock, patch
 
+from platform_mcp_server.config import get_thresholds
+
 # Note 3: Importing the single handler function under test (rather than the
 # entire module) keeps the import surface small and makes it immediately clear
 # which callable is the subject of every test in this file.
@@ -133,6 +137,55 @@ class TestGetUpgradeMetrics:
         # without over-constraining the implementation.
         assert result.current_run.mean_seconds_per_node > 0
 
+    async def test_pairs_earliest_upgrade_with_latest_ready(self) -> None:
+        mock_events = AsyncMock()
+        mock_events.get_node_events.return_value = [
+            _make_node_event("node-1", "NodeReady", "2026-02-28T11:04:00+00:00"),
+            _make_node_event("node-1", "NodeUpgrade", "2026-02-28T11:01:00+00:00"),
+            _make_node_event("node-1", "NodeUpgrade", "2026-02-28T11:00:00+00:00"),
+            _make_node_event("node-1", "NodeReady", "2026-02-28T11:10:00+00:00"),
+            _make_node_event("node-2", "NodeUpgrade", "2026-02-28T11:05:00+00:00"),
+            _make_node_event("node-3", "NodeReady", "2026-02-28T11:06:00+00:00"),
+        ]
+        mock_aks = AsyncMock()
+        mock_aks.get_activity_log_upgrades.return_value = []
+
+        with (
+            patch("platform_mcp_server.tools.upgrade_metrics.K8sEventsClient", return_value=mock_events),
+            patch("platform_mcp_server.tools.upgrade_metrics.AzureAksClient", return_value=mock_aks),
+        ):
+            result = await get_upgrade_metrics_handler("prod-eastus", "userpool")
+
+        # node-1 ran 11:00 -> 11:10; node-2 is still upgrading; node-3 never started an upgrade.
+        assert result.current_run is not None
+        assert result.current_run.mean_seconds_per_node == 600
+        assert result.current_run.nodes_completed == 1
+        assert result.current_run.nodes_total == 2
+        assert result.current_run.estimated_remaining_seconds == 600
+
+    async def test_events_without_node_name_are_skipped(self) -> None:
+        mock_events = AsyncMock()
+        mock_events.get_node_events.return_value = [
+            _make_node_event("node-1", "NodeUpgrade", "2026-02-28T11:00:00+00:00"),
+            _make_node_event("node-1", "NodeReady", "2026-02-28T11:05:00+00:00"),
+            _make_node_event("", "NodeUpgrade", "2026-02-28T10:00:00+00:00"),
+            {"reason": "NodeReady", "timestamp": "2026-02-28T12:00:00+00:00"},
+        ]
+        mock_aks = AsyncMock()
+        mock_aks.get_activity_log_upgrades.return_value = []
+
+        with (
+            patch("platform_mcp_server.tools.upgrade_metrics.K8sEventsClient", return_value=mock_events),
+            patch("platform_mcp_server.tools.upgrade_metrics.AzureAksClient", return_value=mock_aks),
+        ):
+            result = await get_upgrade_metrics_handler("prod-eastus", "userpool")
+
+        # The nameless events would otherwise pair into a bogus two-hour "node".
+        assert result.current_run is not None
+        assert result.current_run.nodes_total == 1
+        assert result.current_run.slowest_node == "node-1"
+        assert result.current_run.mean_seconds_per_node == 300
+
     async def test_historical_data_from_activity_log(self) -> None:
         mock_events = AsyncMock()
         # Note 16: An empty node-events list combined with two activity-log
@@ -188,6 +241,24 @@ class TestGetUpgradeMetrics:
         assert result.stats.mean_duration_seconds > 0
         assert result.stats.p90_duration_seconds > 0
 
+    async def test_p90_picks_value_at_floor_index_of_unsorted_history(self) -> None:
+        mock_events = AsyncMock()
+        mock_events.get_node_events.return_value = []
+        mock_aks = AsyncMock()
+        # 20 records arrive out of order; int(20 * 0.9) = 18 selects the second-largest value.
+        durations = [600 * i for i in (7, 3, 20, 1, 12, 19, 5, 9, 14, 2, 18, 4, 11, 6, 17, 8, 13, 10, 16, 15)]
+        mock_aks.get_activity_log_upgrades.return_value = [_make_activity_record(duration_seconds=d) for d in durations]
+
+        with (
+            patch("platform_mcp_server.tools.upgrade_metrics.K8sEventsClient", return_value=mock_events),
+            patch("platform_mcp_server.tools.upgrade_metrics.AzureAksClient", return_value=mock_aks),
+        ):
+            result = await get_upgrade_metrics_handler("prod-eastus", "userpool", history_count=20)
+
+        assert result.stats is not None
+        assert result.stats.p90_duration_seconds == 600 * 19
+        assert result.stats.mean_duration_seconds == sum(durations) / 20
+
     async def test_anomaly_flag_when_exceeds_threshold(self) -> None:
         mock_events = AsyncMock()
         mock_events.get_node_events.return_value = [
@@ -266,6 +337,35 @@ class TestGetUpgradeMetrics:
         # breaking the test.
         assert "1 of 5" in result.summary
 
+    async def test_events_and_activity_log_fetched_concurrently(self) -> None:
+        # Each mock waits for the other call to start, so the handler only completes
+        # when both requests are in flight together.
+        events_started = asyncio.Event()
+        activity_started = asyncio.Event()
+
+        async def _get_node_events(**_: list[str]) -> list[dict]:
+            events_started.set()
+            await activity_started.wait()
+            return []
+
+        async def _get_activity_log_upgrades(count: int = 5) -> list[dict]:
+            activity_started.set()
+            await events_started.wait()
+            return [_make_activity_record(duration_seconds=2400)]
+
+        mock_events = AsyncMock()
+        mock_events.get_node_events.side_effect = _get_node_events
+        mock_aks = AsyncMock()
+        mock_aks.get_activity_log_upgrades.side_effect = _get_activity_log_upgrades
+
+        with (
+            patch("platform_mcp_server.tools.upgrade_metrics.K8sEventsClient", return_value=mock_events),
+            patch("platform_mcp_server.tools.upgrade_metrics.AzureAksClient", return_value=mock_aks),
+        ):
+            result = await asyncio.wait_for(get_upgrade_metrics_handler("prod-eastus", "userpool"), timeout=1)
+
+        assert len(result.historical) == 1
+
     async def test_cluster_all_fan_out(self) -> None:
         mock_events = AsyncMock()
         mock_events.get_node_events.return_value = []
@@ -293,3 +393,22 @@ class TestGetUpgradeMetrics:
         # silent behaviour change. This acts as a guard against accidental
         # additions or removals from the cluster registry.
         assert len(results) == 6
+
+    async def test_fan_out_resolves_thresholds_once(self) -> None:
+        # Thresholds are read once per batch and shared by every cluster's handler.
+        mock_events = AsyncMock()
+        mock_events.get_node_events.return_value = []
+        mock_aks = AsyncMock()
+        mock_aks.get_activity_log_upgrades.return_value = []
+
+        with (
+            patch("platform_mcp_server.tools.upgrade_metrics.K8sEventsClient", return_value=mock_events),
+            patch("platform_mcp_server.tools.upgrade_metrics.AzureAksClient", return_value=mock_aks),
+            patch("platform_mcp_server.tools.upgrade_metrics.get_thresholds", wraps=get_thresholds) as mock_thresholds,
+        ):
+            from platform_mcp_server.tools.upgrade_metrics import get_upgrade_metrics_all
+
+            results = await get_upgrade_metrics_all("userpool")
+
+        assert len(results) == 6
+        mock_thresholds.assert_called_once()
@@ -7,6 +7,10 @@
 # import that improves forward-compatibility.
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime
+
 # Note 2: `AsyncMock` handles coroutine patching correctly. When the handler
 # under test awaits a client method (e.g., `await mock_aks.get_cluster_info()`),
 # `AsyncMock` automatically returns an awaitable that resolves to `.return_value`.
@@ -16,6 +20,8 @@ from __future__ import annotations
 # mechanism for replacing module-level symbols during a test.
 from unittest.mock import AsyncMock, patch
 
+import pytest
+
 # Note 3: Only the single handler function is imported, keeping the import
 # surface minimal and making it immediately apparent which callable every test
 # in this file is exercising. This also makes refactoring easier: if the
@@ -117,6 +123,15 @@ def _make_event(node_name: str, reason: str, timestamp: str = "2026-02-28T12:00:
     }
 
 
+def _pods_on_node(pods: list[dict]) -> Callable[..., Awaitable[list[dict]]]:
+    """Return a get_pods_on_node side effect that lists only the named node's pods."""
+
+    async def _get_pods_on_node(node_name: str) -> list[dict]:
+        return [p for p in pods if p["node_name"] == node_name]
+
+    return _get_pods_on_node
+
+
 # Note 12: All tests live in a single class, grouping them under the handler
 # they test. pytest discovers `async def test_*` methods in classes without
 # `@pytest.mark.asyncio` when `asyncio_mode = "auto"` is configured in
@@ -368,38 +383,40 @@ class TestGetUpgradeProgress:
         # Using pods in different phases from different nodes tests the filtering
         # AND the categorisation in a single test, keeping the test count low
         # while covering multiple cases.
-        mock_core.get_pods.return_value = [
-            {
-                "name": "web-abc",
-                "namespace": "default",
-                "phase": "Pending",
-                "node_name": "node-1",
-                "reason": "Unschedulable",
-                "message": None,
-                "container_statuses": [],
-                "conditions": [],
-            },
-            {
-                "name": "api-xyz",
-                "namespace": "payments",
-                "phase": "Failed",
-                "node_name": "node-1",
-                "reason": "Error",
-                "message": None,
-                "container_statuses": [],
-                "conditions": [],
-            },
-            {
-                "name": "healthy-pod",
-                "namespace": "default",
-                "phase": "Running",
-                "node_name": "node-2",
-                "reason": None,
-                "message": None,
-                "container_statuses": [],
-                "conditions": [],
-            },
-        ]
+        mock_core.get_pods_on_node.side_effect = _pods_on_node(
+            [
+                {
+                    "name": "web-abc",
+                    "namespace": "default",
+                    "phase": "Pending",
+                    "node_name": "node-1",
+                    "reason": "Unschedulable",
+                    "message": None,
+                    "container_statuses": [],
+                    "conditions": [],
+                },
+                {
+                    "name": "api-xyz",
+                    "namespace": "payments",
+                    "phase": "Failed",
+                    "node_name": "node-1",
+                    "reason": "Error",
+                    "message": None,
+                    "container_statuses": [],
+                    "conditions": [],
+                },
+                {
+                    "name": "healthy-pod",
+                    "namespace": "default",
+                    "phase": "Running",
+                    "node_name": "node-2",
+                    "reason": None,
+                    "message": None,
+                    "container_statuses": [],
+                    "conditions": [],
+                },
+            ]
+        )
         mock_events = AsyncMock()
         mock_events.get_node_events.return_value = []
         mock_policy = AsyncMock()
@@ -449,7 +466,7 @@ class TestGetUpgradeProgress:
         # handler should return a `pod_transitions` object (not None, because
         # an upgrade IS in progress) but with all counters at zero.
         mock_core.get_nodes.return_value = [_make_node("node-1", version="v1.29.8", unschedulable=True)]
-        mock_core.get_pods.return_value = [
+        mock_core.get_pods_on_node.return_value = [
             {
                 "name": "healthy-pod",
                 "namespace": "default",
@@ -540,28 +557,30 @@ class TestGetUpgradeProgress:
             _make_node("node-1", version="v1.29.8", unschedulable=True),  # cordoned
             _make_node("node-2", version="v1.29.8", unschedulable=False),  # pending
         ]
-        mock_core.get_pods.return_value = [
-            {
-                "name": "pod-on-cordoned",
-                "namespace": "default",
-                "phase": "Pending",
-                "node_name": "node-1",
-                "reason": "Unschedulable",
-                "message": None,
-                "container_statuses": [],
-                "conditions": [],
-            },
-            {
-                "name": "pod-on-pending-node",
-                "namespace": "default",
-                "phase": "Pending",
-                "node_name": "node-2",
-                "reason": "Unschedulable",
-                "message": None,
-                "container_statuses": [],
-                "conditions": [],
-            },
-        ]
+        mock_core.get_pods_on_node.side_effect = _pods_on_node(
+            [
+                {
+                    "name": "pod-on-cordoned",
+                    "namespace": "default",
+                    "phase": "Pending",
+                    "node_name": "node-1",
+                    "reason": "Unschedulable",
+                    "message": None,
+                    "container_statuses": [],
+                    "conditions": [],
+                },
+                {
+                    "name": "pod-on-pending-node",
+                    "namespace": "default",
+                    "phase": "Pending",
+                    "node_name": "node-2",
+                    "reason": "Unschedulable",
+                    "message": None,
+                    "container_statuses": [],
+                    "conditions": [],
+                },
+            ]
+        )
         mock_events = AsyncMock()
         mock_events.get_node_events.return_value = []
         mock_policy = AsyncMock()
@@ -585,6 +604,8 @@ class TestGetUpgradeProgress:
         # making the failure message immediately actionable.
         assert result.pod_transitions.total_affected == 1
         assert result.pod_transitions.affected_pods[0].name == "pod-on-cordoned"
+        # Pods are listed per active node on the server side; node-2 is never queried.
+        mock_core.get_pods_on_node.assert_awaited_once_with("node-1")
 
     async def test_pod_transitions_cap_at_20(self) -> None:
         """Affected pods list should be capped at 20."""
@@ -604,7 +625,7 @@ class TestGetUpgradeProgress:
         # parameterised test data at scale. The count of 25 is deliberately above
         # the cap of 20 to ensure the cap is actually triggered; using exactly 20
         # pods would not verify that the handler trims excess entries.
-        mock_core.get_pods.return_value = [
+        mock_core.get_pods_on_node.return_value = [
             {
                 "name": f"pod-{i}",
                 "namespace": "default",
@@ -644,6 +665,243 @@ class TestGetUpgradeProgress:
         assert result.pod_transitions.total_affected == 25
         assert result.pod_transitions.pending_count == 25
 
+    async def test_capped_pod_list_keeps_failed_pods_first(self) -> None:
+        # Failed pods arriving after the cap must still be reported ahead of Pending ones.
+        def _pod(name: str, phase: str) -> dict:
+            return {
+                "name": name,
+                "namespace": "default",
+                "phase": phase,
+                "node_name": "node-1",
+                "container_statuses": [],
+            }
+
+        mock_aks = AsyncMock()
+        mock_aks.get_cluster_info.return_value = {"node_pools": [_make_pool_info()]}
+        mock_core = AsyncMock()
+        mock_core.get_nodes.return_value = [_make_node("node-1", version="v1.29.8", unschedulable=True)]
+        mock_core.get_pods_on_node.return_value = [
+            *(_pod(f"pending-{i}", "Pending") for i in range(25)),
+            _pod("failed-0", "Failed"),
+            _pod("unknown-0", "Unknown"),
+            _pod("failed-1", "Failed"),
+        ]
+        mock_events = AsyncMock()
+        mock_events.get_node_events.return_value = []
+        mock_policy = AsyncMock()
+        mock_policy.get_pdbs.return_value = []
+        mock_policy.evaluate_pdb_satisfiability.return_value = []
+
+        with (
+            patch("platform_mcp_server.tools.upgrade_progress.AzureAksClient", return_value=mock_aks),
+            patch("platform_mcp_server.tools.upgrade_progress.K8sCoreClient", return_value=mock_core),
+            patch("platform_mcp_server.tools.upgrade_progress.K8sEventsClient", return_value=mock_events),
+            patch("platform_mcp_server.tools.upgrade_progress.K8sPolicyClient", return_value=mock_policy),
+        ):
+            result = await get_upgrade_progress_handler("prod-eastus")
+
+        assert result.pod_transitions is not None
+        names = [p.name for p in result.pod_transitions.affected_pods]
+        assert names == ["failed-0", "failed-1", "unknown-0", *(f"pending-{i}" for i in range(17))]
+        assert result.pod_transitions.total_affected == 28
+
+    async def test_pod_list_failure_on_one_node_keeps_other_nodes(self) -> None:
+        pods = [
+            {"name": "pod-a", "namespace": "default", "phase": "Failed", "node_name": "node-1"},
+            {"name": "pod-b", "namespace": "default", "phase": "Failed", "node_name": "node-2"},
+        ]
+
+        async def _get_pods_on_node(node_name: str) -> list[dict]:
+            if node_name == "node-2":
+                raise RuntimeError("node-2 pod list timed out")
+            return await _pods_on_node(pods)(node_name)
+
+        mock_aks = AsyncMock()
+        mock_aks.get_cluster_info.return_value = {"node_pools": [_make_pool_info()]}
+        mock_core = AsyncMock()
+        mock_core.get_nodes.return_value = [
+            _make_node("node-1", version="v1.29.8", unschedulable=True),
+            _make_node("node-2", version="v1.29.8", unschedulable=True),
+        ]
+        mock_core.get_pods_on_node.side_effect = _get_pods_on_node
+        mock_events = AsyncMock()
+        mock_events.get_node_events.return_value = []
+        mock_policy = AsyncMock()
+        mock_policy.get_pdbs.return_value = []
+        mock_policy.evaluate_pdb_satisfiability.return_value = []
+
+        with (
+            patch("platform_mcp_server.tools.upgrade_progress.AzureAksClient", return_value=mock_aks),
+            patch("platform_mcp_server.tools.upgrade_progress.K8sCoreClient", return_value=mock_core),
+            patch("platform_mcp_server.tools.upgrade_progress.K8sEventsClient", return_value=mock_events),
+            patch("platform_mcp_server.tools.upgrade_progress.K8sPolicyClient", return_value=mock_policy),
+        ):
+            result = await get_upgrade_progress_handler("prod-eastus")
+
+        assert result.pod_transitions is not None
+        assert [p.name for p in result.pod_transitions.affected_pods] == ["pod-a"]
+        assert [(e.source, e.partial_data) for e in result.errors] == [("k8s-api", True)]
+
+    async def test_node_pod_lists_ignore_the_fleet_fanout_limit(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        # Each node's list waits until the other has started, which a limit of 1 would deadlock.
+        monkeypatch.setenv("PLATFORM_MCP_FANOUT_CONCURRENCY", "1")
+        started = {"node-1": asyncio.Event(), "node-2": asyncio.Event()}
+
+        async def _get_pods_on_node(node_name: str) -> list[dict]:
+            started[node_name].set()
+            await asyncio.gather(*(e.wait() for e in started.values()))
+            return []
+
+        mock_aks = AsyncMock()
+        mock_aks.get_cluster_info.return_value = {"node_pools": [_make_pool_info()]}
+        mock_core = AsyncMock()
+        mock_core.get_nodes.return_value = [
+            _make_node("node-1", version="v1.29.8", unschedulable=True),
+            _make_node("node-2", version="v1.29.8", unschedulable=True),
+        ]
+        mock_core.get_pods_on_node.side_effect = _get_pods_on_node
+        mock_events = AsyncMock()
+        mock_events.get_node_events.return_value = []
+        mock_policy = AsyncMock()
+        mock_policy.get_pdbs.return_value = []
+        mock_policy.evaluate_pdb_satisfiability.return_value = []
+
+        with (
+            patch("platform_mcp_server.tools.upgrade_progress.AzureAksClient", return_value=mock_aks),
+            patch("platform_mcp_server.tools.upgrade_progress.K8sCoreClient", return_value=mock_core),
+            patch("platform_mcp_server.tools.upgrade_progress.K8sEventsClient", return_value=mock_events),
+            patch("platform_mcp_server.tools.upgrade_progress.K8sPolicyClient", return_value=mock_policy),
+        ):
+            async with asyncio.timeout(1):
+                result = await get_upgrade_progress_handler("prod-eastus")
+
+        assert result.pod_transitions is not None
+        assert result.errors == []
+
+    async def test_nodes_events_and_pdbs_fetched_concurrently(self) -> None:
+        # Each fetch waits until the others have started; sequential awaits would time out.
+        started = {"nodes": asyncio.Event(), "events": asyncio.Event(), "pdbs": asyncio.Event()}
+
+        async def _wait_for_all(name: str) -> None:
+            started[name].set()
+            await asyncio.gather(*(e.wait() for e in started.values()))
+
+        async def _get_nodes() -> list[dict]:
+            await _wait_for_all("nodes")
+            return [_make_node("node-1")]
+
+        async def _get_node_events(**_: object) -> list[dict]:
+            await _wait_for_all("events")
+            return []
+
+        async def _get_pdbs() -> list[dict]:
+            await _wait_for_all("pdbs")
+            return []
+
+        mock_aks = AsyncMock()
+        mock_aks.get_cluster_info.return_value = {"node_pools": [_make_pool_info()]}
+        mock_core = AsyncMock()
+        mock_core.get_nodes.side_effect = _get_nodes
+        mock_core.get_pods_on_node.return_value = []
+        mock_events = AsyncMock()
+        mock_events.get_node_events.side_effect = _get_node_events
+        mock_policy = AsyncMock()
+        mock_policy.get_pdbs.side_effect = _get_pdbs
+        mock_policy.evaluate_pdb_satisfiability.return_value = []
+
+        with (
+            patch("platform_mcp_server.tools.upgrade_progress.AzureAksClient", return_value=mock_aks),
+            patch("platform_mcp_server.tools.upgrade_progress.K8sCoreClient", return_value=mock_core),
+            patch("platform_mcp_server.tools.upgrade_progress.K8sEventsClient", return_value=mock_events),
+            patch("platform_mcp_server.tools.upgrade_progress.K8sPolicyClient", return_value=mock_policy),
+        ):
+            result = await asyncio.wait_for(get_upgrade_progress_handler("prod-eastus"), timeout=1)
+
+        assert len(result.nodes) == 1
+        assert result.errors == []
+
+    async def test_idle_cluster_skips_node_event_and_pdb_fetches(self) -> None:
+        mock_aks = AsyncMock()
+        mock_aks.get_cluster_info.return_value = {
+            "node_pools": [
+                _make_pool_info(provisioning_state="Succeeded", current_version="1.29.8", target_version="1.29.8")
+            ],
+        }
+        mock_core = AsyncMock()
+        mock_events = AsyncMock()
+        mock_policy = AsyncMock()
+
+        with (
+            patch("platform_mcp_server.tools.upgrade_progress.AzureAksClient", return_value=mock_aks),
+            patch("platform_mcp_server.tools.upgrade_progress.K8sCoreClient", return_value=mock_core),
+            patch("platform_mcp_server.tools.upgrade_progress.K8sEventsClient", return_value=mock_events),
+            patch("platform_mcp_server.tools.upgrade_progress.K8sPolicyClient", return_value=mock_policy),
+        ):
+            result = await get_upgrade_progress_handler("prod-eastus")
+
+        assert result.upgrade_in_progress is False
+        mock_core.get_nodes.assert_not_called()
+        mock_events.get_node_events.assert_not_called()
+        mock_policy.get_pdbs.assert_not_called()
+
+    async def test_event_and_pdb_failures_reported_as_partial_errors(self) -> None:
+        mock_aks = AsyncMock()
+        mock_aks.get_cluster_info.return_value = {"node_pools": [_make_pool_info()]}
+        mock_core = AsyncMock()
+        mock_core.get_nodes.return_value = [_make_node("node-1", version="v1.29.8", unschedulable=True)]
+        mock_core.get_pods_on_node.return_value = []
+        mock_events = AsyncMock()
+        mock_events.get_node_events.side_effect = RuntimeError("events unavailable")
+        mock_policy = AsyncMock()
+        mock_policy.get_pdbs.side_effect = RuntimeError("policy API down")
+        mock_policy.evaluate_pdb_satisfiability.return_value = []
+
+        with (
+            patch("platform_mcp_server.tools.upgrade_progress.AzureAksClient", return_value=mock_aks),
+            patch("platform_mcp_server.tools.upgrade_progress.K8sCoreClient", return_value=mock_core),
+            patch("platform_mcp_server.tools.upgrade_progress.K8sEventsClient", return_value=mock_events),
+            patch("platform_mcp_server.tools.upgrade_progress.K8sPolicyClient", return_value=mock_policy),
+        ):
+            result = await get_upgrade_progress_handler("prod-eastus")
+
+        assert result.nodes[0].state == "cordoned"
+        assert {e.source for e in result.errors} == {"events-api", "k8s-api"}
+        assert all(e.partial_data for e in result.errors)
+        mock_policy.evaluate_pdb_satisfiability.assert_awaited_once_with([])
+
+    async def test_elapsed_measured_from_earliest_parseable_upgrade_event(self) -> None:
+        mock_aks = AsyncMock()
+        mock_aks.get_cluster_info.return_value = {"node_pools": [_make_pool_info()]}
+        mock_core = AsyncMock()
+        mock_core.get_nodes.return_value = [_make_node("node-1"), _make_node("node-2"), _make_node("node-3")]
+        mock_core.get_pods_on_node.return_value = []
+        mock_events = AsyncMock()
+        mock_events.get_node_events.return_value = [
+            _make_event("node-1", "NodeUpgrade", "2026-02-28T11:30:00+00:00"),
+            _make_event("node-2", "NodeUpgrade", "not-a-date"),
+            _make_event("node-2", "NodeReady", "2026-02-28T10:00:00+00:00"),
+            _make_event("node-3", "NodeUpgrade", "2026-02-28T11:00:00+00:00"),
+        ]
+        mock_policy = AsyncMock()
+        mock_policy.get_pdbs.return_value = []
+        mock_policy.evaluate_pdb_satisfiability.return_value = []
+
+        with (
+            patch("platform_mcp_server.tools.upgrade_progress.AzureAksClient", return_value=mock_aks),
+            patch("platform_mcp_server.tools.upgrade_progress.K8sCoreClient", return_value=mock_core),
+            patch("platform_mcp_server.tools.upgrade_progress.K8sEventsClient", return_value=mock_events),
+            patch("platform_mcp_server.tools.upgrade_progress.K8sPolicyClient", return_value=mock_policy),
+        ):
+            result = await get_upgrade_progress_handler("prod-eastus")
+
+        # The NodeReady event is earlier but only NodeUpgrade events mark the start of the wave.
+        expected = (datetime.now(tz=UTC) - datetime(2026, 2, 28, 11, 0, tzinfo=UTC)).total_seconds()
+        assert result.elapsed_seconds is not None
+        assert abs(result.elapsed_seconds - expected) < 60
+        # Elapsed time and the output timestamp are measured from the same instant.
+        start = datetime(2026, 2, 28, 11, 0, tzinfo=UTC)
+        assert result.elapsed_seconds == (datetime.fromisoformat(result.timestamp) - start).total_seconds()
+
     async def test_cluster_all_fan_out(self) -> None:
         mock_aks = AsyncMock()
         mock_aks.get_cluster_info.return_value = {
@@ -0,0 +1,120 @@
+"""Tests for utils.py: bounded concurrent fan-out."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from platform_mcp_server.utils import gather_bounded
+
+
+class TestGatherBounded:
+    """Tests for gather_bounded ordering, error capture, and the in-flight limit."""
+
+    async def test_results_in_input_order(self) -> None:
+        # Later inputs finish first; results must still line up with the inputs so the
+        # fan-out callers can zip them against ALL_CLUSTER_IDS.
+        async def _delayed(value: int) -> int:
+            await asyncio.sleep(0.01 * (3 - value))
+            return value
+
+        assert await gather_bounded([_delayed(i) for i in range(3)]) == [0, 1, 2]
+
+    async def test_exceptions_returned_in_place(self) -> None:
+        async def _ok() -> str:
+            return "ok"
+
+        async def _fail() -> str:
+            raise RuntimeError("cluster unreachable")
+
+        results = await gather_bounded([_ok(), _fail(), _ok()])
+
+        assert results[0] == "ok"
+        assert isinstance(results[1], RuntimeError)
+        assert results[2] == "ok"
+
+    async def test_limit_caps_in_flight_awaitables(self) -> None:
+        in_flight = 0
+        peak = 0
+
+        async def _track() -> None:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+        await gather_bounded([_track() for _ in range(6)], limit=2)
+
+        assert peak == 2
+
+    async def test_deadline_reports_slow_awaitables_as_timeouts(self) -> None:
+        async def _fast() -> str:
+            return "ok"
+
+        async def _hung() -> str:
+            await asyncio.sleep(10)
+            return "late"
+
+        results = await asyncio.wait_for(gather_bounded([_fast(), _hung()], timeout=0.05), timeout=1)
+
+        assert results[0] == "ok"
+        assert isinstance(results[1], TimeoutError)
+        assert "fan-out deadline" in str(results[1])
+
+    async def test_queued_awaitables_share_the_deadline(self) -> None:
+        # With a limit of 1 the second awaitable is still waiting for the semaphore when
+        # the deadline passes; it must be reported as a timeout rather than started late.
+        started: list[int] = []
+
+        async def _slow(index: int) -> None:
+            started.append(index)
+            await asyncio.sleep(10)
+
+        results = await gather_bounded([_slow(0), _slow(1)], limit=1, timeout=0.05)
+
+        assert started == [0]
+        assert all(isinstance(r, TimeoutError) for r in results)
+
+    async def test_non_positive_timeout_disables_deadline(self) -> None:
+        async def _brief() -> str:
+            await asyncio.sleep(0.01)
+            return "ok"
+
+        assert await gather_bounded([_brief()], timeout=0) == ["ok"]
+
+    async def test_cancelling_the_caller_cancels_every_child(self) -> None:
+        # The fan-out must not leave per-cluster work running after its caller gives up.
+        started = asyncio.Event()
+        cancelled: list[int] = []
+
+        async def _hung(index: int) -> None:
+            started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(index)
+                raise
+
+        fan_out = asyncio.ensure_future(gather_bounded([_hung(i) for i in range(3)], timeout=0))
+        await asyncio.wait_for(started.wait(), timeout=1)
+        fan_out.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await fan_out
+
+        assert sorted(cancelled) == [0, 1, 2]
+
+    async def test_cancelled_error_from_a_child_is_returned_in_place(self) -> None:
+        # Like gather(return_exceptions=True), a child that raises CancelledError on its own
+        # is reported in its slot rather than dropped.
+        async def _ok() -> int:
+            return 1
+
+        async def _self_cancelled() -> int:
+            raise asyncio.CancelledError
+
+        results = await gather_bounded([_ok(), _self_cancelled()], timeout=0)
+
+        assert results[0] == 1
+        assert isinstance(results[1], asyncio.CancelledError)
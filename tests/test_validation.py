@@ -87,6 +87,15 @@ class TestValidateNamespace:
         with pytest.raises(ValueError, match="Invalid namespace"):
             validate_namespace("")
 
+    def test_trailing_newline_rejected(self) -> None:
+        with pytest.raises(ValueError, match="Invalid namespace"):
+            validate_namespace("default\n")
+
+    def test_rejection_is_repeated(self) -> None:
+        for _ in range(2):
+            with pytest.raises(ValueError, match="Invalid namespace"):
+                validate_namespace("Bad_Name")
+
 
 class TestValidateNodePool:
     def test_valid_pool(self) -> None:
@@ -142,6 +151,18 @@ class TestValidateNodePool:
         with pytest.raises(ValueError, match="Invalid node pool"):
             validate_node_pool("")
 
+    def test_trailing_newline_rejected(self) -> None:
+        with pytest.raises(ValueError, match="Invalid node pool"):
+            validate_node_pool("userpool\n")
+
+    def test_invalid_non_ascii(self) -> None:
+        for name in ("pööl", "pool²"):
+            with pytest.raises(ValueError, match="Invalid node pool"):
+                validate_node_pool(name)
+
+    def test_valid_max_length(self) -> None:
+        validate_node_pool("abcdefghijk1")  # 12 chars
+
 
 class TestValidateMode:
     # Note 19: Mode validation tests form an exhaustive check of an enum-like